@@ -0,0 +1,75 @@
+"""
+Compare the time spent turning a page of users into `User` API wrappers with the
+time spent parsing them and building them as plain schemas.
+
+Run with `PYTHONPATH=src python benchmarks/api_wrap.py`.
+"""
+
+import asyncio
+import functools
+import timeit
+
+from pycodecov.api import PaginatedList
+from pycodecov.api.paginated_list import parse_paginated_list_api
+from pycodecov.api.user import parse_user_api
+from pycodecov.parsers import parse_user_data
+from pycodecov.schemas import User
+
+
+def make_users(count: int) -> list[dict[str, object]]:
+    return [
+        {
+            "service": "github",
+            "username": f"user-{i}",
+            "name": f"User {i}",
+            "activated": True,
+            "is_admin": False,
+            "email": f"user-{i}@example.com",
+        }
+        for i in range(count)
+    ]
+
+
+def parse(users: list[dict[str, object]]) -> None:
+    for user in users:
+        parse_user_data(user)
+
+
+def build(schemas: list[User]) -> None:
+    for user in schemas:
+        User(
+            user.service,
+            user.username,
+            user.name,
+            user.activated,
+            user.is_admin,
+            user.email,
+        )
+
+
+def wrap(paginated_list: PaginatedList[User]) -> None:
+    parse_paginated_list_api(paginated_list, parse_user_api, owner_username="owner")
+
+
+async def main() -> None:
+    users = make_users(50_000)
+    paginated_list = PaginatedList(
+        len(users), [parse_user_data(user) for user in users], 1, parse_user_data
+    )
+    benchmarks = {
+        "parse schemas": functools.partial(parse, users),
+        "build schemas": functools.partial(build, paginated_list.results),
+        "wrap in API": functools.partial(wrap, paginated_list),
+    }
+
+    print(f"{len(users)} users")
+
+    for name, benchmark in benchmarks.items():
+        seconds = min(timeit.repeat(benchmark, number=1, repeat=20))
+        print(f"  {name:<14} {seconds * 1000:8.1f} ms")
+
+    await paginated_list.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,116 @@
+"""
+Compare the peak memory of parsing a large decoded comparison at once with the
+peak memory of iterating over its files, with and without their lines, when each
+file is dropped once it's been read. The decoded json is counted in every peak.
+
+Run with `PYTHONPATH=src python benchmarks/comparison_memory.py`.
+"""
+
+import asyncio
+import tracemalloc
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+from unittest.mock import patch
+
+from pycodecov import Codecov
+from pycodecov.enums import Service
+from pycodecov.parsers import parse_commit_comparison_data
+
+TOTAL = {
+    "files": 1,
+    "lines": 100,
+    "hits": 80,
+    "misses": 20,
+    "partials": 0,
+    "coverage": 80.0,
+    "branches": 0,
+    "methods": 0,
+    "messages": 0,
+    "sessions": 1,
+    "complexity": 0.0,
+    "complexity_total": 0.0,
+    "complexity_ratio": 0.0,
+    "diff": 0,
+}
+
+
+def make_comparison(files: int, lines: int) -> dict[str, Any]:
+    return {
+        "base_commit": "a" * 40,
+        "head_commit": "b" * 40,
+        "totals": {"base": TOTAL, "head": TOTAL, "patch": None},
+        "commit_uploads": [],
+        "diff": {"git_commits": []},
+        "files": [
+            {
+                "name": {"base": f"src/file_{i}.py", "head": f"src/file_{i}.py"},
+                "totals": {"base": TOTAL, "head": TOTAL, "patch": None},
+                "has_diff": True,
+                "stats": None,
+                "change_summary": None,
+                "lines": [
+                    {
+                        "value": f"    value_{j} = compute(value_{j - 1})",
+                        "number": {"base": j, "head": j},
+                        "coverage": {"base": 1, "head": j % 2},
+                        "is_diff": False,
+                        "added": False,
+                        "removed": False,
+                        "sessions": 1,
+                    }
+                    for j in range(lines)
+                ],
+            }
+            for i in range(files)
+        ],
+        "untracked": [],
+        "has_unmerged_base_commits": False,
+    }
+
+
+def measure(run: Callable[[], None]) -> float:
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak / 2**20
+
+
+async def consume(files: AsyncIterator[Any]) -> None:
+    async for _file in files:
+        pass
+
+
+def stream(data: dict[str, Any], skip_lines: bool) -> None:
+    async def get(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        return data
+
+    async def main() -> None:
+        with patch("pycodecov.api.scheduler.RequestScheduler.get", get):
+            async with Codecov() as codecov:
+                await consume(
+                    codecov.comparisons.iter_comparison_files(
+                        Service.GITHUB, "owner", "repo", skip_lines=skip_lines
+                    )
+                )
+
+    asyncio.run(main())
+
+
+def main() -> None:
+    benchmarks = {
+        "decode only": lambda: make_comparison(200, 500),
+        "parse all": lambda: parse_commit_comparison_data(make_comparison(200, 500)),
+        "stream files": lambda: stream(make_comparison(200, 500), False),
+        "skip lines": lambda: stream(make_comparison(200, 500), True),
+    }
+
+    print("200 files of 500 lines")
+
+    for name, benchmark in benchmarks.items():
+        print(f"  {name:<12} {measure(benchmark):8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
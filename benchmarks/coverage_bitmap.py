@@ -0,0 +1,61 @@
+"""
+Compare the time spent finding the lines that regressed between two commits over a
+large repository, with Python sets and with `CoverageBitmap`.
+
+Run with `python benchmarks/coverage_bitmap.py`.
+"""
+
+import random
+import time
+from array import array
+
+from pycodecov.schemas import CoverageBitmap, LineCoverageArray
+
+
+def make_line_coverage(lines: int) -> LineCoverageArray:
+    return LineCoverageArray(
+        array("I", range(1, lines + 1)),
+        array("b", random.choices((0, 1, 2), (8, 1, 1), k=lines)),  # nosec B311
+    )
+
+
+def main() -> None:
+    random.seed(0)
+    base = [make_line_coverage(200) for _ in range(20000)]
+    head = [make_line_coverage(200) for _ in range(20000)]
+    print("regressed lines (20000 files x 200 lines)")
+
+    start = time.perf_counter()
+    base_sets = [
+        {line.number for line in line_coverage if line.coverage == 0}
+        for line_coverage in base
+    ]
+    head_sets = [
+        {line.number for line in line_coverage if line.coverage != 0}
+        for line_coverage in head
+    ]
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    regressed = sum(len(b & h) for b, h in zip(base_sets, head_sets, strict=False))
+    compare = time.perf_counter() - start
+    print(f"  set     build {build * 1000:8.1f} ms, compare {compare * 1000:6.1f} ms")
+
+    start = time.perf_counter()
+    base_bitmaps = [CoverageBitmap.from_lines(line_coverage) for line_coverage in base]
+    head_bitmaps = [CoverageBitmap.from_lines(line_coverage) for line_coverage in head]
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    regressed_bitmap = sum(
+        len(b.hits & (h.misses | h.partials))
+        for b, h in zip(base_bitmaps, head_bitmaps, strict=False)
+    )
+    compare = time.perf_counter() - start
+    print(f"  bitmap  build {build * 1000:8.1f} ms, compare {compare * 1000:6.1f} ms")
+
+    assert regressed == regressed_bitmap  # nosec B101
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Compare the memory and time of keeping the daily coverage trends of many
+repositories as `CoverageTrend` objects with keeping them as `CoverageTrendArray`
+columns, then merging them into one weekly trend.
+
+Run with `PYTHONPATH=src python benchmarks/coverage_trend_merge.py`.
+"""
+
+import random
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from pycodecov.schemas import CoverageTrend, CoverageTrendArray
+
+REPOS = 300
+DAYS = 3 * 365
+DAY = 86400
+
+
+def make_trends(seed: int) -> list[CoverageTrend]:
+    rng = random.Random(seed)
+    trends = []
+
+    for day in range(DAYS):
+        avg = rng.uniform(50, 90)
+        trends.append(CoverageTrend(day * DAY, avg - 1, avg + 1, avg))
+
+    return trends
+
+
+def keep_objects() -> list[list[CoverageTrend]]:
+    return [make_trends(seed) for seed in range(REPOS)]
+
+
+def keep_arrays() -> list[CoverageTrendArray]:
+    return [CoverageTrendArray.from_trends(make_trends(seed)) for seed in range(REPOS)]
+
+
+def measure_peak(run: Callable[[], Any]) -> float:
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak / 2**20
+
+
+def measure_time(run: Callable[[], Any]) -> float:
+    return min(timeit.repeat(run, number=1, repeat=5))
+
+
+def main() -> None:
+    print(f"{REPOS} repositories, {DAYS} daily points each")
+
+    for name, run in {"objects": keep_objects, "arrays": keep_arrays}.items():
+        print(f"  keep {name:<8} peak {measure_peak(run):8.1f} MiB")
+
+    arrays = keep_arrays()
+    merged = CoverageTrendArray.merge(arrays, seconds=7 * DAY)
+    seconds = measure_time(lambda: CoverageTrendArray.merge(arrays, seconds=7 * DAY))
+    print(f"  merge weekly  {seconds * 1000:8.1f} ms, {len(merged)} points")
+
+    seconds = measure_time(lambda: merged.rolling(4))
+    print(f"  rolling 4     {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
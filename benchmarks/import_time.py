@@ -0,0 +1,66 @@
+"""
+Measure the time spent importing pycodecov in a fresh interpreter, like a cold
+start of a short lived job.
+
+Run with `PYTHONPATH=src python benchmarks/import_time.py`. With `--max-ms`, exit
+with an error when an import takes longer, to catch import time regressions.
+"""
+
+import argparse
+import subprocess  # nosec B404
+import sys
+
+STATEMENTS = {
+    "import pycodecov": "import pycodecov",
+    "import enums": "from pycodecov.enums import Service",
+    "import schemas": "from pycodecov.schemas import Repo",
+    "import parsers": "from pycodecov.parsers import parse_repo_data",
+    "import client": "from pycodecov import Codecov",
+}
+
+
+def measure(statement: str, repeat: int) -> tuple[float, int]:
+    """
+    Get the best import time in milliseconds of a statement and the number of
+    modules it loaded.
+    """
+    code = (
+        "import sys, time\n"
+        "modules = len(sys.modules)\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print(time.perf_counter() - start, len(sys.modules) - modules)\n"
+    )
+    results = []
+
+    for _ in range(repeat):
+        output = subprocess.run(  # nosec B603
+            [sys.executable, "-c", code], capture_output=True, check=True, text=True
+        ).stdout
+        seconds, modules = output.split()
+        results.append((float(seconds) * 1000, int(modules)))
+
+    return min(results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    failed = False
+
+    for name, statement in STATEMENTS.items():
+        milliseconds, modules = measure(statement, args.repeat)
+        print(f"{name:<16} {milliseconds:8.1f} ms {modules:5} modules")
+
+        if args.max_ms is not None and milliseconds > args.max_ms:
+            print(f"  slower than {args.max_ms} ms")
+            failed = True
+
+    sys.exit(failed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Compare the time spent decoding large Codecov response bodies with every available
+json decoder.
+
+Run with `python benchmarks/json_decode.py`, install `orjson` to include it.
+"""
+
+import functools
+import json
+import random
+import timeit
+from typing import Any, Callable
+
+TOTALS = {
+    "files": 123,
+    "lines": 123,
+    "hits": 123,
+    "misses": 123,
+    "partials": 123,
+    "coverage": 12.3,
+    "branches": 123,
+    "methods": 123,
+    "messages": 123,
+    "sessions": 123,
+    "complexity": 12.3,
+    "complexity_total": 12.3,
+    "complexity_ratio": 12.3,
+    "diff": 123,
+}
+
+
+def make_report(files: int, lines: int) -> dict[str, Any]:
+    return {
+        "totals": TOTALS,
+        "files": [
+            {
+                "name": f"src/package/module_{i}.py",
+                "totals": TOTALS,
+                "line_coverage": [
+                    [line, random.choice((0, 1, 2))]  # nosec B311
+                    for line in range(1, lines + 1)
+                ],
+            }
+            for i in range(files)
+        ],
+        "commit_file_url": "https://codecov.io/gh/owner/repo/commit/sha/tree",
+    }
+
+
+def make_comparison(files: int, lines: int) -> dict[str, Any]:
+    return {
+        "base_commit": "a" * 40,
+        "head_commit": "b" * 40,
+        "totals": {"base": TOTALS, "head": TOTALS, "patch": TOTALS},
+        "commit_uploads": [],
+        "diff": {"git_commits": []},
+        "files": [
+            {
+                "name": {"base": f"src/module_{i}.py", "head": f"src/module_{i}.py"},
+                "totals": {"base": TOTALS, "head": TOTALS, "patch": None},
+                "has_diff": True,
+                "stats": {"added": 10, "removed": 5},
+                "change_summary": {"hits": 1, "misses": -1, "partials": 0},
+                "lines": [
+                    {
+                        "value": "    return value",
+                        "number": {"base": line, "head": line},
+                        "coverage": {"base": 1, "head": 0},
+                        "is_diff": True,
+                        "added": False,
+                        "removed": False,
+                        "sessions": 1,
+                    }
+                    for line in range(1, lines + 1)
+                ],
+            }
+            for i in range(files)
+        ],
+        "untracked": [],
+        "has_unmerged_base_commits": False,
+    }
+
+
+def get_decoders() -> dict[str, Callable[[str], Any]]:
+    decoders: dict[str, Callable[[str], Any]] = {"json": json.loads}
+
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        decoders["orjson"] = orjson.loads
+
+    return decoders
+
+
+def main() -> None:
+    random.seed(0)
+    payloads = {
+        "report (200 files x 2000 lines)": json.dumps(make_report(200, 2000)),
+        "comparison (50 files x 500 lines)": json.dumps(make_comparison(50, 500)),
+    }
+    decoders = get_decoders()
+
+    for name, body in payloads.items():
+        print(f"{name}: {len(body) / 1024 / 1024:.1f} MiB")
+
+        for decoder_name, loads in decoders.items():
+            seconds = min(
+                timeit.repeat(functools.partial(loads, body), number=1, repeat=5)
+            )
+            print(f"  {decoder_name:<8} {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
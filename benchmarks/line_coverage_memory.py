@@ -0,0 +1,43 @@
+"""
+Compare the memory held by the line coverage of a large report, parsed into a list
+of `Line` and into a `LineCoverageArray`.
+
+Run with `python benchmarks/line_coverage_memory.py`.
+"""
+
+import tracemalloc
+from typing import Any, Callable
+
+from pycodecov.parsers import parse_line_coverage_array_data, parse_line_data
+
+
+def make_line_coverage(lines: int) -> list[dict[str, Any]]:
+    return [{"number": n, "coverage": n % 3} for n in range(1, lines + 1)]
+
+
+def measure(
+    parse: Callable[[list[dict[str, Any]]], Any], files: list[list[dict[str, Any]]]
+) -> int:
+    tracemalloc.start()
+    parsed = [parse(file) for file in files]  # noqa: F841
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return size
+
+
+def main() -> None:
+    files = [make_line_coverage(2000) for _ in range(500)]
+    parsers: dict[str, Callable[[list[dict[str, Any]]], Any]] = {
+        "list[Line]": lambda data: [parse_line_data(line) for line in data],
+        "LineCoverageArray": parse_line_coverage_array_data,
+    }
+
+    print("line coverage (500 files x 2000 lines)")
+    for name, parse in parsers.items():
+        size = measure(parse, files)
+        print(f"  {name:<20} {size / 1024 / 1024:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Compare the time spent parsing the report of a large file when every line is
+built with the time spent parsing only a diff hunk of it with `line_range`.
+
+Run with `PYTHONPATH=src python benchmarks/report_file_slice.py`.
+"""
+
+import functools
+import timeit
+
+from pycodecov.parsers import parse_report_file_data
+
+LINES = 20_000
+
+DATA = {
+    "name": "generated.py",
+    "totals": {
+        "files": 1,
+        "lines": LINES,
+        "hits": 0,
+        "misses": 0,
+        "partials": 0,
+        "coverage": 0.0,
+        "branches": 0,
+        "methods": 0,
+        "messages": 0,
+        "sessions": 1,
+        "complexity": 0.0,
+        "complexity_total": 0.0,
+        "complexity_ratio": 0,
+        "diff": 0,
+    },
+    "line_coverage": [{"number": n, "coverage": n % 3} for n in range(1, LINES + 1)],
+}
+
+
+def main() -> None:
+    hunk = range(12_000, 12_050)
+    benchmarks = {
+        "every line": functools.partial(parse_report_file_data, DATA),
+        "every line, compact": functools.partial(
+            parse_report_file_data, DATA, compact=True
+        ),
+        "50 line hunk": functools.partial(
+            parse_report_file_data, DATA, line_range=hunk
+        ),
+    }
+
+    print(f"{LINES} lines")
+
+    for name, benchmark in benchmarks.items():
+        seconds = min(timeit.repeat(benchmark, number=1, repeat=50))
+        print(f"  {name:<20} {seconds * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
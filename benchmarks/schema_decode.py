@@ -0,0 +1,94 @@
+"""
+Compare the time spent turning a large commit detail response body into a
+`CommitDetail`, with the `parse_*_data` functions and with `SchemaDecoder`.
+
+Run with `python benchmarks/schema_decode.py`, install `orjson` and `msgspec` to
+include them.
+"""
+
+import functools
+import json
+import timeit
+from typing import Any, Callable
+
+from pycodecov.parsers import SchemaDecoder, parse_commit_detail_data
+from pycodecov.schemas import CommitDetail
+
+TOTALS = {
+    "files": 1,
+    "lines": 120,
+    "hits": 100,
+    "misses": 15,
+    "partials": 5,
+    "coverage": 83.33,
+    "branches": 10,
+    "methods": 0,
+    "messages": 0,
+    "sessions": 1,
+    "complexity": 0.0,
+    "complexity_total": 0.0,
+    "complexity_ratio": 0,
+    "diff": 0,
+}
+
+
+def make_commit_detail(files: int) -> dict[str, Any]:
+    return {
+        "commitid": "a" * 40,
+        "message": "Update dependencies",
+        "timestamp": "2024-03-25T16:38:25.747678Z",
+        "ci_passed": True,
+        "author": {"service": "github", "username": "octocat", "name": "Octocat"},
+        "branch": "main",
+        "totals": {k: v for k, v in TOTALS.items() if k not in ("messages", "diff")},
+        "state": "complete",
+        "parent": "b" * 40,
+        "report": {
+            "totals": TOTALS,
+            "files": [
+                {"name": f"packages/package_{i // 100}/module_{i}.py", "totals": TOTALS}
+                for i in range(files)
+            ],
+        },
+    }
+
+
+def get_parsers() -> dict[str, Callable[[bytes], Any]]:
+    parsers: dict[str, Callable[[bytes], Any]] = {
+        "json + parse_commit_detail_data": lambda body: parse_commit_detail_data(
+            json.loads(body)
+        ),
+    }
+
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        parsers["orjson + parse_commit_detail_data"] = (
+            lambda body: parse_commit_detail_data(orjson.loads(body))
+        )
+
+    try:
+        schema_decoder = SchemaDecoder()
+    except ImportError:
+        pass
+    else:
+        parsers["SchemaDecoder"] = schema_decoder.get_decoder(CommitDetail)
+
+    return parsers
+
+
+def main() -> None:
+    body = json.dumps(make_commit_detail(5000)).encode()
+    print(f"commit detail (5000 files): {len(body) / 1024 / 1024:.1f} MiB")
+
+    for name, parse in get_parsers().items():
+        seconds = min(
+            timeit.repeat(functools.partial(parse, body), number=1, repeat=10)
+        )
+        print(f"  {name:<35} {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
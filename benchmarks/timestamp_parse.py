@@ -0,0 +1,51 @@
+"""
+Compare the time spent parsing the timestamps of a large coverage trend response
+with `datetime.fromisoformat` on every record and with `parse_timestamp_data`.
+
+Run with `PYTHONPATH=src python benchmarks/timestamp_parse.py`.
+"""
+
+import functools
+import timeit
+from datetime import datetime, timedelta, timezone
+
+from pycodecov.parsers import parse_timestamp_data
+
+
+def make_timestamps(records: int, distinct: int) -> list[str]:
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    # Day buckets repeat across the branches and repositories of a response
+    return [
+        (start + timedelta(days=i % distinct)).isoformat().replace("+00:00", "Z")
+        for i in range(records)
+    ]
+
+
+def parse_fromisoformat(timestamps: list[str]) -> None:
+    for timestamp in timestamps:
+        datetime.fromisoformat(timestamp)
+
+
+def parse_cached(timestamps: list[str], epoch: bool) -> None:
+    for timestamp in timestamps:
+        parse_timestamp_data(timestamp, epoch)
+
+
+def main() -> None:
+    timestamps = make_timestamps(100_000, 365)
+    benchmarks = {
+        "fromisoformat": functools.partial(parse_fromisoformat, timestamps),
+        "cached": functools.partial(parse_cached, timestamps, False),
+        "cached epoch": functools.partial(parse_cached, timestamps, True),
+    }
+
+    print(f"{len(timestamps)} timestamps, {len(set(timestamps))} distinct")
+
+    for name, benchmark in benchmarks.items():
+        seconds = min(timeit.repeat(benchmark, number=1, repeat=5))
+        print(f"  {name:<14} {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
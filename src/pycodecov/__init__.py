@@ -1,3 +1,17 @@
-from .api import Codecov
+from typing import TYPE_CHECKING
 
-__all__ = ["Codecov"]
+from ._lazy import make_lazy_dir, make_lazy_getattr
+
+if TYPE_CHECKING:
+    from .api import Codecov, SyncCodecov
+
+__all__ = ["Codecov", "SyncCodecov"]
+
+_MODULES = {
+    "Codecov": ".api",
+    "SyncCodecov": ".api",
+}
+
+
+__getattr__ = make_lazy_getattr(__name__, _MODULES)
+__dir__ = make_lazy_dir(__name__, __all__)
@@ -0,0 +1,51 @@
+import sys
+from importlib import import_module
+from typing import Any, Callable, Iterable, Mapping
+
+__all__ = ["make_lazy_dir", "make_lazy_getattr"]
+
+
+def make_lazy_getattr(package: str, modules: Mapping[str, str]) -> Callable[[str], Any]:
+    """
+    Make the module `__getattr__` of a package importing its attributes from their
+    module on first access, so importing the package doesn't load every module.
+
+    Args:
+        package: package name, `__name__` of the package.
+        modules: relative module name of every attribute.
+
+    Returns:
+        The `__getattr__` function of the package.
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in modules:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(import_module(modules[name], package), name)
+        # Later accesses don't go through `__getattr__` anymore
+        setattr(sys.modules[package], name, value)
+
+        return value
+
+    return __getattr__
+
+
+def make_lazy_dir(package: str, names: Iterable[str]) -> Callable[[], list[str]]:
+    """
+    Make the module `__dir__` of a package listing its lazy attributes, whether
+    they are already imported or not.
+
+    Args:
+        package: package name, `__name__` of the package.
+        names: public attribute names, `__all__` of the package.
+
+    Returns:
+        The `__dir__` function of the package.
+    """
+    names = frozenset(names)
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[package]), *names})
+
+    return __dir__
@@ -1,12 +1,44 @@
+from .branch import Branch
+from .bulk import BulkResult
+from .cache import ResponseCache
 from .codecov import Codecov
+from .commit import Commit
+from .comparison import Comparison
+from .connector import ConnectorConfig
+from .context import ClientContext
+from .coverage_trend import CoverageTrend
+from .http_cache import HttpCache, HttpCacheEntry
 from .owner import Owner
 from .paginated_list import PaginatedList, PaginatedListApi
+from .pull import Pull
+from .repo import Repo
+from .report import Report
+from .retry import RetryEvent, RetryPolicy
+from .scheduler import RequestScheduler
+from .sync import SyncCodecov
 from .user import User
 
 __all__ = [
+    "Branch",
+    "BulkResult",
+    "ClientContext",
     "Codecov",
+    "Commit",
+    "Comparison",
+    "ConnectorConfig",
+    "CoverageTrend",
+    "HttpCache",
+    "HttpCacheEntry",
     "Owner",
     "PaginatedList",
     "PaginatedListApi",
+    "Pull",
+    "Repo",
+    "Report",
+    "RequestScheduler",
+    "ResponseCache",
+    "RetryEvent",
+    "RetryPolicy",
+    "SyncCodecov",
     "User",
 ]
@@ -1,10 +1,13 @@
 from traceback import TracebackException
 from types import TracebackType
-from typing import Self
+from typing import Any, Callable, Self
 
 from aiohttp import ClientSession
 
 from ..types import CodecovApiToken
+from .connector import ConnectorConfig
+from .context import ClientContext
+from .scheduler import RequestScheduler
 
 __all__ = ["API"]
 
@@ -21,21 +24,66 @@ class API:
         self,
         token: CodecovApiToken | None = None,
         session: ClientSession | None = None,
+        connector: ConnectorConfig | None = None,
+        scheduler: RequestScheduler | None = None,
+        context: ClientContext | None = None,
     ) -> None:
-        headers = {
-            "Accept": "application/json",
-        }
-
-        if token is not None:
-            headers["Authorization"] = f"Bearer {token}"
-
-        self._token = token
-        self._session = (
-            session
-            if session is not None
-            else ClientSession(self.base_url, headers=headers)
+        if context is not None:
+            if (
+                token is not None
+                or session is not None
+                or connector is not None
+                or scheduler is not None
+            ):
+                raise ValueError(
+                    "token, session, connector and scheduler can't be used with a "
+                    "supplied context"
+                )
+
+            self._context = context
+            return
+
+        if session is not None and connector is not None:
+            raise ValueError("connector can't be used with a supplied session")
+
+        if session is None:
+            headers = {
+                "Accept": "application/json",
+            }
+
+            if token is not None:
+                headers["Authorization"] = f"Bearer {token}"
+
+            session = ClientSession(
+                self.base_url,
+                headers=headers,
+                connector=connector.build() if connector is not None else None,
+            )
+
+        self._context = ClientContext(
+            token, session, scheduler if scheduler is not None else RequestScheduler()
         )
 
+    @classmethod
+    def _from_context(cls, context: ClientContext) -> Self:
+        # Skips `__init__`, wrapping results in bulk only has to store the context
+        api = cls.__new__(cls)
+        api._context = context
+
+        return api
+
+    @property
+    def _token(self) -> CodecovApiToken | None:
+        return self._context.token
+
+    @property
+    def _session(self) -> ClientSession:
+        return self._context.session
+
+    @property
+    def _scheduler(self) -> RequestScheduler:
+        return self._context.scheduler
+
     async def __aenter__(self) -> Self:
         return self
 
@@ -47,5 +95,68 @@ class API:
     ) -> None:
         await self.close()
 
+    def _make_key(self, url: str, **kwargs: Any) -> tuple[Any, ...]:
+        params = kwargs.get("params")
+
+        return (
+            self._session,
+            url,
+            tuple(sorted(params.items())) if params else (),
+            kwargs.get("decoder"),
+        )
+
+    async def _get(self, url: str, **kwargs: Any) -> Any:
+        return await self._scheduler.run_once(
+            self._make_key(url, **kwargs),
+            lambda: self._scheduler.get(self._session, url, **kwargs),
+        )
+
+    async def _get_cached[T](
+        self,
+        endpoint: str,
+        parser: Callable[[Any], T],
+        url: str,
+        **kwargs: Any,
+    ) -> T:
+        cache = self._scheduler.cache
+
+        if cache is not None:
+            # Different parsers of the same response give different values
+            key = (
+                cache.make_key("GET", url, kwargs.get("params"), self._token),
+                parser,
+            )
+            try:
+                return cache.get(key)
+            except KeyError:
+                pass
+
+        schema_decoder = self._scheduler.schema_decoder
+        decoder = (
+            schema_decoder.get_parser_decoder(parser)
+            if schema_decoder is not None
+            else None
+        )
+
+        async def get_and_parse() -> T:
+            if decoder is not None:
+                value = await self._get(url, decoder=decoder, **kwargs)
+            else:
+                value = self._bind(parser)(await self._get(url, **kwargs))
+
+            if cache is not None:
+                cache.set(endpoint, key, value)
+
+            return value
+
+        return await self._scheduler.run_once(
+            (*self._make_key(url, **kwargs), parser), get_and_parse
+        )
+
+    def _bind[T](self, parser: Callable[..., T]) -> Callable[[dict[str, Any]], T]:
+        strings = self._scheduler.strings
+
+        return strings.bind(parser) if strings is not None else parser
+
     async def close(self) -> None:
         await self._session.close()
@@ -1,12 +1,16 @@
+from typing import Any, AsyncIterator, Callable, Iterable
+
 from .. import schemas
 from ..enums import Service
-from ..exceptions import CodecovError
 from ..parsers import (
+    Projection,
+    StringTable,
     parse_branch_data,
     parse_branch_detail_data,
     parse_paginated_list_data,
 )
 from .api import API
+from .bulk import BulkResult, _fetch_many, _iter_many
 from .paginated_list import PaginatedList
 
 __all__ = ["Branch"]
@@ -26,6 +30,7 @@ class Branch(API):
         ordering: str | None = None,
         page: int | None = None,
         page_size: int | None = None,
+        fields: Iterable[str] | None = None,
     ) -> PaginatedList[schemas.Branch]:
         """
         Get a paginated list of branches for the specified repository.
@@ -38,6 +43,8 @@ class Branch(API):
             ordering: which field to use when ordering the results.
             page: a page number within the paginated result set.
             page_size: number of results to return per page.
+            fields: fields to parse, like `("name",)`. The other fields are `None`.
+                `None` parses every field.
 
         Returns:
             Paginated list of `Branch`.
@@ -66,30 +73,90 @@ class Branch(API):
 
         params.update({k: v for k, v in optional_params.items() if v is not None})
 
-        async with self._session.get(
+        data = await self._get(
             f"{self.api_url}/{service}/{owner_username}/repos/{repo_name}/branches/",
             params=params,
-        ) as response:
-            data = await response.json()
+        )
 
-            if response.ok:
-                paginated_list = parse_paginated_list_data(data, parse_branch_data)
+        parser = (
+            Projection(schemas.Branch, fields)
+            if fields is not None
+            else self._bind(parse_branch_data)
+        )
+        paginated_list = parse_paginated_list_data(data, parser)
 
-                return PaginatedList(
-                    paginated_list.count,
-                    paginated_list.results,
-                    paginated_list.total_pages,
-                    parse_branch_data,
-                    paginated_list.next,
-                    paginated_list.previous,
-                    self._token,
-                    self._session,
-                )
+        return PaginatedList(
+            paginated_list.count,
+            paginated_list.results,
+            paginated_list.total_pages,
+            parser,
+            paginated_list.next,
+            paginated_list.previous,
+            context=self._context,
+        )
 
-            raise CodecovError(data)
+    async def iter_branch_list(
+        self,
+        service: Service,
+        owner_username: str,
+        repo_name: str,
+        author: bool | None = None,
+        ordering: str | None = None,
+        page_size: int | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> AsyncIterator[schemas.Branch]:
+        """
+        Iterate over every branch for the specified repository, page by page.
+
+        Args:
+            service: git hosting service provider.
+            owner_username: username from service provider.
+            repo_name: repository name.
+            author: .
+            ordering: which field to use when ordering the results.
+            page_size: number of results to return per page.
+            fields: fields to parse, like `("name",)`. The other fields are `None`.
+                `None` parses every field.
+
+        Yields:
+            A `Branch`.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Service
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         async for branch in codecov.branches.iter_branch_list(
+            ...             Service.GITHUB, "jazzband", "django-silk"
+            ...         ):
+            ...             print(branch)
+            >>> asyncio.run(main())
+            Branch(...)
+            ...
+        """
+        branches = await self.get_branch_list(
+            service,
+            owner_username,
+            repo_name,
+            author,
+            ordering,
+            page_size=page_size,
+            fields=fields,
+        )
+
+        async for branch in branches:
+            yield branch
 
     async def get_branch_detail(
-        self, service: Service, owner_username: str, repo_name: str, name: str
+        self,
+        service: Service,
+        owner_username: str,
+        repo_name: str,
+        name: str,
+        lazy: bool = False,
+        fields: Iterable[str] | None = None,
     ) -> schemas.BranchDetail:
         """
         Get a single branch by name. Includes head commit information embedded in the
@@ -100,6 +167,11 @@ class Branch(API):
             owner_username: username from service provider.
             repo_name: repository name.
             name: branch name.
+            lazy: whether to parse the head commit report on first attribute access,
+                for callers that don't read it. Ignored when the scheduler has a
+                `schema_decoder` or when `fields` is given.
+            fields: fields to parse, like `("name", "head_commit.commitid")`. The
+                other fields are `None`. `None` parses every field.
 
         Returns:
             A `BranchDetail`.
@@ -121,12 +193,128 @@ class Branch(API):
             >>> asyncio.run(main())
             BranchDetail(...)
         """
-        async with self._session.get(
-            f"{self.api_url}/{service}/{owner_username}/repos/{repo_name}/branches/{name}/"
-        ) as response:
-            data = await response.json()
+        if fields is not None:
+            parser: Callable[[dict[str, Any]], schemas.BranchDetail] = Projection(
+                schemas.BranchDetail, fields
+            )
+        elif lazy:
+            parser = _parse_lazy_branch_detail_data
+        else:
+            parser = parse_branch_detail_data
+
+        return await self._get_cached(
+            "branch_detail",
+            parser,
+            f"{self.api_url}/{service}/{owner_username}/repos/{repo_name}/branches/{name}/",
+        )
+
+    async def get_branch_details_many(
+        self,
+        service: Service,
+        owner_username: str,
+        repo_name: str,
+        names: Iterable[str],
+        concurrency: int = 4,
+        lazy: bool = False,
+        fields: Iterable[str] | None = None,
+    ) -> list[BulkResult[schemas.BranchDetail]]:
+        """
+        Get many branches by name, with at most `concurrency` requests at the same
+        time. A branch that can't be fetched gets its error in its result instead of
+        failing the others.
+
+        Args:
+            service: git hosting service provider.
+            owner_username: username from service provider.
+            repo_name: repository name.
+            names: branch names.
+            concurrency: maximum number of branches requested at the same time.
+            lazy: whether to parse the head commit reports on first attribute
+                access, see `get_branch_detail`.
+            fields: fields to parse, like `("name", "head_commit.commitid")`. The
+                other fields are `None`. `None` parses every field.
+
+        Returns:
+            A `BulkResult` of `BranchDetail` per branch name, in the order of
+            `names`.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Service
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         results = await codecov.branches.get_branch_details_many(
+            ...             Service.GITHUB, "jazzband", "django-silk", ["master"]
+            ...         )
+            ...         for result in results:
+            ...             print(result.value if result.ok else result.error)
+            >>> asyncio.run(main())
+            BranchDetail(...)
+        """
+        return await _fetch_many(
+            names,
+            lambda name: self.get_branch_detail(
+                service, owner_username, repo_name, name, lazy, fields
+            ),
+            concurrency,
+        )
+
+    async def iter_branch_details_many(
+        self,
+        service: Service,
+        owner_username: str,
+        repo_name: str,
+        names: Iterable[str],
+        concurrency: int = 4,
+        lazy: bool = False,
+        fields: Iterable[str] | None = None,
+    ) -> AsyncIterator[BulkResult[schemas.BranchDetail]]:
+        """
+        Iterate over many branches by name as they are fetched, with at most
+        `concurrency` requests at the same time. A branch that can't be fetched gets
+        its error in its result instead of failing the others.
+
+        Args:
+            service: git hosting service provider.
+            owner_username: username from service provider.
+            repo_name: repository name.
+            names: branch names.
+            concurrency: maximum number of branches requested at the same time.
+            lazy: whether to parse the head commit reports on first attribute
+                access, see `get_branch_detail`.
+            fields: fields to parse, like `("name", "head_commit.commitid")`. The
+                other fields are `None`. `None` parses every field.
+
+        Yields:
+            A `BulkResult` of `BranchDetail`, in completion order.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Service
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         async for result in codecov.branches.iter_branch_details_many(
+            ...             Service.GITHUB, "jazzband", "django-silk", ["master"]
+            ...         ):
+            ...             print(result.key, result.ok)
+            >>> asyncio.run(main())
+            master True
+        """
+        async for result in _iter_many(
+            names,
+            lambda name: self.get_branch_detail(
+                service, owner_username, repo_name, name, lazy, fields
+            ),
+            concurrency,
+        ):
+            yield result
 
-            if response.ok:
-                return parse_branch_detail_data(data)
 
-            raise CodecovError(data)
+def _parse_lazy_branch_detail_data(
+    data: dict[str, Any], strings: StringTable | None = None
+) -> schemas.BranchDetail:
+    return parse_branch_detail_data(data, lazy=True, strings=strings)
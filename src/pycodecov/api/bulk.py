@@ -0,0 +1,79 @@
+import asyncio
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, Iterable
+
+__all__ = ["BulkResult"]
+
+
+@dataclass(slots=True)
+class BulkResult[T]:
+    """
+    Result of one key of a bulk fetch.
+
+    Attributes:
+        key: requested key, like a repository name.
+        value: fetched value, `None` if fetching it failed.
+        error: error raised while fetching the value, `None` if it succeeded.
+    """
+
+    key: str
+    value: T | None
+    error: Exception | None
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the value was fetched.
+        """
+        return self.error is None
+
+
+def _start_many[T](
+    keys: Iterable[str],
+    fetch: Callable[[str], Awaitable[T]],
+    concurrency: int,
+) -> list[asyncio.Future[BulkResult[T]]]:
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(key: str) -> BulkResult[T]:
+        async with semaphore:
+            try:
+                return BulkResult(key, await fetch(key), None)
+            except Exception as error:
+                return BulkResult(key, None, error)
+
+    return [asyncio.ensure_future(run(key)) for key in keys]
+
+
+async def _fetch_many[T](
+    keys: Iterable[str],
+    fetch: Callable[[str], Awaitable[T]],
+    concurrency: int,
+) -> list[BulkResult[T]]:
+    tasks = _start_many(keys, fetch, concurrency)
+
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+
+        raise
+
+
+async def _iter_many[T](
+    keys: Iterable[str],
+    fetch: Callable[[str], Awaitable[T]],
+    concurrency: int,
+) -> AsyncIterator[BulkResult[T]]:
+    tasks = _start_many(keys, fetch, concurrency)
+
+    try:
+        for task in asyncio.as_completed(tasks):
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,154 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Mapping
+
+from ..types import CodecovApiToken
+
+__all__ = ["ResponseCache"]
+
+_MISSING = object()
+
+
+class ResponseCache:
+    """
+    Size bounded LRU cache of parsed responses with per endpoint time to live.
+
+    Cached values are the parsed schema objects returned by the API wrappers, the
+    same object is returned to every caller so it must not be mutated. Responses are
+    keyed by token, so a cache shared between clients with different tokens never
+    returns the response of one token to another.
+
+    The cached endpoints are `"owner_detail"`, `"user_detail"`, `"repo_detail"`,
+    `"repo_config"`, `"branch_detail"`, `"commit_detail"`, `"pull_detail"`,
+    `"comparison"`, `"report"` and `"file_report"`.
+
+    Args:
+        maxsize: maximum number of cached responses.
+        ttl: default seconds a cached response stays fresh.
+        ttls: seconds a cached response stays fresh per endpoint, overriding `ttl`.
+
+    Attributes:
+        hits: number of lookups answered from the cache.
+        misses: number of lookups not found in the cache or expired.
+        evictions: number of responses evicted to respect `maxsize`.
+
+    Examples:
+    >>> cache = ResponseCache(maxsize=1, ttls={"repo_config": 300})
+    >>> key = ResponseCache.make_key("GET", "/api/v2/github/jazzband")
+    >>> cache.get(key)
+    Traceback (most recent call last):
+        ...
+    KeyError: ...
+    >>> cache.set("owner_detail", key, "owner")
+    >>> cache.get(key)
+    'owner'
+    >>> cache.set("repo_config", ResponseCache.make_key("GET", "/config"), "config")
+    >>> cache.hits, cache.misses, cache.evictions
+    (1, 1, 1)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 60.0,
+        ttls: Mapping[str, float] | None = None,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.ttls = dict(ttls) if ttls is not None else {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(
+        method: str,
+        url: str,
+        params: Mapping[str, str] | None = None,
+        token: CodecovApiToken | None = None,
+    ) -> Hashable:
+        """
+        Make a cache key from a request. Requests sent with different tokens get
+        different keys, only a fingerprint of the token is kept.
+
+        Args:
+            method: request method.
+            url: request url.
+            params: request query parameters.
+            token: Codecov API Token the request is sent with.
+
+        Returns:
+            A hashable cache key.
+        """
+        fingerprint = (
+            hashlib.sha256(token.encode()).hexdigest() if token is not None else None
+        )
+
+        return (
+            method,
+            url,
+            tuple(sorted(params.items())) if params else (),
+            fingerprint,
+        )
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Get a fresh cached response.
+
+        Args:
+            key: cache key of the request.
+
+        Returns:
+            The cached parsed response.
+
+        Raises:
+            KeyError: if the response is not cached or expired.
+        """
+        expires_at, value = self._entries.get(key, (0.0, _MISSING))
+
+        if value is _MISSING or expires_at <= time.monotonic():
+            self.misses += 1
+            self._entries.pop(key, None)
+
+            raise KeyError(key)
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+
+        return value
+
+    def set(self, endpoint: str, key: Hashable, value: Any) -> None:
+        """
+        Cache a parsed response.
+
+        Args:
+            endpoint: name of the endpoint used to pick the time to live.
+            key: cache key of the request.
+            value: parsed response.
+        """
+        ttl = self.ttls.get(endpoint, self.ttl)
+        if ttl <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Remove every cached response.
+        """
+        self._entries.clear()
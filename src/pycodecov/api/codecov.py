@@ -1,12 +1,22 @@
+from typing import AsyncIterator
+
 from aiohttp import ClientSession
 
 from ..enums import Service
-from ..exceptions import CodecovError
 from ..parsers import parse_owner_data, parse_paginated_list_data
 from ..types import CodecovApiToken
 from .api import API
+from .branch import Branch
+from .commit import Commit
+from .comparison import Comparison
+from .connector import ConnectorConfig
+from .coverage_trend import CoverageTrend
 from .owner import Owner, parse_owner_api
 from .paginated_list import PaginatedList, PaginatedListApi, parse_paginated_list_api
+from .pull import Pull
+from .repo import Repo
+from .report import Report
+from .scheduler import RequestScheduler
 
 __all__ = ["Codecov"]
 
@@ -14,14 +24,37 @@ __all__ = ["Codecov"]
 class Codecov(API):
     """
     Base Codecov API wrapper.
+
+    Every wrapper returned by this client reuses its session and request scheduler,
+    so the connection pool configured through `connector` and the request rate
+    enforced by `scheduler` are shared by all of them.
+
+    Attributes:
+        repos: repo API wrapper sharing this client session.
+        branches: branch API wrapper sharing this client session.
+        commits: commit API wrapper sharing this client session.
+        pulls: pull API wrapper sharing this client session.
+        comparisons: comparison API wrapper sharing this client session.
+        coverage_trends: coverage trend API wrapper sharing this client session.
+        reports: report API wrapper sharing this client session.
     """
 
     def __init__(
         self,
         token: CodecovApiToken | None = None,
         session: ClientSession | None = None,
+        connector: ConnectorConfig | None = None,
+        scheduler: RequestScheduler | None = None,
     ) -> None:
-        API.__init__(self, token, session)
+        API.__init__(self, token, session, connector, scheduler)
+
+        self.repos = Repo(context=self._context)
+        self.branches = Branch(context=self._context)
+        self.commits = Commit(context=self._context)
+        self.pulls = Pull(context=self._context)
+        self.comparisons = Comparison(context=self._context)
+        self.coverage_trends = CoverageTrend(context=self._context)
+        self.reports = Report(context=self._context)
 
     async def get_service_owners(
         self, service: Service, page: int | None = None, page_size: int | None = None
@@ -58,24 +91,52 @@ class Codecov(API):
 
         params.update({k: v for k, v in optional_params.items() if v is not None})
 
-        async with self._session.get(
-            f"{self.api_url}/{service}", params=params
-        ) as response:
-            data = await response.json()
-
-            if response.ok:
-                paginated_list_data = parse_paginated_list_data(data, parse_owner_data)
-                paginated_list = PaginatedList(
-                    paginated_list_data.count,
-                    paginated_list_data.results,
-                    paginated_list_data.total_pages,
-                    parse_owner_data,
-                    paginated_list_data.next,
-                    paginated_list_data.previous,
-                    self._token,
-                    self._session,
-                )
-
-                return parse_paginated_list_api(paginated_list, parse_owner_api)
-
-            raise CodecovError(data)
+        data = await self._get(f"{self.api_url}/{service}", params=params)
+
+        parser = self._bind(parse_owner_data)
+        paginated_list_data = parse_paginated_list_data(data, parser)
+        paginated_list = PaginatedList(
+            paginated_list_data.count,
+            paginated_list_data.results,
+            paginated_list_data.total_pages,
+            parser,
+            paginated_list_data.next,
+            paginated_list_data.previous,
+            context=self._context,
+        )
+
+        return parse_paginated_list_api(paginated_list, parse_owner_api)
+
+    async def iter_service_owners(
+        self, service: Service, page_size: int | None = None
+    ) -> AsyncIterator[Owner]:
+        """
+        Iterate over every owner to which the currently authenticated user has
+        access, page by page.
+
+        Args:
+            service: git hosting service provider.
+            page_size: number of results to return per page.
+
+        Yields:
+            An `Owner`.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Service
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         async for service_owner in codecov.iter_service_owners(
+            ...             Service.GITHUB
+            ...         ):
+            ...             print(service_owner)
+            >>> asyncio.run(main())
+            Owner(...)
+            ...
+        """
+        service_owners = await self.get_service_owners(service, page_size=page_size)
+
+        async for service_owner in service_owners:
+            yield service_owner
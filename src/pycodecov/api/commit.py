@@ -0,0 +1,352 @@
+from contextlib import aclosing
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Iterable
+
+from .. import schemas
+from ..enums import Service
+from ..parsers import (
+    Projection,
+    StringTable,
+    parse_commit_data,
+    parse_commit_detail_data,
+    parse_paginated_list_data,
+)
+from .api import API
+from .bulk import BulkResult, _fetch_many, _iter_many
+from .paginated_list import PaginatedList
+
+__all__ = ["Commit"]
+
+
+class Commit(API):
+    """
+    Commit API Wrapper from Codecov API.
+    """
+
+    async def get_commit_list(
+        self,
+        service: Service,
+        owner_username: str,
+        repo_name: str,
+        branch: str | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> PaginatedList[schemas.Commit]:
+        """
+        Get a paginated list of commits for the specified repository, newest first.
+
+        Args:
+            service: git hosting service provider.
+            owner_username: username from service provider.
+            repo_name: repository name.
+            branch: branch name to filter commits by.
+            page: a page number within the paginated result set.
+            page_size: number of results to return per page.
+            fields: fields to parse, like `("commitid", "totals.coverage")`. The
+                other fields are `None`. `None` parses every field.
+
+        Returns:
+            Paginated list of `Commit`.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Service
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         commits = await codecov.commits.get_commit_list(
+            ...             Service.GITHUB, "jazzband", "django-silk"
+            ...         )
+            ...         print(commits)
+            >>> asyncio.run(main())
+            PaginatedList(...)
+        """
+        params = {}
+        optional_params = {
+            "branch": branch,
+            "page": str(page) if page is not None else page,
+            "page_size": str(page_size) if page_size is not None else page_size,
+        }
+
+        params.update({k: v for k, v in optional_params.items() if v is not None})
+
+        data = await self._get(
+            f"{self.api_url}/{service}/{owner_username}/repos/{repo_name}/commits/",
+            params=params,
+        )
+
+        parser = (
+            Projection(schemas.Commit, fields)
+            if fields is not None
+            else self._bind(parse_commit_data)
+        )
+        paginated_list = parse_paginated_list_data(data, parser)
+
+        return PaginatedList(
+            paginated_list.count,
+            paginated_list.results,
+            paginated_list.total_pages,
+            parser,
+            paginated_list.next,
+            paginated_list.previous,
+            context=self._context,
+        )
+
+    async def iter_commit_list(
+        self,
+        service: Service,
+        owner_username: str,
+        repo_name: str,
+        branch: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        page_size: int | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> AsyncIterator[schemas.Commit]:
+        """
+        Iterate over the commits of the specified repository, newest first, page by
+        page. The next page is prefetched while the current one is consumed, and
+        no page is requested past the first commit older than `since`.
+
+        Args:
+            service: git hosting service provider.
+            owner_username: username from service provider.
+            repo_name: repository name.
+            branch: branch name to filter commits by.
+            since: timezone aware datetime, older commits are skipped.
+            until: timezone aware datetime, newer commits are skipped.
+            page_size: number of results to return per page.
+            fields: fields to parse, like `("commitid", "totals.coverage")`. The
+                other fields are `None`. `None` parses every field. `"timestamp"`
+                is parsed as well when `since` or `until` is given.
+
+        Yields:
+            A `Commit`.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from datetime import datetime, timezone
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Service
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         async for commit in codecov.commits.iter_commit_list(
+            ...             Service.GITHUB,
+            ...             "jazzband",
+            ...             "django-silk",
+            ...             branch="master",
+            ...             since=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            ...         ):
+            ...             print(commit)
+            >>> asyncio.run(main())
+            Commit(...)
+            ...
+        """
+        if fields is not None and (since is not None or until is not None):
+            fields = (*fields, "timestamp")
+
+        commits = await self.get_commit_list(
+            service,
+            owner_username,
+            repo_name,
+            branch,
+            page_size=page_size,
+            fields=fields,
+        )
+
+        # Closing the iterator cancels the prefetched page once `since` is passed
+        async with aclosing(aiter(commits)) as iterator:
+            async for commit in iterator:
+                if until is not None and commit.timestamp > until:
+                    continue
+
+                if since is not None and commit.timestamp < since:
+                    break
+
+                yield commit
+
+    async def get_commit_detail(
+        self,
+        service: Service,
+        owner_username: str,
+        repo_name: str,
+        commitid: str,
+        lazy: bool = False,
+        fields: Iterable[str] | None = None,
+    ) -> schemas.CommitDetail:
+        """
+        Get a single commit by commit SHA, with its coverage report.
+
+        Args:
+            service: git hosting service provider.
+            owner_username: username from service provider.
+            repo_name: repository name.
+            commitid: commit SHA.
+            lazy: whether to parse the commit report on first attribute access, for
+                callers that don't read it. Ignored when the scheduler has a
+                `schema_decoder` or when `fields` is given.
+            fields: fields to parse, like `("commitid", "report.totals")`. The
+                other fields are `None`. `None` parses every field.
+
+        Returns:
+            A `CommitDetail`.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Service
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         commits = await codecov.commits.get_commit_list(
+            ...             Service.GITHUB, "jazzband", "django-silk"
+            ...         )
+            ...         commit = await codecov.commits.get_commit_detail(
+            ...             Service.GITHUB, "jazzband", "django-silk", commits[0].commitid
+            ...         )
+            ...         print(commit)
+            >>> asyncio.run(main())
+            CommitDetail(...)
+        """
+        if fields is not None:
+            parser: Callable[[dict[str, Any]], schemas.CommitDetail] = Projection(
+                schemas.CommitDetail, fields
+            )
+        elif lazy:
+            parser = _parse_lazy_commit_detail_data
+        else:
+            parser = parse_commit_detail_data
+
+        return await self._get_cached(
+            "commit_detail",
+            parser,
+            f"{self.api_url}/{service}/{owner_username}/repos/{repo_name}/commits/{commitid}/",
+        )
+
+    async def get_commit_details_many(
+        self,
+        service: Service,
+        owner_username: str,
+        repo_name: str,
+        commitids: Iterable[str],
+        concurrency: int = 4,
+        lazy: bool = False,
+        fields: Iterable[str] | None = None,
+    ) -> list[BulkResult[schemas.CommitDetail]]:
+        """
+        Get many commits by commit SHA, with at most `concurrency` requests at the
+        same time. A commit that can't be fetched gets its error in its result
+        instead of failing the others.
+
+        Args:
+            service: git hosting service provider.
+            owner_username: username from service provider.
+            repo_name: repository name.
+            commitids: commit SHAs.
+            concurrency: maximum number of commits requested at the same time.
+            lazy: whether to parse the commit reports on first attribute access,
+                see `get_commit_detail`.
+            fields: fields to parse, like `("commitid", "report.totals")`. The
+                other fields are `None`. `None` parses every field.
+
+        Returns:
+            A `BulkResult` of `CommitDetail` per commit SHA, in the order of
+            `commitids`.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Service
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         commits = await codecov.commits.get_commit_list(
+            ...             Service.GITHUB, "jazzband", "django-silk", page_size=10
+            ...         )
+            ...         results = await codecov.commits.get_commit_details_many(
+            ...             Service.GITHUB,
+            ...             "jazzband",
+            ...             "django-silk",
+            ...             [commit.commitid for commit in commits],
+            ...         )
+            ...         for result in results:
+            ...             print(result.value if result.ok else result.error)
+            >>> asyncio.run(main())
+            CommitDetail(...)
+            ...
+        """
+        return await _fetch_many(
+            commitids,
+            lambda commitid: self.get_commit_detail(
+                service, owner_username, repo_name, commitid, lazy, fields
+            ),
+            concurrency,
+        )
+
+    async def iter_commit_details_many(
+        self,
+        service: Service,
+        owner_username: str,
+        repo_name: str,
+        commitids: Iterable[str],
+        concurrency: int = 4,
+        lazy: bool = False,
+        fields: Iterable[str] | None = None,
+    ) -> AsyncIterator[BulkResult[schemas.CommitDetail]]:
+        """
+        Iterate over many commits by commit SHA as they are fetched, with at most
+        `concurrency` requests at the same time. A commit that can't be fetched gets
+        its error in its result instead of failing the others.
+
+        Args:
+            service: git hosting service provider.
+            owner_username: username from service provider.
+            repo_name: repository name.
+            commitids: commit SHAs.
+            concurrency: maximum number of commits requested at the same time.
+            lazy: whether to parse the commit reports on first attribute access,
+                see `get_commit_detail`.
+            fields: fields to parse, like `("commitid", "report.totals")`. The
+                other fields are `None`. `None` parses every field.
+
+        Yields:
+            A `BulkResult` of `CommitDetail`, in completion order.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Service
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         commits = await codecov.commits.get_commit_list(
+            ...             Service.GITHUB, "jazzband", "django-silk", page_size=2
+            ...         )
+            ...         async for result in codecov.commits.iter_commit_details_many(
+            ...             Service.GITHUB,
+            ...             "jazzband",
+            ...             "django-silk",
+            ...             [commit.commitid for commit in commits],
+            ...         ):
+            ...             print(result.ok)
+            >>> asyncio.run(main())
+            True
+            True
+        """
+        async for result in _iter_many(
+            commitids,
+            lambda commitid: self.get_commit_detail(
+                service, owner_username, repo_name, commitid, lazy, fields
+            ),
+            concurrency,
+        ):
+            yield result
+
+
+def _parse_lazy_commit_detail_data(
+    data: dict[str, Any], strings: StringTable | None = None
+) -> schemas.CommitDetail:
+    return parse_commit_detail_data(data, lazy=True, strings=strings)
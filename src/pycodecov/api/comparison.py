@@ -0,0 +1,189 @@
+from typing import Any, AsyncIterator, Callable
+
+from .. import schemas
+from ..enums import Service
+from ..parsers import (
+    Projection,
+    parse_commit_comparison_data,
+    parse_file_comparison_data,
+)
+from .api import API
+
+__all__ = ["Comparison"]
+
+_FILE_FIELDS = ("name", "totals", "has_diff", "stats", "change_summary")
+
+# Parsers leaving `lines` to `None`, their line values are never built
+_parse_file_comparison_data_without_lines = Projection(
+    schemas.FileComparison, _FILE_FIELDS
+)
+_parse_commit_comparison_data_without_lines = Projection(
+    schemas.CommitComparison,
+    (
+        "base_commit",
+        "head_commit",
+        "totals",
+        "commit_uploads",
+        "diff",
+        *(f"files.{field}" for field in _FILE_FIELDS),
+        "untracked",
+        "has_unmerged_base_commits",
+    ),
+)
+
+
+class Comparison(API):
+    """
+    Comparison API Wrapper from Codecov API.
+    """
+
+    async def get_comparison(
+        self,
+        service: Service,
+        owner_username: str,
+        repo_name: str,
+        base: str | None = None,
+        head: str | None = None,
+        pullid: int | None = None,
+        skip_lines: bool = False,
+    ) -> schemas.CommitComparison:
+        """
+        Get the coverage comparison between two commits, either given by `base` and
+        `head` or by the base and head commits of the pull `pullid`.
+
+        Args:
+            service: git hosting service provider.
+            owner_username: username from service provider.
+            repo_name: repository name.
+            base: base commit SHA or branch name.
+            head: head commit SHA or branch name.
+            pullid: pull id number.
+            skip_lines: whether to leave the `lines` of every file to `None`, when
+                only the totals are read.
+
+        Returns:
+            A `CommitComparison`.
+
+        Raises:
+            ValueError: if `pullid` is given with `base` or `head`, or if neither
+                `pullid` nor both `base` and `head` are given.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Service
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         comparison = await codecov.comparisons.get_comparison(
+            ...             Service.GITHUB,
+            ...             "jazzband",
+            ...             "django-silk",
+            ...             base="master",
+            ...             head="add_multipart_support",
+            ...             skip_lines=True,
+            ...         )
+            ...         print(comparison)
+            >>> asyncio.run(main())
+            CommitComparison(...)
+        """
+        parser: Callable[[dict[str, Any]], schemas.CommitComparison] = (
+            _parse_commit_comparison_data_without_lines
+            if skip_lines
+            else parse_commit_comparison_data
+        )
+
+        return await self._get_cached(
+            "comparison",
+            parser,
+            f"{self.api_url}/{service}/{owner_username}/repos/{repo_name}/compare/",
+            params=_make_params(base, head, pullid),
+        )
+
+    async def iter_comparison_files(
+        self,
+        service: Service,
+        owner_username: str,
+        repo_name: str,
+        base: str | None = None,
+        head: str | None = None,
+        pullid: int | None = None,
+        skip_lines: bool = False,
+    ) -> AsyncIterator[schemas.FileComparison]:
+        """
+        Iterate over the file comparisons of the coverage comparison between two
+        commits, parsing each file only when it's reached. The json data of a file
+        is released once it's parsed, so a file comparison that is no longer
+        referenced doesn't keep its lines alive while the next ones are parsed.
+
+        Args:
+            service: git hosting service provider.
+            owner_username: username from service provider.
+            repo_name: repository name.
+            base: base commit SHA or branch name.
+            head: head commit SHA or branch name.
+            pullid: pull id number.
+            skip_lines: whether to leave the `lines` of every file to `None`, when
+                only the totals are read.
+
+        Yields:
+            A `FileComparison`, in the order of the response.
+
+        Raises:
+            ValueError: if `pullid` is given with `base` or `head`, or if neither
+                `pullid` nor both `base` and `head` are given.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Service
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         async for file in codecov.comparisons.iter_comparison_files(
+            ...             Service.GITHUB,
+            ...             "jazzband",
+            ...             "django-silk",
+            ...             base="master",
+            ...             head="add_multipart_support",
+            ...         ):
+            ...             print(file)
+            >>> asyncio.run(main())
+            FileComparison(...)
+            ...
+        """
+        # Not coalesced with identical requests, the files of the data are consumed
+        data = await self._scheduler.get(
+            self._session,
+            f"{self.api_url}/{service}/{owner_username}/repos/{repo_name}/compare/",
+            params=_make_params(base, head, pullid),
+        )
+
+        parser = (
+            _parse_file_comparison_data_without_lines
+            if skip_lines
+            else parse_file_comparison_data
+        )
+        files = data["files"]
+        files.reverse()
+
+        while files:
+            yield parser(files.pop())
+
+
+def _make_params(
+    base: str | None, head: str | None, pullid: int | None
+) -> dict[str, str]:
+    if pullid is not None:
+        if base is not None or head is not None:
+            raise ValueError("pullid can't be used with base and head")
+    elif base is None or head is None:
+        raise ValueError("either pullid or both base and head must be given")
+
+    optional_params = {
+        "base": base,
+        "head": head,
+        "pullid": str(pullid) if pullid is not None else pullid,
+    }
+
+    return {k: v for k, v in optional_params.items() if v is not None}
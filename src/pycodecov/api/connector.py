@@ -0,0 +1,56 @@
+from dataclasses import dataclass
+
+from aiohttp import TCPConnector
+
+__all__ = ["ConnectorConfig"]
+
+
+@dataclass(slots=True, frozen=True)
+class ConnectorConfig:
+    """
+    Connection pool settings used to build the client session connector.
+
+    Attributes:
+        limit: total number of simultaneous connections, `0` means no limit.
+        limit_per_host: number of simultaneous connections to the same endpoint,
+            `0` means no limit.
+        keepalive_timeout: seconds an idle connection is kept open for reuse.
+        ttl_dns_cache: seconds a resolved DNS entry is cached, `None` caches it
+            forever.
+        happy_eyeballs_delay: seconds to wait for a connection attempt before racing
+            the next address, `None` disables happy eyeballs.
+        interleave: number of addresses of the first address family to try before
+            switching to the next one.
+
+    Examples:
+    >>> import asyncio
+    >>> async def main():
+    ...     connector = ConnectorConfig(limit=200, limit_per_host=50).build()
+    ...     print(connector.limit, connector.limit_per_host)
+    ...     await connector.close()
+    >>> asyncio.run(main())
+    200 50
+    """
+
+    limit: int = 100
+    limit_per_host: int = 0
+    keepalive_timeout: float = 15.0
+    ttl_dns_cache: int | None = 10
+    happy_eyeballs_delay: float | None = 0.25
+    interleave: int | None = None
+
+    def build(self) -> TCPConnector:
+        """
+        Build a new connector from these settings.
+
+        Returns:
+            A `TCPConnector`.
+        """
+        return TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+            happy_eyeballs_delay=self.happy_eyeballs_delay,
+            interleave=self.interleave,
+        )
@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+
+from aiohttp import ClientSession
+
+from ..types import CodecovApiToken
+from .scheduler import RequestScheduler
+
+__all__ = ["ClientContext"]
+
+
+@dataclass(slots=True, frozen=True)
+class ClientContext:
+    """
+    Token, session and request scheduler of a client, shared by reference by every
+    API wrapper the client returns, so wrapping a result doesn't build its own
+    headers or session.
+
+    Attributes:
+        token: Codecov API Token.
+        session: client session.
+        scheduler: request scheduler.
+
+    Examples:
+    >>> import asyncio
+    >>> from aiohttp import ClientSession
+    >>> from pycodecov.api import Owner, RequestScheduler
+    >>> from pycodecov.enums import Service
+    >>> async def main():
+    ...     context = ClientContext(None, ClientSession(), RequestScheduler())
+    ...     owner = Owner(Service.GITHUB, "jazzband", context=context)
+    ...     other_owner = Owner(Service.GITHUB, "django", context=context)
+    ...     print(owner._session is other_owner._session)
+    ...     await owner.close()
+    >>> asyncio.run(main())
+    True
+    """
+
+    token: CodecovApiToken | None
+    session: ClientSession
+    scheduler: RequestScheduler
@@ -0,0 +1,349 @@
+from contextlib import aclosing
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Iterable
+
+from .. import schemas
+from ..enums import Interval, Service
+from ..parsers import (
+    parse_coverage_trend_array_data,
+    parse_coverage_trend_data,
+    parse_paginated_list_data,
+)
+from .api import API
+from .bulk import BulkResult, _fetch_many, _iter_many
+from .paginated_list import PaginatedList, _iter_pages
+
+__all__ = ["CoverageTrend"]
+
+
+class CoverageTrend(API):
+    """
+    Coverage trend API Wrapper from Codecov API.
+    """
+
+    async def get_coverage_trend(
+        self,
+        service: Service,
+        owner_username: str,
+        repo_name: str,
+        interval: Interval,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        branch: str | None = None,
+        flag_name: str | None = None,
+        component_id: str | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+    ) -> PaginatedList[schemas.CoverageTrend]:
+        """
+        Get a paginated list of coverage trend points for the specified repository,
+        or for one of its flags or components.
+
+        Args:
+            service: git hosting service provider.
+            owner_username: username from service provider.
+            repo_name: repository name.
+            interval: interval of the coverage trend points.
+            start_date: timezone aware datetime, earlier points are skipped.
+            end_date: timezone aware datetime, later points are skipped.
+            branch: branch name, `None` uses the default branch.
+            flag_name: flag name, to get the coverage trend of this flag.
+            component_id: component id, to get the coverage trend of this component.
+            page: a page number within the paginated result set.
+            page_size: number of results to return per page.
+
+        Returns:
+            Paginated list of `CoverageTrend`.
+
+        Raises:
+            ValueError: if both `flag_name` and `component_id` are given.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Interval, Service
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         trend = await codecov.coverage_trends.get_coverage_trend(
+            ...             Service.GITHUB, "jazzband", "django-silk", Interval.ONE_DAY
+            ...         )
+            ...         print(trend)
+            >>> asyncio.run(main())
+            PaginatedList(...)
+        """
+        return await self._get_coverage_trend(
+            service,
+            owner_username,
+            repo_name,
+            interval,
+            start_date,
+            end_date,
+            branch,
+            flag_name,
+            component_id,
+            page,
+            page_size,
+            parse_coverage_trend_data,
+        )
+
+    async def get_coverage_trend_array(
+        self,
+        service: Service,
+        owner_username: str,
+        repo_name: str,
+        interval: Interval,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        branch: str | None = None,
+        flag_name: str | None = None,
+        component_id: str | None = None,
+        page_size: int | None = None,
+    ) -> schemas.CoverageTrendArray:
+        """
+        Get every coverage trend point for the specified repository, or for one of
+        its flags or components, in compact columns. Each page is parsed straight
+        into the columns as it arrives while the next one is prefetched, so no
+        `CoverageTrend` is built and no page is kept.
+
+        Args:
+            service: git hosting service provider.
+            owner_username: username from service provider.
+            repo_name: repository name.
+            interval: interval of the coverage trend points.
+            start_date: timezone aware datetime, earlier points are skipped.
+            end_date: timezone aware datetime, later points are skipped.
+            branch: branch name, `None` uses the default branch.
+            flag_name: flag name, to get the coverage trend of this flag.
+            component_id: component id, to get the coverage trend of this component.
+            page_size: number of results to return per page.
+
+        Returns:
+            A `CoverageTrendArray`.
+
+        Raises:
+            ValueError: if both `flag_name` and `component_id` are given.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Interval, Service
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         trend = await codecov.coverage_trends.get_coverage_trend_array(
+            ...             Service.GITHUB, "jazzband", "django-silk", Interval.ONE_DAY
+            ...         )
+            ...         print(trend.rolling(7))
+            >>> asyncio.run(main())
+            CoverageTrendArray(...)
+        """
+        paginated_list = await self._get_coverage_trend(
+            service,
+            owner_username,
+            repo_name,
+            interval,
+            start_date,
+            end_date,
+            branch,
+            flag_name,
+            component_id,
+            None,
+            page_size,
+            _keep_data,
+        )
+        coverage_trend = schemas.CoverageTrendArray()
+
+        async with aclosing(_iter_pages(paginated_list)) as pages:
+            async for page in pages:
+                coverage_trend.extend(parse_coverage_trend_array_data(page.results))
+
+        return coverage_trend
+
+    async def get_coverage_trend_arrays_many(
+        self,
+        service: Service,
+        owner_username: str,
+        repo_names: Iterable[str],
+        interval: Interval,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        branch: str | None = None,
+        concurrency: int = 4,
+    ) -> list[BulkResult[schemas.CoverageTrendArray]]:
+        """
+        Get every coverage trend point of many repositories, with at most
+        `concurrency` repositories requested at the same time. A repository whose
+        trend can't be fetched gets its error in its result instead of failing the
+        others.
+
+        Args:
+            service: git hosting service provider.
+            owner_username: username from service provider.
+            repo_names: repository names.
+            interval: interval of the coverage trend points.
+            start_date: timezone aware datetime, earlier points are skipped.
+            end_date: timezone aware datetime, later points are skipped.
+            branch: branch name, `None` uses the default branch of each repository.
+            concurrency: maximum number of repositories requested at the same time.
+
+        Returns:
+            A `BulkResult` of `CoverageTrendArray` per repository name, in the order
+            of `repo_names`.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Interval, Service
+            >>> from pycodecov.schemas import CoverageTrendArray
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         results = (
+            ...             await codecov.coverage_trends.get_coverage_trend_arrays_many(
+            ...                 Service.GITHUB,
+            ...                 "jazzband",
+            ...                 ["django-silk", "pip-tools"],
+            ...                 Interval.ONE_WEEK,
+            ...             )
+            ...         )
+            ...         print(
+            ...             CoverageTrendArray.merge(
+            ...                 result.value for result in results if result.ok
+            ...             )
+            ...         )
+            >>> asyncio.run(main())
+            CoverageTrendArray(...)
+        """
+        return await _fetch_many(
+            repo_names,
+            lambda repo_name: self.get_coverage_trend_array(
+                service,
+                owner_username,
+                repo_name,
+                interval,
+                start_date,
+                end_date,
+                branch,
+            ),
+            concurrency,
+        )
+
+    async def iter_coverage_trend_arrays_many(
+        self,
+        service: Service,
+        owner_username: str,
+        repo_names: Iterable[str],
+        interval: Interval,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        branch: str | None = None,
+        concurrency: int = 4,
+    ) -> AsyncIterator[BulkResult[schemas.CoverageTrendArray]]:
+        """
+        Iterate over the coverage trend points of many repositories as they are
+        fetched, with at most `concurrency` repositories requested at the same time.
+        A repository whose trend can't be fetched gets its error in its result
+        instead of failing the others.
+
+        Args:
+            service: git hosting service provider.
+            owner_username: username from service provider.
+            repo_names: repository names.
+            interval: interval of the coverage trend points.
+            start_date: timezone aware datetime, earlier points are skipped.
+            end_date: timezone aware datetime, later points are skipped.
+            branch: branch name, `None` uses the default branch of each repository.
+            concurrency: maximum number of repositories requested at the same time.
+
+        Yields:
+            A `BulkResult` of `CoverageTrendArray`, in completion order.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Interval, Service
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         trends = codecov.coverage_trends
+            ...         async for result in trends.iter_coverage_trend_arrays_many(
+            ...             Service.GITHUB,
+            ...             "jazzband",
+            ...             ["django-silk", "pip-tools"],
+            ...             Interval.ONE_WEEK,
+            ...         ):
+            ...             print(result.ok)
+            >>> asyncio.run(main())
+            True
+            True
+        """
+        async for result in _iter_many(
+            repo_names,
+            lambda repo_name: self.get_coverage_trend_array(
+                service,
+                owner_username,
+                repo_name,
+                interval,
+                start_date,
+                end_date,
+                branch,
+            ),
+            concurrency,
+        ):
+            yield result
+
+    async def _get_coverage_trend[T](
+        self,
+        service: Service,
+        owner_username: str,
+        repo_name: str,
+        interval: Interval,
+        start_date: datetime | None,
+        end_date: datetime | None,
+        branch: str | None,
+        flag_name: str | None,
+        component_id: str | None,
+        page: int | None,
+        page_size: int | None,
+        parser: Callable[[dict[str, Any]], T],
+    ) -> PaginatedList[T]:
+        if flag_name is not None and component_id is not None:
+            raise ValueError("flag_name and component_id can't be used together")
+
+        url = f"{self.api_url}/{service}/{owner_username}/repos/{repo_name}"
+
+        if flag_name is not None:
+            url = f"{url}/flags/{flag_name}"
+        elif component_id is not None:
+            url = f"{url}/components/{component_id}"
+
+        params = {"interval": str(interval)}
+        optional_params = {
+            "start_date": start_date.isoformat() if start_date is not None else None,
+            "end_date": end_date.isoformat() if end_date is not None else None,
+            "branch": branch,
+            "page": str(page) if page is not None else page,
+            "page_size": str(page_size) if page_size is not None else page_size,
+        }
+
+        params.update({k: v for k, v in optional_params.items() if v is not None})
+
+        data = await self._get(f"{url}/coverage/", params=params)
+
+        paginated_list = parse_paginated_list_data(data, parser)
+
+        return PaginatedList(
+            paginated_list.count,
+            paginated_list.results,
+            paginated_list.total_pages,
+            parser,
+            paginated_list.next,
+            paginated_list.previous,
+            context=self._context,
+        )
+
+
+def _keep_data(data: dict[str, Any]) -> dict[str, Any]:
+    # Points are parsed page by page into columns, not one by one
+    return data
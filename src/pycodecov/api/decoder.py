@@ -0,0 +1,21 @@
+import json
+
+from ..types import JsonLoads
+
+__all__ = ["default_json_loads"]
+
+
+def _get_default_json_loads() -> JsonLoads:
+    try:
+        import orjson  # type: ignore[import-not-found, unused-ignore]
+    except ImportError:
+        return json.loads
+
+    return orjson.loads
+
+
+default_json_loads: JsonLoads = _get_default_json_loads()
+"""
+Function used to decode response bodies when no `json_loads` is given, `orjson.loads`
+when `orjson` is installed, otherwise `json.loads`.
+"""
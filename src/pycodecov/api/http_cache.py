@@ -0,0 +1,210 @@
+import asyncio
+import hashlib
+import math
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Mapping
+
+from aiohttp import ClientSession
+
+__all__ = ["HttpCache", "HttpCacheEntry"]
+
+
+@dataclass(slots=True, frozen=True)
+class HttpCacheEntry:
+    """
+    A schema used to store info about a cached response.
+
+    Attributes:
+        etag: `ETag` header of the response.
+        last_modified: `Last-Modified` header of the response.
+        body: raw response body.
+    """
+
+    etag: str | None
+    last_modified: str | None
+    body: bytes
+
+    def get_conditional_headers(self) -> dict[str, str]:
+        """
+        Get the headers used to revalidate this response.
+
+        Returns:
+            `If-None-Match` and `If-Modified-Since` request headers.
+        """
+        headers = {}
+
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+
+class HttpCache:
+    """
+    Persistent cache of response bodies stored in a SQLite database.
+
+    Responses with an `ETag` or `Last-Modified` header are stored with their body.
+    Later requests for the same resource are sent as conditional requests and a
+    `304 Not Modified` response is answered from the stored body. The database
+    survives process restarts, so unchanged resources are not downloaded again.
+
+    The database is pruned on every store, so it doesn't grow without bound in a
+    long running process: responses older than `max_age` are removed, then the
+    oldest responses past `max_entries`.
+
+    Args:
+        path: database file path, `":memory:"` keeps the cache in memory.
+        max_entries: maximum number of stored responses, `None` means no limit.
+        max_age: seconds a response stays stored, `None` means forever.
+
+    Examples:
+    >>> import asyncio
+    >>> async def main():
+    ...     http_cache = HttpCache(":memory:")
+    ...     entry = HttpCacheEntry('"33a64df5"', None, b'{"name": "string"}')
+    ...     await http_cache.set("key", entry)
+    ...     print(await http_cache.get("key"))
+    ...     http_cache.close()
+    >>> asyncio.run(main())
+    HttpCacheEntry(etag='"33a64df5"', last_modified=None, body=b'{"name": "string"}')
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        max_entries: int | None = None,
+        max_age: float | None = None,
+    ) -> None:
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, "
+            "etag TEXT, "
+            "last_modified TEXT, "
+            "body BLOB NOT NULL, "
+            "stored_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_stored_at ON responses (stored_at)"
+        )
+        self._connection.commit()
+
+    @staticmethod
+    def make_key(
+        session: ClientSession, url: str, params: Mapping[str, str] | None = None
+    ) -> str:
+        """
+        Make a cache key from a request. Requests sent with different credentials
+        get different keys.
+
+        Args:
+            session: client session used to send the request.
+            url: request url.
+            params: request query parameters.
+
+        Returns:
+            A cache key.
+        """
+        query = (
+            "&".join(f"{k}={v}" for k, v in sorted(params.items())) if params else ""
+        )
+        authorization = session.headers.get("Authorization", "")
+
+        return hashlib.sha256(f"{authorization} {url}?{query}".encode()).hexdigest()
+
+    def _get_oldest_stored_at(self) -> float:
+        return time.time() - self.max_age if self.max_age is not None else -math.inf
+
+    def _get(self, key: str) -> HttpCacheEntry | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT etag, last_modified, body FROM responses "
+                "WHERE key = ? AND stored_at >= ?",
+                (key, self._get_oldest_stored_at()),
+            ).fetchone()
+
+        return HttpCacheEntry(*row) if row is not None else None
+
+    def _set(self, key: str, entry: HttpCacheEntry) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, entry.etag, entry.last_modified, entry.body, time.time()),
+            )
+            self._prune()
+            self._connection.commit()
+
+    def _prune(self) -> None:
+        if self.max_age is not None:
+            self._connection.execute(
+                "DELETE FROM responses WHERE stored_at < ?",
+                (self._get_oldest_stored_at(),),
+            )
+
+        if self.max_entries is not None:
+            self._connection.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    async def get(self, key: str) -> HttpCacheEntry | None:
+        """
+        Get a stored response.
+
+        Args:
+            key: cache key of the request.
+
+        Returns:
+            The stored response if any.
+        """
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, entry: HttpCacheEntry) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: cache key of the request.
+            entry: response to store.
+        """
+        await asyncio.to_thread(self._set, key, entry)
+
+    def prune(self) -> None:
+        """
+        Remove the responses older than `max_age`, then the oldest responses past
+        `max_entries`.
+        """
+        with self._lock:
+            self._prune()
+            self._connection.commit()
+
+    def clear(self) -> None:
+        """
+        Remove every stored response.
+        """
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._connection.close()
@@ -1,14 +1,15 @@
-from typing import Any
+from typing import Any, AsyncIterator
 
 from aiohttp import ClientSession
 
 from .. import schemas
 from ..enums import Service
-from ..exceptions import CodecovError
 from ..parsers import parse_owner_data, parse_paginated_list_data, parse_user_data
 from ..types import CodecovApiToken
 from .api import API
+from .context import ClientContext
 from .paginated_list import PaginatedList, PaginatedListApi, parse_paginated_list_api
+from .scheduler import RequestScheduler
 from .user import User, parse_user_api
 
 __all__ = [
@@ -29,8 +30,10 @@ class Owner(API, schemas.Owner):
         name: str | None = None,
         token: CodecovApiToken | None = None,
         session: ClientSession | None = None,
+        scheduler: RequestScheduler | None = None,
+        context: ClientContext | None = None,
     ) -> None:
-        API.__init__(self, token, session)
+        API.__init__(self, token, session, scheduler=scheduler, context=context)
         schemas.Owner.__init__(self, service, owner_username, name)
 
     async def get_detail(self) -> schemas.Owner:
@@ -54,15 +57,11 @@ class Owner(API, schemas.Owner):
             Owner(...)
             ...
         """
-        async with self._session.get(
-            f"{self.api_url}/{self.service}/{self.username}"
-        ) as response:
-            data = await response.json()
-
-            if response.ok:
-                return parse_owner_data(data)
-
-            raise CodecovError(data)
+        return await self._get_cached(
+            "owner_detail",
+            parse_owner_data,
+            f"{self.api_url}/{self.service}/{self.username}",
+        )
 
     async def get_users(
         self,
@@ -109,35 +108,74 @@ class Owner(API, schemas.Owner):
 
         params.update({k: v for k, v in optional_params.items() if v is not None})
 
-        async with self._session.get(
+        data = await self._get(
             f"{self.api_url}/{self.service}/{self.username}/users", params=params
-        ) as response:
-            data = await response.json()
-
-            if response.ok:
-                paginated_list_data = parse_paginated_list_data(data, parse_user_data)
-                paginated_list = PaginatedList(
-                    paginated_list_data.count,
-                    paginated_list_data.results,
-                    paginated_list_data.total_pages,
-                    parse_user_data,
-                    paginated_list_data.next,
-                    paginated_list_data.previous,
-                    self._token,
-                    self._session,
-                )
-
-                return parse_paginated_list_api(
-                    paginated_list,
-                    parse_user_api,
-                    owner_username=self.username,
-                )
-
-            raise CodecovError(data)
+        )
+
+        parser = self._bind(parse_user_data)
+        paginated_list_data = parse_paginated_list_data(data, parser)
+        paginated_list = PaginatedList(
+            paginated_list_data.count,
+            paginated_list_data.results,
+            paginated_list_data.total_pages,
+            parser,
+            paginated_list_data.next,
+            paginated_list_data.previous,
+            context=self._context,
+        )
+
+        return parse_paginated_list_api(
+            paginated_list,
+            parse_user_api,
+            owner_username=self.username,
+        )
+
+    async def iter_users(
+        self,
+        activated: bool | None = None,
+        is_admin: bool | None = None,
+        page_size: int | None = None,
+        search: str | None = None,
+    ) -> AsyncIterator[User]:
+        """
+        Iterate over every user for the specified owner (org), page by page.
+
+        Args:
+            activated: whether the user has been manually deactivated.
+            is_admin: whether the user is admin.
+            page_size: number of results to return per page.
+            search: a search term.
+
+        Yields:
+            A `User`.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Service
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         service_owners = await codecov.get_service_owners(Service.GITHUB)
+            ...         for service_owner in service_owners:
+            ...             async for user in service_owner.iter_users():
+            ...                 print(user)
+            >>> asyncio.run(main())
+            User(...)
+            ...
+        """
+        users = await self.get_users(
+            activated, is_admin, page_size=page_size, search=search
+        )
+
+        async for user in users:
+            yield user
 
 
 def parse_owner_api(
     schema: schemas.Owner,
+    context: ClientContext | None = None,
+    *,
     token: CodecovApiToken | None = None,
     session: ClientSession | None = None,
     **kwargs: Any,
@@ -147,12 +185,16 @@ def parse_owner_api(
 
     Args:
         schema: owner data.
-        token: Codecov API Token.
-        session: client session.
+        context: client context shared with the API, `None` creates a new one.
+        token: Codecov API Token, only used without a context.
+        session: client session, only used without a context.
 
     Returns:
         An `Owner` API.
 
+    Raises:
+        ValueError: if `token` or `session` is given with a `context`.
+
     Examples:
     >>> import asyncio
     >>> async def main():
@@ -167,4 +209,18 @@ def parse_owner_api(
     >>> asyncio.run(main())
     Owner(service=<Service.GITHUB: 'github'>, username='string', name='string')
     """
-    return Owner(schema.service, schema.username, schema.name, token, session)
+    if context is None or token is not None or session is not None:
+        # The constructor creates the context or rejects the combination
+        return Owner(
+            schema.service,
+            schema.username,
+            schema.name,
+            token,
+            session,
+            context=context,
+        )
+
+    owner = Owner._from_context(context)
+    schemas.Owner.__init__(owner, schema.service, schema.username, schema.name)
+
+    return owner
@@ -1,12 +1,16 @@
-from typing import Any, Callable
+import asyncio
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, Callable
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from aiohttp import ClientSession
 
 from .. import schemas
-from ..exceptions import CodecovError
 from ..parsers import parse_paginated_list_data
 from ..types import ApiParser, CodecovApiToken, CodecovUrl
 from .api import API
+from .context import ClientContext
+from .scheduler import RequestScheduler
 
 __all__ = [
     "PaginatedList",
@@ -30,8 +34,10 @@ class PaginatedList[T](API, schemas.PaginatedList[T]):
         previous: CodecovUrl | None = None,
         token: CodecovApiToken | None = None,
         session: ClientSession | None = None,
+        scheduler: RequestScheduler | None = None,
+        context: ClientContext | None = None,
     ) -> None:
-        API.__init__(self, token, session)
+        API.__init__(self, token, session, scheduler=scheduler, context=context)
         schemas.PaginatedList.__init__(
             self, count, next, previous, results, total_pages
         )
@@ -41,24 +47,19 @@ class PaginatedList[T](API, schemas.PaginatedList[T]):
         self, next_or_previous: str | None
     ) -> "PaginatedList[T] | None":
         if next_or_previous is not None:
-            async with self._session.get(next_or_previous) as response:
-                data = await response.json()
+            data = await self._get(next_or_previous)
 
-                if response.ok:
-                    paginated_list = parse_paginated_list_data(data, self.parser)
+            paginated_list = parse_paginated_list_data(data, self.parser)
 
-                    return PaginatedList(
-                        paginated_list.count,
-                        paginated_list.results,
-                        paginated_list.total_pages,
-                        self.parser,
-                        paginated_list.next,
-                        paginated_list.previous,
-                        self._token,
-                        self._session,
-                    )
-
-                raise CodecovError(data)
+            return PaginatedList(
+                paginated_list.count,
+                paginated_list.results,
+                paginated_list.total_pages,
+                self.parser,
+                paginated_list.next,
+                paginated_list.previous,
+                context=self._context,
+            )
 
         return None
 
@@ -68,6 +69,52 @@ class PaginatedList[T](API, schemas.PaginatedList[T]):
     async def get_previous(self) -> "PaginatedList[T] | None":
         return await self._get_next_or_previous(self.previous)
 
+    def __aiter__(self) -> AsyncGenerator[T, None]:
+        """
+        Iterate over the results of this page and every next page. The next page is
+        prefetched while the results of the current page are consumed.
+        """
+        return _iter_results(self)
+
+    async def fetch_all(self, concurrency: int = 4) -> "PaginatedList[T]":
+        """
+        Fetch every page after this one concurrently and merge the results in page
+        order.
+
+        Args:
+            concurrency: maximum number of pages requested at the same time.
+
+        Returns:
+            A `PaginatedList` holding the results of this page and every next page.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Service
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         repos = await codecov.repos.get_repo_list(
+            ...             Service.GITHUB, "jazzband"
+            ...         )
+            ...         print(await repos.fetch_all(concurrency=8))
+            >>> asyncio.run(main())
+            PaginatedList(...)
+        """
+        results = list(self.results)
+        for paginated_list in await _fetch_next_pages(self, concurrency):
+            results.extend(paginated_list.results)
+
+        return PaginatedList(
+            self.count,
+            results,
+            self.total_pages,
+            self.parser,
+            None,
+            self.previous,
+            context=self._context,
+        )
+
 
 class PaginatedListApi[T](API, schemas.PaginatedList[T]):
     """
@@ -86,8 +133,10 @@ class PaginatedListApi[T](API, schemas.PaginatedList[T]):
         previous: CodecovUrl | None = None,
         token: CodecovApiToken | None = None,
         session: ClientSession | None = None,
+        scheduler: RequestScheduler | None = None,
+        context: ClientContext | None = None,
     ) -> None:
-        API.__init__(self, token, session)
+        API.__init__(self, token, session, scheduler=scheduler, context=context)
         schemas.PaginatedList.__init__(
             self, count, next, previous, results, total_pages
         )
@@ -99,28 +148,23 @@ class PaginatedListApi[T](API, schemas.PaginatedList[T]):
         self, next_or_previous: str | None
     ) -> "PaginatedListApi[T] | None":
         if next_or_previous is not None:
-            async with self._session.get(next_or_previous) as response:
-                data = await response.json()
-
-                if response.ok:
-                    paginated_list_data = parse_paginated_list_data(data, self.parser)
+            data = await self._get(next_or_previous)
 
-                    paginated_list = PaginatedList(
-                        paginated_list_data.count,
-                        paginated_list_data.results,
-                        paginated_list_data.total_pages,
-                        self.parser,
-                        paginated_list_data.next,
-                        paginated_list_data.previous,
-                        self._token,
-                        self._session,
-                    )
+            paginated_list_data = parse_paginated_list_data(data, self.parser)
 
-                    return parse_paginated_list_api(
-                        paginated_list, self.api_parser, **self.payload
-                    )
+            paginated_list = PaginatedList(
+                paginated_list_data.count,
+                paginated_list_data.results,
+                paginated_list_data.total_pages,
+                self.parser,
+                paginated_list_data.next,
+                paginated_list_data.previous,
+                context=self._context,
+            )
 
-                raise CodecovError(data)
+            return parse_paginated_list_api(
+                paginated_list, self.api_parser, **self.payload
+            )
 
         return None
 
@@ -130,6 +174,135 @@ class PaginatedListApi[T](API, schemas.PaginatedList[T]):
     async def get_previous(self) -> "PaginatedListApi[T] | None":
         return await self._get_next_or_previous(self.previous)
 
+    def __aiter__(self) -> AsyncGenerator[T, None]:
+        """
+        Iterate over the results of this page and every next page. The next page is
+        prefetched while the results of the current page are consumed.
+        """
+        return _iter_results(self)
+
+    async def fetch_all(self, concurrency: int = 4) -> "PaginatedListApi[T]":
+        """
+        Fetch every page after this one concurrently and merge the results in page
+        order.
+
+        Args:
+            concurrency: maximum number of pages requested at the same time.
+
+        Returns:
+            A `PaginatedListApi` holding the results of this page and every next page.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Service
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         service_owners = await codecov.get_service_owners(Service.GITHUB)
+            ...         print(await service_owners.fetch_all(concurrency=8))
+            >>> asyncio.run(main())
+            PaginatedListApi(...)
+        """
+        results = list(self.results)
+        for paginated_list in await _fetch_next_pages(self, concurrency):
+            results.extend(
+                self.api_parser(result, self._context, **self.payload)
+                for result in paginated_list.results
+            )
+
+        return PaginatedListApi(
+            self.count,
+            results,
+            self.total_pages,
+            self.parser,
+            self.api_parser,
+            self.payload,
+            None,
+            self.previous,
+            context=self._context,
+        )
+
+
+async def _iter_pages[T](
+    paginated_list: PaginatedList[T] | PaginatedListApi[T],
+) -> AsyncGenerator[PaginatedList[T] | PaginatedListApi[T], None]:
+    current: PaginatedList[T] | PaginatedListApi[T] | None = paginated_list
+
+    while current is not None:
+        next_page: asyncio.Future[Any] | None = (
+            asyncio.ensure_future(current.get_next())
+            if current.next is not None
+            else None
+        )
+
+        try:
+            yield current
+        except BaseException:
+            if next_page is not None:
+                next_page.cancel()
+
+            raise
+
+        current = await next_page if next_page is not None else None
+
+
+async def _iter_results[T](
+    paginated_list: PaginatedList[T] | PaginatedListApi[T],
+) -> AsyncGenerator[T, None]:
+    async with aclosing(_iter_pages(paginated_list)) as pages:
+        async for page in pages:
+            for result in page:
+                yield result
+
+
+def _get_page_number(url: CodecovUrl) -> int:
+    for key, value in parse_qsl(urlsplit(url).query):
+        if key == "page":
+            return int(value)
+
+    return 1
+
+
+def _get_page_url(url: CodecovUrl, page: int) -> CodecovUrl:
+    split_url = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(split_url.query) if k != "page"]
+    query.append(("page", str(page)))
+
+    return urlunsplit(split_url._replace(query=urlencode(query)))
+
+
+async def _fetch_next_pages[T](
+    paginated_list: PaginatedList[T] | PaginatedListApi[T], concurrency: int
+) -> list[schemas.PaginatedList[Any]]:
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    if paginated_list.next is None:
+        return []
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(url: CodecovUrl) -> schemas.PaginatedList[Any]:
+        async with semaphore:
+            data = await paginated_list._get(url)
+
+            return parse_paginated_list_data(data, paginated_list.parser)
+
+    first_page = _get_page_number(paginated_list.next)
+    tasks = [
+        asyncio.ensure_future(fetch(_get_page_url(paginated_list.next, page)))
+        for page in range(first_page, paginated_list.total_pages + 1)
+    ]
+
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+
+        raise
+
 
 def parse_paginated_list_api[T](
     paginated_list: PaginatedList,
@@ -170,7 +343,7 @@ def parse_paginated_list_api[T](
     PaginatedListApi(...)
     """
     results = [
-        api_parser(result, paginated_list._token, paginated_list._session, **kwargs)
+        api_parser(result, paginated_list._context, **kwargs)
         for result in paginated_list
     ]
 
@@ -183,6 +356,5 @@ def parse_paginated_list_api[T](
         kwargs,
         paginated_list.next,
         paginated_list.previous,
-        paginated_list._token,
-        paginated_list._session,
+        context=paginated_list._context,
     )
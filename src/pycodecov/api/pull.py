@@ -0,0 +1,264 @@
+from contextlib import aclosing
+from datetime import datetime
+from typing import AsyncIterator, Iterable
+
+from .. import schemas
+from ..enums import PullState, Service
+from ..parsers import Projection, parse_paginated_list_data, parse_pull_data
+from .api import API
+from .paginated_list import PaginatedList
+
+__all__ = ["Pull"]
+
+
+class Pull(API):
+    """
+    Pull API Wrapper from Codecov API.
+    """
+
+    async def get_pull_list(
+        self,
+        service: Service,
+        owner_username: str,
+        repo_name: str,
+        state: PullState | None = None,
+        ordering: str | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> PaginatedList[schemas.Pull]:
+        """
+        Get a paginated list of pulls for the specified repository.
+
+        Args:
+            service: git hosting service provider.
+            owner_username: username from service provider.
+            repo_name: repository name.
+            state: pull state to filter pulls by.
+            ordering: which field to use when ordering the results, like
+                `"-updatestamp"`.
+            page: a page number within the paginated result set.
+            page_size: number of results to return per page.
+            fields: fields to parse, like `("pullid", "head_total.coverage")`. The
+                other fields are `None`. `None` parses every field.
+
+        Returns:
+            Paginated list of `Pull`.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import PullState, Service
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         pulls = await codecov.pulls.get_pull_list(
+            ...             Service.GITHUB, "jazzband", "django-silk", PullState.OPEN
+            ...         )
+            ...         print(pulls)
+            >>> asyncio.run(main())
+            PaginatedList(...)
+        """
+        params = {}
+        optional_params = {
+            "state": state,
+            "ordering": ordering,
+            "page": str(page) if page is not None else page,
+            "page_size": str(page_size) if page_size is not None else page_size,
+        }
+
+        params.update({k: v for k, v in optional_params.items() if v is not None})
+
+        data = await self._get(
+            f"{self.api_url}/{service}/{owner_username}/repos/{repo_name}/pulls/",
+            params=params,
+        )
+
+        parser = (
+            Projection(schemas.Pull, fields)
+            if fields is not None
+            else self._bind(parse_pull_data)
+        )
+        paginated_list = parse_paginated_list_data(data, parser)
+
+        return PaginatedList(
+            paginated_list.count,
+            paginated_list.results,
+            paginated_list.total_pages,
+            parser,
+            paginated_list.next,
+            paginated_list.previous,
+            context=self._context,
+        )
+
+    async def iter_pull_list(
+        self,
+        service: Service,
+        owner_username: str,
+        repo_name: str,
+        state: PullState | None = None,
+        ordering: str | None = None,
+        page_size: int | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> AsyncIterator[schemas.Pull]:
+        """
+        Iterate over every pull for the specified repository, page by page.
+
+        Args:
+            service: git hosting service provider.
+            owner_username: username from service provider.
+            repo_name: repository name.
+            state: pull state to filter pulls by.
+            ordering: which field to use when ordering the results, like
+                `"-updatestamp"`.
+            page_size: number of results to return per page.
+            fields: fields to parse, like `("pullid", "head_total.coverage")`. The
+                other fields are `None`. `None` parses every field.
+
+        Yields:
+            A `Pull`.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Service
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         async for pull in codecov.pulls.iter_pull_list(
+            ...             Service.GITHUB, "jazzband", "django-silk"
+            ...         ):
+            ...             print(pull)
+            >>> asyncio.run(main())
+            Pull(...)
+            ...
+        """
+        pulls = await self.get_pull_list(
+            service,
+            owner_username,
+            repo_name,
+            state,
+            ordering,
+            page_size=page_size,
+            fields=fields,
+        )
+
+        async for pull in pulls:
+            yield pull
+
+    async def iter_pull_updates(
+        self,
+        service: Service,
+        owner_username: str,
+        repo_name: str,
+        since: datetime,
+        state: PullState | None = None,
+        page_size: int | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> AsyncIterator[schemas.Pull]:
+        """
+        Iterate over the pulls of the specified repository updated since a
+        watermark, most recently updated first. No page is requested past the
+        first pull updated before `since`, so syncing again with the `updatestamp`
+        of the first pull of the previous sync only reads the pages that changed.
+
+        Pulls updated exactly at `since` are yielded again, so an update sharing
+        the watermark timestamp isn't missed.
+
+        Args:
+            service: git hosting service provider.
+            owner_username: username from service provider.
+            repo_name: repository name.
+            since: timezone aware watermark, pulls updated before it are skipped.
+            state: pull state to filter pulls by.
+            page_size: number of results to return per page.
+            fields: fields to parse, like `("pullid", "head_total.coverage")`. The
+                other fields are `None`. `None` parses every field. `"updatestamp"`
+                is always parsed.
+
+        Yields:
+            A `Pull`.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from datetime import datetime, timezone
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Service
+            >>> async def main():
+            ...     watermark = datetime(2024, 1, 1, tzinfo=timezone.utc)
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         async for pull in codecov.pulls.iter_pull_updates(
+            ...             Service.GITHUB, "jazzband", "django-silk", watermark
+            ...         ):
+            ...             watermark = max(watermark, pull.updatestamp)
+            ...             print(pull)
+            >>> asyncio.run(main())
+            Pull(...)
+            ...
+        """
+        if fields is not None:
+            fields = (*fields, "updatestamp")
+
+        pulls = await self.get_pull_list(
+            service,
+            owner_username,
+            repo_name,
+            state,
+            "-updatestamp",
+            page_size=page_size,
+            fields=fields,
+        )
+
+        # Closing the iterator cancels the prefetched page once `since` is passed
+        async with aclosing(aiter(pulls)) as iterator:
+            async for pull in iterator:
+                if pull.updatestamp < since:
+                    break
+
+                yield pull
+
+    async def get_pull_detail(
+        self,
+        service: Service,
+        owner_username: str,
+        repo_name: str,
+        pullid: int,
+        fields: Iterable[str] | None = None,
+    ) -> schemas.Pull:
+        """
+        Get a single pull by pull id number.
+
+        Args:
+            service: git hosting service provider.
+            owner_username: username from service provider.
+            repo_name: repository name.
+            pullid: pull id number.
+            fields: fields to parse, like `("pullid", "head_total.coverage")`. The
+                other fields are `None`. `None` parses every field.
+
+        Returns:
+            A `Pull`.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Service
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         pulls = await codecov.pulls.get_pull_list(
+            ...             Service.GITHUB, "jazzband", "django-silk"
+            ...         )
+            ...         pull = await codecov.pulls.get_pull_detail(
+            ...             Service.GITHUB, "jazzband", "django-silk", pulls[0].pullid
+            ...         )
+            ...         print(pull)
+            >>> asyncio.run(main())
+            Pull(...)
+        """
+        return await self._get_cached(
+            "pull_detail",
+            Projection(schemas.Pull, fields) if fields is not None else parse_pull_data,
+            f"{self.api_url}/{service}/{owner_username}/repos/{repo_name}/pulls/{pullid}/",
+        )
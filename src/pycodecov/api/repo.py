@@ -1,8 +1,15 @@
+from typing import AsyncIterator, Iterable
+
 from .. import schemas
 from ..enums import Service
-from ..exceptions import CodecovError
-from ..parsers import parse_paginated_list_data, parse_repo_config_data, parse_repo_data
+from ..parsers import (
+    Projection,
+    parse_paginated_list_data,
+    parse_repo_config_data,
+    parse_repo_data,
+)
 from .api import API
+from .bulk import BulkResult, _fetch_many, _iter_many
 from .paginated_list import PaginatedList
 
 __all__ = ["Repo"]
@@ -22,6 +29,7 @@ class Repo(API):
         page: int | None = None,
         page_size: int | None = None,
         search: str | None = None,
+        fields: Iterable[str] | None = None,
     ) -> PaginatedList[schemas.Repo]:
         """
         Get a paginated list of repositories for the specified provider service and
@@ -35,6 +43,8 @@ class Repo(API):
             page: a page number within the paginated result set.
             page_size: number of results to return per page.
             search: a search term.
+            fields: fields to parse, like `("name", "totals.coverage")`. The other
+                fields are `None`. `None` parses every field.
 
         Returns:
             Paginated list of `Repo`.
@@ -64,29 +74,88 @@ class Repo(API):
 
         params.update({k: v for k, v in optional_params.items() if v is not None})
 
-        async with self._session.get(
+        data = await self._get(
             f"{self.api_url}/{service}/{owner_username}/repos/", params=params
-        ) as response:
-            data = await response.json()
+        )
+
+        parser = (
+            Projection(schemas.Repo, fields)
+            if fields is not None
+            else self._bind(parse_repo_data)
+        )
+        paginated_list = parse_paginated_list_data(data, parser)
+
+        return PaginatedList(
+            paginated_list.count,
+            paginated_list.results,
+            paginated_list.total_pages,
+            parser,
+            paginated_list.next,
+            paginated_list.previous,
+            context=self._context,
+        )
+
+    async def iter_repo_list(
+        self,
+        service: Service,
+        owner_username: str,
+        active: bool | None = None,
+        names: str | None = None,
+        page_size: int | None = None,
+        search: str | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> AsyncIterator[schemas.Repo]:
+        """
+        Iterate over every repository for the specified provider service and owner
+        username, page by page.
+
+        Args:
+            service: git hosting service provider.
+            owner_username: username from service provider.
+            active: whether the repository has received an upload.
+            names: list of repository names.
+            page_size: number of results to return per page.
+            search: a search term.
+            fields: fields to parse, like `("name", "totals.coverage")`. The other
+                fields are `None`. `None` parses every field.
 
-            if response.ok:
-                paginated_list = parse_paginated_list_data(data, parse_repo_data)
+        Yields:
+            A `Repo`.
 
-                return PaginatedList(
-                    paginated_list.count,
-                    paginated_list.results,
-                    paginated_list.total_pages,
-                    parse_repo_data,
-                    paginated_list.next,
-                    paginated_list.previous,
-                    self._token,
-                    self._session,
-                )
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Service
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         async for repo in codecov.repos.iter_repo_list(
+            ...             Service.GITHUB, "jazzband"
+            ...         ):
+            ...             print(repo)
+            >>> asyncio.run(main())
+            Repo(...)
+            ...
+        """
+        repos = await self.get_repo_list(
+            service,
+            owner_username,
+            active,
+            names,
+            page_size=page_size,
+            search=search,
+            fields=fields,
+        )
 
-            raise CodecovError(data)
+        async for repo in repos:
+            yield repo
 
     async def get_repo_detail(
-        self, service: Service, owner_username: str, repo_name: str
+        self,
+        service: Service,
+        owner_username: str,
+        repo_name: str,
+        fields: Iterable[str] | None = None,
     ) -> schemas.Repo:
         """
         Get a single repository by name.
@@ -95,6 +164,8 @@ class Repo(API):
             service: git hosting service provider.
             owner_username: username from service provider.
             repo_name: repository name.
+            fields: fields to parse, like `("name", "totals.coverage")`. The other
+                fields are `None`. `None` parses every field.
 
         Returns:
             A `Repo`.
@@ -112,15 +183,108 @@ class Repo(API):
             >>> asyncio.run(main())
             Repo(...)
         """
-        async with self._session.get(
-            f"{self.api_url}/{service}/{owner_username}/repos/{repo_name}/"
-        ) as response:
-            data = await response.json()
+        return await self._get_cached(
+            "repo_detail",
+            Projection(schemas.Repo, fields) if fields is not None else parse_repo_data,
+            f"{self.api_url}/{service}/{owner_username}/repos/{repo_name}/",
+        )
 
-            if response.ok:
-                return parse_repo_data(data)
+    async def get_repo_details_many(
+        self,
+        service: Service,
+        owner_username: str,
+        repo_names: Iterable[str],
+        concurrency: int = 4,
+        fields: Iterable[str] | None = None,
+    ) -> list[BulkResult[schemas.Repo]]:
+        """
+        Get many repositories by name, with at most `concurrency` requests at the
+        same time. A repository that can't be fetched gets its error in its result
+        instead of failing the others.
 
-            raise CodecovError(data)
+        Args:
+            service: git hosting service provider.
+            owner_username: username from service provider.
+            repo_names: repository names.
+            concurrency: maximum number of repositories requested at the same time.
+            fields: fields to parse, like `("name", "totals.coverage")`. The other
+                fields are `None`. `None` parses every field.
+
+        Returns:
+            A `BulkResult` of `Repo` per repository name, in the order of
+            `repo_names`.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Service
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         results = await codecov.repos.get_repo_details_many(
+            ...             Service.GITHUB, "jazzband", ["django-silk", "pip-tools"]
+            ...         )
+            ...         for result in results:
+            ...             print(result.value if result.ok else result.error)
+            >>> asyncio.run(main())
+            Repo(...)
+            ...
+        """
+        return await _fetch_many(
+            repo_names,
+            lambda repo_name: self.get_repo_detail(
+                service, owner_username, repo_name, fields
+            ),
+            concurrency,
+        )
+
+    async def iter_repo_details_many(
+        self,
+        service: Service,
+        owner_username: str,
+        repo_names: Iterable[str],
+        concurrency: int = 4,
+        fields: Iterable[str] | None = None,
+    ) -> AsyncIterator[BulkResult[schemas.Repo]]:
+        """
+        Iterate over many repositories by name as they are fetched, with at most
+        `concurrency` requests at the same time. A repository that can't be fetched
+        gets its error in its result instead of failing the others.
+
+        Args:
+            service: git hosting service provider.
+            owner_username: username from service provider.
+            repo_names: repository names.
+            concurrency: maximum number of repositories requested at the same time.
+            fields: fields to parse, like `("name", "totals.coverage")`. The other
+                fields are `None`. `None` parses every field.
+
+        Yields:
+            A `BulkResult` of `Repo`, in completion order.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Service
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         async for result in codecov.repos.iter_repo_details_many(
+            ...             Service.GITHUB, "jazzband", ["django-silk", "pip-tools"]
+            ...         ):
+            ...             print(result.ok)
+            >>> asyncio.run(main())
+            True
+            True
+        """
+        async for result in _iter_many(
+            repo_names,
+            lambda repo_name: self.get_repo_detail(
+                service, owner_username, repo_name, fields
+            ),
+            concurrency,
+        ):
+            yield result
 
     async def get_repo_config(
         self,
@@ -153,12 +317,8 @@ class Repo(API):
             >>> asyncio.run(main())
             RepoConfig(...)
         """
-        async with self._session.get(
-            f"{self.api_url}/{service}/{owner_username}/repos/{repo_name}/config/"
-        ) as response:
-            data = await response.json()
-
-            if response.ok:
-                return parse_repo_config_data(data)
-
-            raise CodecovError(data)
+        return await self._get_cached(
+            "repo_config",
+            parse_repo_config_data,
+            f"{self.api_url}/{service}/{owner_username}/repos/{repo_name}/config/",
+        )
@@ -0,0 +1,182 @@
+from functools import partial
+from typing import Any, Callable
+
+from .. import schemas
+from ..enums import Service
+from ..parsers import parse_commit_coverage_report_data, parse_report_file_data
+from .api import API
+
+__all__ = ["Report"]
+
+# Partials have no return annotation, so like projections they are never replaced
+# by the scheduler `schema_decoder`, which would decode lines into a list of `Line`
+_parse_compact_commit_coverage_report_data = partial(
+    parse_commit_coverage_report_data, compact=True
+)
+_parse_compact_report_file_data = partial(parse_report_file_data, compact=True)
+
+
+class Report(API):
+    """
+    Report API Wrapper from Codecov API.
+    """
+
+    async def get_report(
+        self,
+        service: Service,
+        owner_username: str,
+        repo_name: str,
+        path: str | None = None,
+        branch: str | None = None,
+        sha: str | None = None,
+        flag: str | None = None,
+        component_id: str | None = None,
+        compact: bool = False,
+    ) -> schemas.CommitCoverageReport:
+        """
+        Get the line-by-line coverage report of a commit, for every file or for the
+        files under a path prefix.
+
+        Args:
+            service: git hosting service provider.
+            owner_username: username from service provider.
+            repo_name: repository name.
+            path: path prefix of the reported files, `None` reports every file.
+            branch: branch name, its head commit is reported.
+            sha: commit SHA, `None` reports the head commit of `branch`, or of the
+                default branch.
+            flag: flag name, to only report the coverage of this flag.
+            component_id: component id, to only report the coverage of this
+                component.
+            compact: whether to store the line coverage of every file in a
+                `LineCoverageArray` instead of a list of `Line`. The response is
+                then never decoded with the scheduler `schema_decoder`.
+
+        Returns:
+            A `CommitCoverageReport`.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Service
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         report = await codecov.reports.get_report(
+            ...             Service.GITHUB, "jazzband", "django-silk", path="silk/"
+            ...         )
+            ...         print(report)
+            >>> asyncio.run(main())
+            CommitCoverageReport(...)
+        """
+        params = {}
+        optional_params = {
+            "path": path,
+            "branch": branch,
+            "sha": sha,
+            "flag": flag,
+            "component_id": component_id,
+        }
+
+        params.update({k: v for k, v in optional_params.items() if v is not None})
+
+        parser: Callable[[dict[str, Any]], schemas.CommitCoverageReport] = (
+            _parse_compact_commit_coverage_report_data
+            if compact
+            else parse_commit_coverage_report_data
+        )
+
+        return await self._get_cached(
+            "report",
+            parser,
+            f"{self.api_url}/{service}/{owner_username}/repos/{repo_name}/report/",
+            params=params,
+        )
+
+    async def get_file_report(
+        self,
+        service: Service,
+        owner_username: str,
+        repo_name: str,
+        path: str,
+        branch: str | None = None,
+        sha: str | None = None,
+        line_range: range | None = None,
+        compact: bool = False,
+    ) -> schemas.ReportFile:
+        """
+        Get the line-by-line coverage report of a single file.
+
+        Args:
+            service: git hosting service provider.
+            owner_username: username from service provider.
+            repo_name: repository name.
+            path: file path.
+            branch: branch name, its head commit is reported.
+            sha: commit SHA, `None` reports the head commit of `branch`, or of the
+                default branch.
+            line_range: line numbers to keep, like `range(120, 170)` for a diff
+                hunk, the other lines are never parsed. `None` keeps every line.
+                A sliced report is neither read from nor stored in the scheduler
+                `cache`, and its response is decoded as plain json instead of
+                with the scheduler `schema_decoder`. The scheduler `strings` are
+                still used.
+            compact: whether to store the line coverage in a `LineCoverageArray`
+                instead of a list of `Line`. The response is then never decoded
+                with the scheduler `schema_decoder`.
+
+        Returns:
+            A `ReportFile`.
+
+        Raises:
+            ValueError: if the step of `line_range` isn't 1.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> from pycodecov import Codecov
+            >>> from pycodecov.enums import Service
+            >>> async def main():
+            ...     async with Codecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+            ...         report_file = await codecov.reports.get_file_report(
+            ...             Service.GITHUB,
+            ...             "jazzband",
+            ...             "django-silk",
+            ...             "silk/models.py",
+            ...             line_range=range(1, 51),
+            ...         )
+            ...         print(report_file)
+            >>> asyncio.run(main())
+            ReportFile(...)
+        """
+        if line_range is not None and line_range.step != 1:
+            raise ValueError("line_range step must be 1")
+
+        params = {}
+        optional_params = {
+            "branch": branch,
+            "sha": sha,
+        }
+
+        params.update({k: v for k, v in optional_params.items() if v is not None})
+
+        url = (
+            f"{self.api_url}/{service}/{owner_username}/repos/{repo_name}"
+            f"/file_report/{path}"
+        )
+
+        if line_range is not None:
+            # A parser per range would never be hit in the cache, so the response
+            # cache and the schema decoder of `_get_cached` are bypassed
+            return parse_report_file_data(
+                await self._get(url, params=params),
+                compact,
+                self._scheduler.strings,
+                line_range,
+            )
+
+        parser: Callable[[dict[str, Any]], schemas.ReportFile] = (
+            _parse_compact_report_file_data if compact else parse_report_file_data
+        )
+
+        return await self._get_cached("file_report", parser, url, params=params)
@@ -0,0 +1,87 @@
+import asyncio
+import random
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from aiohttp import ClientConnectionError, ClientPayloadError
+
+__all__ = ["RetryEvent", "RetryPolicy"]
+
+
+@dataclass(slots=True, frozen=True)
+class RetryEvent:
+    """
+    A schema used to store info about a request that is going to be retried.
+
+    Attributes:
+        url: request url.
+        attempt: number of the attempt that failed, starting at `1`.
+        delay: seconds to wait before the next attempt.
+        status: response status code that triggered the retry, if any.
+        exception: exception that triggered the retry, if any.
+    """
+
+    url: str
+    attempt: int
+    delay: float
+    status: int | None
+    exception: BaseException | None
+
+
+@dataclass(slots=True, frozen=True)
+class RetryPolicy:
+    """
+    Retry policy applied to transient request failures.
+
+    The delay before attempt `n + 1` is `min(backoff_cap, backoff_base * 2 ** (n - 1))`,
+    drawn uniformly between `0` and that value when `jitter` is enabled (full jitter).
+
+    Attributes:
+        max_attempts: maximum number of attempts of a request, including the first
+            one.
+        backoff_base: seconds of the first backoff delay.
+        backoff_cap: maximum seconds of a backoff delay.
+        jitter: whether to randomize delays with full jitter.
+        retry_statuses: response status codes that are retried.
+        retry_exceptions: exception types that are retried.
+        hooks: callables called with a `RetryEvent` before each retry. Awaitable
+            results are awaited.
+
+    Examples:
+    >>> policy = RetryPolicy(backoff_base=0.5, backoff_cap=4, jitter=False)
+    >>> [policy.get_delay(attempt) for attempt in range(1, 6)]
+    [0.5, 1.0, 2.0, 4, 4]
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_cap: float = 30.0
+    jitter: bool = True
+    retry_statuses: frozenset[int] = frozenset({500, 502, 503, 504})
+    retry_exceptions: tuple[type[BaseException], ...] = (
+        ClientConnectionError,
+        ClientPayloadError,
+        asyncio.TimeoutError,
+    )
+    hooks: tuple[Callable[[RetryEvent], Any], ...] = field(default=())
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+    def get_delay(self, attempt: int) -> float:
+        """
+        Get the delay to wait after a failed attempt.
+
+        Args:
+            attempt: number of the attempt that failed, starting at `1`.
+
+        Returns:
+            Seconds to wait before the next attempt.
+        """
+        delay = min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+
+        if self.jitter:
+            return random.uniform(0, delay)  # nosec B311
+
+        return delay
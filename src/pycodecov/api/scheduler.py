@@ -0,0 +1,369 @@
+import asyncio
+import inspect
+import time
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Hashable, Mapping
+
+from aiohttp import ClientResponse, ClientSession
+
+from ..exceptions import CodecovError
+from ..parsers import SchemaDecoder, StringTable
+from ..types import JsonLoads
+from .cache import ResponseCache
+from .decoder import default_json_loads
+from .http_cache import HttpCache, HttpCacheEntry
+from .retry import RetryEvent, RetryPolicy
+
+__all__ = ["RequestScheduler"]
+
+# `X-RateLimit-Reset` above this is an epoch timestamp (2001-09-09 onwards), below
+# it is a number of seconds to wait, no reset is that many seconds away
+_EPOCH_RESET_THRESHOLD = 1_000_000_000
+
+
+class RequestScheduler:
+    """
+    Request scheduler shared by every API wrapper of a client.
+
+    Requests wait for a token of a token bucket before being sent, so concurrent
+    crawls are queued at a sustainable rate instead of tripping the rate limit.
+    A response with status 429 pauses every queued request for the `Retry-After`
+    duration and is sent again, and an exhausted `X-RateLimit-Remaining` pauses
+    every queued request until `X-RateLimit-Reset`. Transient failures are retried
+    with backoff according to `retry_policy`.
+
+    Args:
+        rate: number of requests allowed per second, `None` means no limit.
+        burst: maximum number of requests sent back to back.
+        max_requeues: number of times a rate limited request is sent again before
+            its error is raised.
+        default_retry_after: seconds to wait when a rate limited response doesn't
+            tell how long to wait.
+        retry_policy: policy used to retry transient failures, `None` disables
+            retries.
+        cache: cache of parsed responses of read endpoints, `None` disables
+            caching.
+        http_cache: persistent cache of response bodies revalidated with
+            conditional requests, `None` disables it.
+        coalesce: whether identical requests in flight at the same time share one
+            request and one parse. Every waiter gets the same result object or
+            exception, and the request is cancelled once every waiter is.
+        json_loads: function used to decode response bodies, `None` uses
+            `orjson.loads` when `orjson` is installed, otherwise `json.loads`.
+        schema_decoder: decoder used by detail endpoints to decode response bodies
+            straight into schemas, `None` decodes them with `json_loads` and parses
+            them with the `parse_*_data` functions.
+        strings: table interning the identifiers of parsed schemas, like usernames,
+            branches and file paths, `None` keeps them as decoded. Ignored by
+            `schema_decoder` and by projections.
+
+    Examples:
+    >>> import asyncio
+    >>> import os
+    >>> from pycodecov import Codecov
+    >>> from pycodecov.api import RetryPolicy
+    >>> from pycodecov.enums import Service
+    >>> async def main():
+    ...     scheduler = RequestScheduler(
+    ...         rate=5, burst=10, retry_policy=RetryPolicy(max_attempts=5)
+    ...     )
+    ...     async with Codecov(
+    ...         os.environ["CODECOV_API_TOKEN"], scheduler=scheduler
+    ...     ) as codecov:
+    ...         print(await codecov.get_service_owners(Service.GITHUB))
+    >>> asyncio.run(main())
+    PaginatedListApi(...)
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: int = 1,
+        max_requeues: int = 5,
+        default_retry_after: float = 1.0,
+        retry_policy: RetryPolicy | None = None,
+        cache: ResponseCache | None = None,
+        http_cache: HttpCache | None = None,
+        coalesce: bool = True,
+        json_loads: JsonLoads | None = None,
+        schema_decoder: SchemaDecoder | None = None,
+        strings: StringTable | None = None,
+    ) -> None:
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be greater than 0")
+
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self.max_requeues = max_requeues
+        self.default_retry_after = default_retry_after
+        self.retry_policy = retry_policy
+        self.cache = cache
+        self.http_cache = http_cache
+        self.coalesce = coalesce
+        self.json_loads = json_loads if json_loads is not None else default_json_loads
+        self.schema_decoder = schema_decoder
+        self.strings = strings
+
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+        self._in_flight: dict[Hashable, asyncio.Future[Any]] = {}
+        self._waiters: dict[asyncio.Future[Any], int] = {}
+
+    async def acquire(self) -> None:
+        """
+        Wait until a request is allowed to be sent. Waiting requests are served in
+        the order they arrive.
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+
+                if self._paused_until > now:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                if self.rate is None:
+                    return
+
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, delay: float) -> None:
+        """
+        Hold every request for the given amount of time.
+
+        Args:
+            delay: seconds to wait before sending the next request.
+        """
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+
+    def update(self, status: int, headers: Mapping[str, str]) -> float | None:
+        """
+        Update the schedule from the rate limit information of a response.
+
+        Args:
+            status: response status code.
+            headers: response headers.
+
+        Returns:
+            Seconds to wait before the request is sent again if it was rate limited,
+            otherwise `None`.
+        """
+        if status == 429:
+            delay = _parse_retry_after(headers, "Retry-After")
+            if delay is None:
+                delay = self.default_retry_after
+
+            self.pause(delay)
+
+            return delay
+
+        remaining = _parse_number(headers, "X-RateLimit-Remaining")
+        if remaining is not None and remaining <= 0:
+            reset = _parse_number(headers, "X-RateLimit-Reset")
+            if reset is not None:
+                self.pause(
+                    reset - time.time() if reset > _EPOCH_RESET_THRESHOLD else reset
+                )
+
+        return None
+
+    async def run_once[T](
+        self, key: Hashable, factory: Callable[[], Awaitable[T]]
+    ) -> T:
+        """
+        Run an operation once for every concurrent caller using the same key.
+
+        Args:
+            key: key identifying the operation.
+            factory: function that starts the operation.
+
+        Returns:
+            The result of the operation.
+        """
+        if not self.coalesce:
+            return await factory()
+
+        future = self._in_flight.get(key)
+
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+            # Mark the exception as retrieved even if every waiter was cancelled
+            future.add_done_callback(
+                lambda future: future.cancelled() or future.exception()
+            )
+
+        self._waiters[future] = self._waiters.get(future, 0) + 1
+
+        try:
+            # A cancelled waiter must not cancel the operation shared with the others
+            return await asyncio.shield(future)
+        finally:
+            waiters = self._waiters.pop(future) - 1
+
+            if waiters:
+                self._waiters[future] = waiters
+            elif not future.done():
+                # Nobody waits for the result anymore, like a cancelled prefetch
+                future.cancel()
+
+    async def get(
+        self,
+        session: ClientSession,
+        url: str,
+        decoder: Callable[[bytes], Any] | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Send a scheduled GET request.
+
+        Args:
+            session: client session used to send the request.
+            url: request url.
+            decoder: function used to decode the raw body of a successful response,
+                `None` decodes it with `json_loads`.
+            **kwargs: extra arguments passed to `ClientSession.get`.
+
+        Returns:
+            The decoded data of the response.
+
+        Raises:
+            CodecovError: if the response status is not ok.
+        """
+        retry_policy = self.retry_policy
+        retry_exceptions = retry_policy.retry_exceptions if retry_policy else ()
+        requeues = 0
+        attempt = 1
+
+        http_cache = self.http_cache
+        cache_key = None
+        entry = None
+        if http_cache is not None:
+            cache_key = http_cache.make_key(session, url, kwargs.get("params"))
+            entry = await http_cache.get(cache_key)
+
+            if entry is not None:
+                kwargs["headers"] = {
+                    **kwargs.get("headers", {}),
+                    **entry.get_conditional_headers(),
+                }
+
+        while True:
+            await self.acquire()
+
+            try:
+                async with session.get(url, **kwargs) as response:
+                    if (
+                        self.update(response.status, response.headers) is not None
+                        and requeues < self.max_requeues
+                    ):
+                        requeues += 1
+                        continue
+
+                    if (
+                        retry_policy is None
+                        or attempt >= retry_policy.max_attempts
+                        or response.status not in retry_policy.retry_statuses
+                    ):
+                        if entry is not None and response.status == 304:
+                            return (decoder or self.json_loads)(entry.body)
+
+                        data = await _read_response(response, self.json_loads, decoder)
+
+                        if http_cache is not None and (
+                            "ETag" in response.headers
+                            or "Last-Modified" in response.headers
+                        ):
+                            await http_cache.set(
+                                cache_key,
+                                HttpCacheEntry(
+                                    response.headers.get("ETag"),
+                                    response.headers.get("Last-Modified"),
+                                    await response.read(),
+                                ),
+                            )
+
+                        return data
+
+                    event = RetryEvent(
+                        url,
+                        attempt,
+                        retry_policy.get_delay(attempt),
+                        response.status,
+                        None,
+                    )
+            except retry_exceptions as exc:
+                if retry_policy is None or attempt >= retry_policy.max_attempts:
+                    raise
+
+                event = RetryEvent(
+                    url, attempt, retry_policy.get_delay(attempt), None, exc
+                )
+
+            for hook in retry_policy.hooks:
+                result = hook(event)
+                if inspect.isawaitable(result):
+                    await result
+
+            await asyncio.sleep(event.delay)
+            attempt += 1
+
+
+async def _read_response(
+    response: ClientResponse,
+    json_loads: JsonLoads,
+    decoder: Callable[[bytes], Any] | None = None,
+) -> Any:
+    if decoder is not None and response.ok:
+        return decoder(await response.read())
+
+    data = await response.json(loads=json_loads)
+
+    if response.ok:
+        return data
+
+    raise CodecovError(data)
+
+
+def _parse_number(headers: Mapping[str, str], name: str) -> float | None:
+    if name not in headers:
+        return None
+
+    try:
+        return float(headers[name])
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_retry_after(headers: Mapping[str, str], name: str) -> float | None:
+    delay = _parse_number(headers, name)
+    if delay is not None or name not in headers:
+        return delay
+
+    # Retry-After can also be an HTTP date
+    try:
+        date = parsedate_to_datetime(headers[name])
+    except (TypeError, ValueError):
+        return None
+
+    # HTTP dates are in GMT, a `-0000` zone is parsed as a naive datetime
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return max(0.0, date.timestamp() - time.time())
@@ -0,0 +1,186 @@
+import asyncio
+import functools
+import inspect
+import threading
+from traceback import TracebackException
+from types import TracebackType
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Self
+
+from ..types import CodecovApiToken
+from .api import API
+from .codecov import Codecov
+from .connector import ConnectorConfig
+from .scheduler import RequestScheduler
+
+__all__ = ["SyncCodecov"]
+
+
+class _SyncApi:
+    """
+    Blocking view of an API wrapper. Coroutine methods block until their result
+    is ready, async generator methods return generators, and API wrappers
+    returned by them get a blocking view as well.
+    """
+
+    __slots__ = ("_api", "_run")
+
+    def __init__(self, api: Any, run: Callable[[Awaitable[Any]], Any]) -> None:
+        self._api = api
+        self._run = run
+
+    def __getattr__(self, name: str) -> Any:
+        # Not through `self._api`, which would call `__getattr__` again when unset
+        api = object.__getattribute__(self, "_api")
+
+        return _wrap(getattr(api, name), self._run)
+
+    def __repr__(self) -> str:
+        return repr(self._api)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _SyncApi):
+            other = other._api
+
+        return self._api == other
+
+    def __hash__(self) -> int:
+        # Equal to the wrapped object, so it has to hash the same
+        return hash(self._api)
+
+    def __len__(self) -> int:
+        return len(self._api)
+
+    def __getitem__(self, index: Any) -> Any:
+        return _wrap(self._api[index], self._run)
+
+    def __iter__(self) -> Iterator[Any]:
+        for value in self._api:
+            yield _wrap(value, self._run)
+
+
+class SyncCodecov(_SyncApi):
+    """
+    Blocking Codecov API wrapper for synchronous code.
+
+    The client owns an event loop running in a background thread and one pooled
+    session, so every call reuses the same connections. Every method of `Codecov`
+    and of the API wrappers it returns is exposed as a blocking method, and async
+    generators like `iter_repo_list` as generators. Calls may be made from many
+    threads at the same time.
+
+    Args:
+        token: Codecov API Token.
+        connector: connection pool configuration of the session.
+        scheduler: request scheduler.
+
+    Examples:
+        >>> import os
+        >>> from pycodecov.enums import Service
+        >>> with SyncCodecov(os.environ["CODECOV_API_TOKEN"]) as codecov:
+        ...     repo = codecov.repos.get_repo_detail(
+        ...         Service.GITHUB, "jazzband", "django-silk"
+        ...     )
+        ...     for branch in codecov.branches.iter_branch_list(
+        ...         Service.GITHUB, "jazzband", "django-silk"
+        ...     ):
+        ...         print(branch)
+        Branch(...)
+        ...
+    """
+
+    __slots__ = ("_loop", "_thread")
+
+    def __init__(
+        self,
+        token: CodecovApiToken | None = None,
+        connector: ConnectorConfig | None = None,
+        scheduler: RequestScheduler | None = None,
+    ) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="pycodecov", daemon=True
+        )
+        self._thread.start()
+
+        # The session must be created in the loop it is used from
+        async def create() -> Codecov:
+            return Codecov(token, connector=connector, scheduler=scheduler)
+
+        try:
+            codecov = self._run_coroutine(create())
+        except BaseException:
+            self._stop()
+            raise
+
+        super().__init__(codecov, self._run_coroutine)
+
+    def _run_coroutine[T](self, awaitable: Awaitable[T]) -> T:
+        return asyncio.run_coroutine_threadsafe(_await(awaitable), self._loop).result()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Exception,
+        exc_val: TracebackException,
+        traceback: TracebackType,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the session and stop the background event loop.
+        """
+        if self._loop.is_closed():
+            return
+
+        self._run_coroutine(self._api.close())
+        self._stop()
+
+    def _stop(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+async def _await[T](awaitable: Awaitable[T]) -> T:
+    return await awaitable
+
+
+def _wrap(value: Any, run: Callable[[Awaitable[Any]], Any]) -> Any:
+    if isinstance(value, API):
+        return _SyncApi(value, run)
+
+    if inspect.iscoroutinefunction(value):
+
+        @functools.wraps(value)
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return _wrap(run(value(*args, **kwargs)), run)
+
+        return call
+
+    if inspect.isasyncgenfunction(value):
+
+        @functools.wraps(value)
+        def iterate(*args: Any, **kwargs: Any) -> Iterator[Any]:
+            return _iterate(value(*args, **kwargs), run)
+
+        return iterate
+
+    return value
+
+
+def _iterate(
+    iterator: AsyncIterator[Any], run: Callable[[Awaitable[Any]], Any]
+) -> Iterator[Any]:
+    try:
+        while True:
+            try:
+                value = run(anext(iterator))
+            except StopAsyncIteration:
+                return
+
+            yield _wrap(value, run)
+    finally:
+        run(iterator.aclose())  # type: ignore[attr-defined]
@@ -4,10 +4,11 @@ from aiohttp import ClientSession
 
 from .. import schemas
 from ..enums import Service
-from ..exceptions import CodecovError
 from ..parsers import parse_user_data
 from ..types import CodecovApiToken
 from .api import API
+from .context import ClientContext
+from .scheduler import RequestScheduler
 
 __all__ = [
     "User",
@@ -31,8 +32,10 @@ class User(API, schemas.User):
         email: str | None = None,
         token: CodecovApiToken | None = None,
         session: ClientSession | None = None,
+        scheduler: RequestScheduler | None = None,
+        context: ClientContext | None = None,
     ) -> None:
-        API.__init__(self, token, session)
+        API.__init__(self, token, session, scheduler=scheduler, context=context)
         schemas.User.__init__(
             self, service, user_username_or_ownerid, name, activated, is_admin, email
         )
@@ -62,19 +65,17 @@ class User(API, schemas.User):
             User(...)
             ...
         """
-        async with self._session.get(
-            f"{self.api_url}/{self.service}/{self.owner_username}/users/{self.username}"
-        ) as response:
-            data = await response.json()
-
-            if response.ok:
-                return parse_user_data(data)
-
-            raise CodecovError(data)
+        return await self._get_cached(
+            "user_detail",
+            parse_user_data,
+            f"{self.api_url}/{self.service}/{self.owner_username}/users/{self.username}",
+        )
 
 
 def parse_user_api(
     schema: schemas.User,
+    context: ClientContext | None = None,
+    *,
     token: CodecovApiToken | None = None,
     session: ClientSession | None = None,
     **kwargs: Any,
@@ -84,12 +85,16 @@ def parse_user_api(
 
     Args:
         schema: user data.
-        token: Codecov API Token.
-        session: client session.
+        context: client context shared with the API, `None` creates a new one.
+        token: Codecov API Token, only used without a context.
+        session: client session, only used without a context.
 
     Returns:
         An `User` API.
 
+    Raises:
+        ValueError: if `token` or `session` is given with a `context`.
+
     Examples:
     >>> import asyncio
     >>> async def main():
@@ -107,14 +112,31 @@ def parse_user_api(
     >>> asyncio.run(main())
     User(service=<Service.GITHUB: 'github'>, username='string', name='string', activated=True, is_admin=True, email='string')
     """
-    return User(
+    if context is None or token is not None or session is not None:
+        # The constructor creates the context or rejects the combination
+        return User(
+            schema.service,
+            kwargs["owner_username"],
+            schema.username,
+            schema.name,
+            schema.activated,
+            schema.is_admin,
+            schema.email,
+            token,
+            session,
+            context=context,
+        )
+
+    user = User._from_context(context)
+    schemas.User.__init__(
+        user,
         schema.service,
-        kwargs["owner_username"],
         schema.username,
         schema.name,
         schema.activated,
         schema.is_admin,
         schema.email,
-        token,
-        session,
     )
+    user.owner_username = kwargs["owner_username"]
+
+    return user
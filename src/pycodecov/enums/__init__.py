@@ -2,12 +2,17 @@
 Module to store common enum classes used by pycodecov.
 """
 
-from .commit_state import CommitState
-from .coverage import Coverage
-from .interval import Interval
-from .language import Language
-from .pull_state import PullState
-from .service import Service
+from typing import TYPE_CHECKING
+
+from .._lazy import make_lazy_dir, make_lazy_getattr
+
+if TYPE_CHECKING:
+    from .commit_state import CommitState
+    from .coverage import Coverage
+    from .interval import Interval
+    from .language import Language
+    from .pull_state import PullState
+    from .service import Service
 
 __all__ = [
     "CommitState",
@@ -17,3 +22,16 @@ __all__ = [
     "PullState",
     "Service",
 ]
+
+_MODULES = {
+    "CommitState": ".commit_state",
+    "Coverage": ".coverage",
+    "Interval": ".interval",
+    "Language": ".language",
+    "PullState": ".pull_state",
+    "Service": ".service",
+}
+
+
+__getattr__ = make_lazy_getattr(__name__, _MODULES)
+__dir__ = make_lazy_dir(__name__, __all__)
@@ -1,43 +1,59 @@
-from .base_commit import parse_base_commit_data
-from .base_report import parse_base_report_file_data
-from .base_total import parse_base_total_data
-from .branch import parse_branch_data
-from .branch_detail import parse_branch_detail_data
-from .commit import parse_commit_data
-from .commit_comparison import parse_commit_comparison_data
-from .commit_coverage import parse_commit_coverage_data
-from .commit_coverage_report import parse_commit_coverage_report_data
-from .commit_coverage_total import parse_commit_coverage_total_data
-from .commit_detail import parse_commit_detail_data
-from .commit_total import parse_commit_total_data
-from .component import parse_component_data
-from .component_comparison import parse_component_comparison_data
-from .coverage_trend import parse_coverage_trend_data
-from .diff_comparison import parse_diff_comparison_data
-from .file_change_summary_comparison import parse_file_change_summary_comparison_data
-from .file_comparison import parse_file_comparison_data
-from .file_name_comparison import parse_file_name_comparison_data
-from .file_stat_comparison import parse_file_stat_comparison_data
-from .flag import parse_flag_data
-from .flag_comparison import parse_flag_comparison_data
-from .git_author import parse_git_author_data
-from .git_commit import parse_git_commit_data
-from .line import parse_line_data
-from .line_comparison import parse_line_comparison_data
-from .line_coverage_comparison import parse_line_coverage_comparison_data
-from .line_number_comparison import parse_line_number_comparison_data
-from .owner import parse_owner_data
-from .paginated_list import parse_paginated_list_data
-from .pull import parse_pull_data
-from .repo import parse_repo_data
-from .repo_config import parse_repo_config_data
-from .report import parse_report_data
-from .report_file import parse_report_file_data
-from .report_total import parse_report_total_data
-from .total_comparison import parse_total_comparison_data
-from .user import parse_user_data
+from typing import TYPE_CHECKING
+
+from .._lazy import make_lazy_dir, make_lazy_getattr
+
+if TYPE_CHECKING:
+    from .base_commit import parse_base_commit_data
+    from .base_report import parse_base_report_file_data
+    from .base_total import parse_base_total_data
+    from .branch import parse_branch_data
+    from .branch_detail import parse_branch_detail_data
+    from .commit import parse_commit_data
+    from .commit_comparison import parse_commit_comparison_data
+    from .commit_coverage import parse_commit_coverage_data
+    from .commit_coverage_report import parse_commit_coverage_report_data
+    from .commit_coverage_total import parse_commit_coverage_total_data
+    from .commit_detail import parse_commit_detail_data
+    from .commit_total import parse_commit_total_data
+    from .component import parse_component_data
+    from .component_comparison import parse_component_comparison_data
+    from .coverage_trend import parse_coverage_trend_data
+    from .coverage_trend_array import parse_coverage_trend_array_data
+    from .diff_comparison import parse_diff_comparison_data
+    from .file_change_summary_comparison import (
+        parse_file_change_summary_comparison_data,
+    )
+    from .file_comparison import parse_file_comparison_data
+    from .file_name_comparison import parse_file_name_comparison_data
+    from .file_stat_comparison import parse_file_stat_comparison_data
+    from .flag import parse_flag_data
+    from .flag_comparison import parse_flag_comparison_data
+    from .git_author import parse_git_author_data
+    from .git_commit import parse_git_commit_data
+    from .line import parse_line_data
+    from .line_comparison import parse_line_comparison_data
+    from .line_coverage_array import parse_line_coverage_array_data
+    from .line_coverage_comparison import parse_line_coverage_comparison_data
+    from .line_number_comparison import parse_line_number_comparison_data
+    from .owner import parse_owner_data
+    from .paginated_list import parse_paginated_list_data
+    from .projection import Projection
+    from .pull import parse_pull_data
+    from .repo import parse_repo_data
+    from .repo_config import parse_repo_config_data
+    from .report import parse_report_data
+    from .report_file import parse_report_file_data
+    from .report_total import parse_report_total_data
+    from .schema_decoder import SchemaDecoder
+    from .string_table import StringTable
+    from .timestamp import parse_timestamp_data
+    from .total_comparison import parse_total_comparison_data
+    from .user import parse_user_data
 
 __all__ = [
+    "Projection",
+    "SchemaDecoder",
+    "StringTable",
     "parse_base_commit_data",
     "parse_base_report_file_data",
     "parse_base_total_data",
@@ -53,6 +69,7 @@ __all__ = [
     "parse_component_data",
     "parse_component_comparison_data",
     "parse_coverage_trend_data",
+    "parse_coverage_trend_array_data",
     "parse_diff_comparison_data",
     "parse_file_change_summary_comparison_data",
     "parse_file_comparison_data",
@@ -64,6 +81,7 @@ __all__ = [
     "parse_git_commit_data",
     "parse_line_data",
     "parse_line_comparison_data",
+    "parse_line_coverage_array_data",
     "parse_line_coverage_comparison_data",
     "parse_line_number_comparison_data",
     "parse_owner_data",
@@ -74,6 +92,58 @@ __all__ = [
     "parse_report_data",
     "parse_report_file_data",
     "parse_report_total_data",
+    "parse_timestamp_data",
     "parse_total_comparison_data",
     "parse_user_data",
 ]
+
+_MODULES = {
+    "parse_base_commit_data": ".base_commit",
+    "parse_base_report_file_data": ".base_report",
+    "parse_base_total_data": ".base_total",
+    "parse_branch_data": ".branch",
+    "parse_branch_detail_data": ".branch_detail",
+    "parse_commit_data": ".commit",
+    "parse_commit_comparison_data": ".commit_comparison",
+    "parse_commit_coverage_data": ".commit_coverage",
+    "parse_commit_coverage_report_data": ".commit_coverage_report",
+    "parse_commit_coverage_total_data": ".commit_coverage_total",
+    "parse_commit_detail_data": ".commit_detail",
+    "parse_commit_total_data": ".commit_total",
+    "parse_component_data": ".component",
+    "parse_component_comparison_data": ".component_comparison",
+    "parse_coverage_trend_data": ".coverage_trend",
+    "parse_coverage_trend_array_data": ".coverage_trend_array",
+    "parse_diff_comparison_data": ".diff_comparison",
+    "parse_file_change_summary_comparison_data": ".file_change_summary_comparison",
+    "parse_file_comparison_data": ".file_comparison",
+    "parse_file_name_comparison_data": ".file_name_comparison",
+    "parse_file_stat_comparison_data": ".file_stat_comparison",
+    "parse_flag_data": ".flag",
+    "parse_flag_comparison_data": ".flag_comparison",
+    "parse_git_author_data": ".git_author",
+    "parse_git_commit_data": ".git_commit",
+    "parse_line_data": ".line",
+    "parse_line_comparison_data": ".line_comparison",
+    "parse_line_coverage_array_data": ".line_coverage_array",
+    "parse_line_coverage_comparison_data": ".line_coverage_comparison",
+    "parse_line_number_comparison_data": ".line_number_comparison",
+    "parse_owner_data": ".owner",
+    "parse_paginated_list_data": ".paginated_list",
+    "Projection": ".projection",
+    "parse_pull_data": ".pull",
+    "parse_repo_data": ".repo",
+    "parse_repo_config_data": ".repo_config",
+    "parse_report_data": ".report",
+    "parse_report_file_data": ".report_file",
+    "parse_report_total_data": ".report_total",
+    "SchemaDecoder": ".schema_decoder",
+    "StringTable": ".string_table",
+    "parse_timestamp_data": ".timestamp",
+    "parse_total_comparison_data": ".total_comparison",
+    "parse_user_data": ".user",
+}
+
+
+__getattr__ = make_lazy_getattr(__name__, _MODULES)
+__dir__ = make_lazy_dir(__name__, __all__)
@@ -1,17 +1,21 @@
-from datetime import datetime
 from typing import Any
 
 from ..schemas import BaseCommit
+from .string_table import StringTable
+from .timestamp import parse_timestamp_data
 
 __all__ = ["parse_base_commit_data"]
 
 
-def parse_base_commit_data(data: dict[str, Any]) -> BaseCommit:
+def parse_base_commit_data(
+    data: dict[str, Any], strings: StringTable | None = None
+) -> BaseCommit:
     """
     Parse base commit data.
 
     Args:
         data: base commit json data.
+        strings: table interning the identifiers, `None` keeps them as decoded.
 
     Returns:
         A `BaseCommit` schema.
@@ -30,4 +34,7 @@ def parse_base_commit_data(data: dict[str, Any]) -> BaseCommit:
     message = data.get("message")
     timestamp = data.get("timestamp")
 
-    return BaseCommit(commitid, message, datetime.fromisoformat(timestamp))
+    if strings is not None:
+        commitid = strings(commitid)
+
+    return BaseCommit(commitid, message, parse_timestamp_data(timestamp))
@@ -2,16 +2,20 @@ from typing import Any
 
 from ..schemas import BaseReportFile
 from .report_total import parse_report_total_data
+from .string_table import StringTable
 
 __all__ = ["parse_base_report_file_data"]
 
 
-def parse_base_report_file_data(data: dict[str, Any]) -> BaseReportFile:
+def parse_base_report_file_data(
+    data: dict[str, Any], strings: StringTable | None = None
+) -> BaseReportFile:
     """
     Parse base report file data.
 
     Args:
         data: base report file json data.
+        strings: table interning the identifiers, `None` keeps them as decoded.
 
     Returns:
         A `BaseReportFile` schema.
@@ -43,4 +47,7 @@ def parse_base_report_file_data(data: dict[str, Any]) -> BaseReportFile:
     name = data.get("name")
     totals = data.get("totals")
 
+    if strings is not None:
+        name = strings(name)
+
     return BaseReportFile(name, parse_report_total_data(totals))
@@ -1,17 +1,21 @@
-from datetime import datetime
 from typing import Any
 
 from ..schemas import Branch
+from .string_table import StringTable
+from .timestamp import parse_timestamp_data
 
 __all__ = ["parse_branch_data"]
 
 
-def parse_branch_data(data: dict[str, Any]) -> Branch:
+def parse_branch_data(
+    data: dict[str, Any], strings: StringTable | None = None
+) -> Branch:
     """
     Parse branch data.
 
     Args:
         data: branch json data.
+        strings: table interning the identifiers, `None` keeps them as decoded.
 
     Returns:
         A `Branch` schema.
@@ -28,4 +32,7 @@ def parse_branch_data(data: dict[str, Any]) -> Branch:
     name = data.get("name")
     updatestamp = data.get("updatestamp")
 
-    return Branch(name, datetime.fromisoformat(updatestamp))
+    if strings is not None:
+        name = strings(name)
+
+    return Branch(name, parse_timestamp_data(updatestamp))
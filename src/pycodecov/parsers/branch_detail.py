@@ -3,16 +3,22 @@ from typing import Any
 from ..schemas import BranchDetail
 from .branch import parse_branch_data
 from .commit_detail import parse_commit_detail_data
+from .string_table import StringTable
 
 __all__ = ["parse_branch_detail_data"]
 
 
-def parse_branch_detail_data(data: dict[str, Any]) -> BranchDetail:
+def parse_branch_detail_data(
+    data: dict[str, Any], lazy: bool = False, strings: StringTable | None = None
+) -> BranchDetail:
     """
     Parse branch detail data.
 
     Args:
         data: branch detail json data.
+        lazy: whether to parse the head commit report on first attribute access
+            instead, with a `LazyReport`.
+        strings: table interning the identifiers, `None` keeps them as decoded.
 
     Returns:
         An `BranchDetail` schema.
@@ -90,11 +96,13 @@ def parse_branch_detail_data(data: dict[str, Any]) -> BranchDetail:
     >>> branch_detail
     BranchDetail(name='string', updatestamp=datetime.datetime(...), head_commit=CommitDetail(...))
     """
-    branch = parse_branch_data(data)
+    branch = parse_branch_data(data, strings)
 
     name = branch.name
     updatestamp = branch.updatestamp
 
     head_commit = data.get("head_commit")
 
-    return BranchDetail(name, updatestamp, parse_commit_detail_data(head_commit))
+    return BranchDetail(
+        name, updatestamp, parse_commit_detail_data(head_commit, lazy, strings)
+    )
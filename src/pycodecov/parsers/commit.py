@@ -5,16 +5,20 @@ from ..schemas import Commit
 from .base_commit import parse_base_commit_data
 from .commit_total import parse_commit_total_data
 from .owner import parse_owner_data
+from .string_table import StringTable
 
 __all__ = ["parse_commit_data"]
 
 
-def parse_commit_data(data: dict[str, Any]) -> Commit:
+def parse_commit_data(
+    data: dict[str, Any], strings: StringTable | None = None
+) -> Commit:
     """
     Parse commit data.
 
     Args:
         data: commit json data.
+        strings: table interning the identifiers, `None` keeps them as decoded.
 
     Returns:
         A `Commit` schema.
@@ -35,7 +39,7 @@ def parse_commit_data(data: dict[str, Any]) -> Commit:
     >>> commit
     Commit(commitid='string', message='string', timestamp=datetime.datetime(...), ci_passed=True, author=None, branch='string', totals=None, state=None, parent='string')
     """
-    base_commit = parse_base_commit_data(data)
+    base_commit = parse_base_commit_data(data, strings)
 
     commitid = base_commit.commitid
     message = base_commit.message
@@ -48,12 +52,16 @@ def parse_commit_data(data: dict[str, Any]) -> Commit:
     state = data.get("state")
     parent = data.get("parent")
 
+    if strings is not None:
+        branch = strings(branch)
+        parent = strings(parent)
+
     return Commit(
         commitid,
         message,
         timestamp,
         ci_passed,
-        parse_owner_data(author) if author is not None else author,
+        parse_owner_data(author, strings) if author is not None else author,
         branch,
         parse_commit_total_data(totals) if totals is not None else totals,
         CommitState(state) if state is not None else state,
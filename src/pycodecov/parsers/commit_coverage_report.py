@@ -3,16 +3,22 @@ from typing import Any
 from ..schemas import CommitCoverageReport
 from .commit_coverage import parse_commit_coverage_data
 from .report_file import parse_report_file_data
+from .string_table import StringTable
 
 __all__ = ["parse_commit_coverage_report_data"]
 
 
-def parse_commit_coverage_report_data(data: dict[str, Any]) -> CommitCoverageReport:
+def parse_commit_coverage_report_data(
+    data: dict[str, Any], compact: bool = False, strings: StringTable | None = None
+) -> CommitCoverageReport:
     """
     Parse commit coverage report data.
 
     Args:
         data: commit coverage report json data.
+        compact: whether to store the line coverage of every file in a
+            `LineCoverageArray` instead of a list of `Line`.
+        strings: table interning the identifiers, `None` keeps them as decoded.
 
     Returns:
         A `CommitCoverageReport` schema.
@@ -48,5 +54,7 @@ def parse_commit_coverage_report_data(data: dict[str, Any]) -> CommitCoverageRep
     files = data.get("files")
 
     return CommitCoverageReport(
-        totals, commit_file_url, [parse_report_file_data(file) for file in files]
+        totals,
+        commit_file_url,
+        [parse_report_file_data(file, compact, strings) for file in files],
     )
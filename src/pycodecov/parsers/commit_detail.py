@@ -1,18 +1,24 @@
 from typing import Any
 
-from ..schemas import CommitDetail
+from ..schemas import CommitDetail, LazyReport
 from .commit import parse_commit_data
 from .report import parse_report_data
+from .string_table import StringTable
 
 __all__ = ["parse_commit_detail_data"]
 
 
-def parse_commit_detail_data(data: dict[str, Any]) -> CommitDetail:
+def parse_commit_detail_data(
+    data: dict[str, Any], lazy: bool = False, strings: StringTable | None = None
+) -> CommitDetail:
     """
     Parse commit detail data.
 
     Args:
         data: commit detail json data.
+        lazy: whether to parse the report on first attribute access instead, with a
+            `LazyReport`.
+        strings: table interning the identifiers, `None` keeps them as decoded.
 
     Returns:
         A `CommitDetail` schema.
@@ -72,7 +78,7 @@ def parse_commit_detail_data(data: dict[str, Any]) -> CommitDetail:
     >>> commit_detail
     CommitDetail(commitid='string', message='string', timestamp=datetime.datetime(...), ci_passed=True, author=None, branch='string', totals=None, state=None, parent='string', report=Report(...))
     """
-    commit = parse_commit_data(data)
+    commit = parse_commit_data(data, strings=strings)
 
     commitid = commit.commitid
     message = commit.message
@@ -85,6 +91,9 @@ def parse_commit_detail_data(data: dict[str, Any]) -> CommitDetail:
     parent = commit.parent
 
     report = data.get("report")
+    report_parser = (
+        strings.bind(parse_report_data) if strings is not None else parse_report_data
+    )
 
     return CommitDetail(
         commitid,
@@ -96,5 +105,5 @@ def parse_commit_detail_data(data: dict[str, Any]) -> CommitDetail:
         totals,
         state,
         parent,
-        parse_report_data(report),
+        LazyReport(report, report_parser) if lazy else report_parser(report),
     )
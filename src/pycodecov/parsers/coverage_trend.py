@@ -1,7 +1,7 @@
-from datetime import datetime
 from typing import Any
 
 from ..schemas import CoverageTrend
+from .timestamp import parse_timestamp_data
 
 __all__ = ["parse_coverage_trend_data"]
 
@@ -32,4 +32,4 @@ def parse_coverage_trend_data(data: dict[str, Any]) -> CoverageTrend:
     max = data.get("max")
     avg = data.get("avg")
 
-    return CoverageTrend(datetime.fromisoformat(timestamp), min, max, avg)
+    return CoverageTrend(parse_timestamp_data(timestamp), min, max, avg)
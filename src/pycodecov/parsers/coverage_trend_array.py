@@ -0,0 +1,47 @@
+from array import array
+from typing import Any
+
+from ..schemas import CoverageTrendArray
+from .timestamp import parse_timestamp_data
+
+__all__ = ["parse_coverage_trend_array_data"]
+
+
+def parse_coverage_trend_array_data(data: list[dict[str, Any]]) -> CoverageTrendArray:
+    """
+    Parse coverage trend data into compact columns, without building a
+    `CoverageTrend` per point.
+
+    Args:
+        data: coverage trend json data.
+
+    Returns:
+        A `CoverageTrendArray` schema.
+
+    Examples:
+    >>> data = [
+    ...     {
+    ...         "timestamp": "2024-03-25T00:00:00Z",
+    ...         "min": 80.0,
+    ...         "max": 82.0,
+    ...         "avg": 81.0,
+    ...     },
+    ...     {
+    ...         "timestamp": "2024-03-26T00:00:00Z",
+    ...         "min": 81.0,
+    ...         "max": 83.0,
+    ...         "avg": 82.0,
+    ...     },
+    ... ]
+    >>> coverage_trend = parse_coverage_trend_array_data(data)
+    >>> coverage_trend.timestamps, coverage_trend.avgs
+    (array('q', [1711324800, 1711411200]), array('d', [81.0, 82.0]))
+    """
+    return CoverageTrendArray(
+        array(
+            "q", [parse_timestamp_data(point.get("timestamp"), True) for point in data]
+        ),
+        array("d", [point.get("min") for point in data]),
+        array("d", [point.get("max") for point in data]),
+        array("d", [point.get("avg") for point in data]),
+    )
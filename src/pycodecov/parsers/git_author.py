@@ -1,16 +1,20 @@
 from typing import Any
 
 from ..schemas import GitAuthor
+from .string_table import StringTable
 
 __all__ = ["parse_git_author_data"]
 
 
-def parse_git_author_data(data: dict[str, Any]) -> GitAuthor:
+def parse_git_author_data(
+    data: dict[str, Any], strings: StringTable | None = None
+) -> GitAuthor:
     """
     Parse git author data.
 
     Args:
         data: git author json data.
+        strings: table interning the identifiers, `None` keeps them as decoded.
 
     Returns:
         A `GitAuthor` schema.
@@ -31,4 +35,8 @@ def parse_git_author_data(data: dict[str, Any]) -> GitAuthor:
     name = data.get("name")
     email = data.get("email")
 
+    if strings is not None:
+        username = strings(username)
+        name = strings(name)
+
     return GitAuthor(id, username, name, email)
@@ -3,16 +3,20 @@ from typing import Any
 from ..schemas import GitCommit
 from .base_commit import parse_base_commit_data
 from .git_author import parse_git_author_data
+from .string_table import StringTable
 
 __all__ = ["parse_git_commit_data"]
 
 
-def parse_git_commit_data(data: dict[str, Any]) -> GitCommit:
+def parse_git_commit_data(
+    data: dict[str, Any], strings: StringTable | None = None
+) -> GitCommit:
     """
     Parse git commit data.
 
     Args:
         data: git commit json data.
+        strings: table interning the identifiers, `None` keeps them as decoded.
 
     Returns:
         A `GitCommit` schema.
@@ -33,7 +37,7 @@ def parse_git_commit_data(data: dict[str, Any]) -> GitCommit:
     >>> git_commit
     GitCommit(commitid='string', message='string', timestamp=datetime.datetime(...), author=GitAuthor(...))
     """
-    base_commit = parse_base_commit_data(data)
+    base_commit = parse_base_commit_data(data, strings)
 
     commitid = base_commit.commitid
     message = base_commit.message
@@ -41,4 +45,6 @@ def parse_git_commit_data(data: dict[str, Any]) -> GitCommit:
 
     author = data.get("author")
 
-    return GitCommit(commitid, message, timestamp, parse_git_author_data(author))
+    return GitCommit(
+        commitid, message, timestamp, parse_git_author_data(author, strings)
+    )
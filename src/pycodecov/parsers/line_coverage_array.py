@@ -0,0 +1,32 @@
+from array import array
+from typing import Any
+
+from ..schemas import LineCoverageArray
+
+__all__ = ["parse_line_coverage_array_data"]
+
+
+def parse_line_coverage_array_data(data: list[dict[str, Any]]) -> LineCoverageArray:
+    """
+    Parse line coverage data into compact columns, without building a `Line` per
+    line.
+
+    Args:
+        data: line coverage json data.
+
+    Returns:
+        A `LineCoverageArray` schema.
+
+    Examples:
+    >>> data = [
+    ...     {"number": 1, "coverage": 0},
+    ...     {"number": 2, "coverage": 2},
+    ... ]
+    >>> line_coverage = parse_line_coverage_array_data(data)
+    >>> line_coverage
+    LineCoverageArray(numbers=array('I', [1, 2]), coverages=array('b', [0, 2]))
+    """
+    return LineCoverageArray(
+        array("I", [line.get("number") for line in data]),
+        array("b", [line.get("coverage") for line in data]),
+    )
@@ -2,16 +2,18 @@ from typing import Any
 
 from ..enums import Service
 from ..schemas import Owner
+from .string_table import StringTable
 
 __all__ = ["parse_owner_data"]
 
 
-def parse_owner_data(data: dict[str, Any]) -> Owner:
+def parse_owner_data(data: dict[str, Any], strings: StringTable | None = None) -> Owner:
     """
     Parse owner data.
 
     Args:
         data: owner json data.
+        strings: table interning the identifiers, `None` keeps them as decoded.
 
     Returns:
         An `Owner` schema.
@@ -30,4 +32,8 @@ def parse_owner_data(data: dict[str, Any]) -> Owner:
     username = data.get("username")
     name = data.get("name")
 
+    if strings is not None:
+        username = strings(username)
+        name = strings(name)
+
     return Owner(Service(service), username, name)
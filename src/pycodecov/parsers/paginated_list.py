@@ -5,6 +5,12 @@ from ..schemas import PaginatedList
 __all__ = ["parse_paginated_list_data"]
 
 
+def _strip_base_url(url: str | None) -> str | None:
+    # Page links are absolute, requests are made relative to the session base url
+    # `https://api.codecov.io`
+    return url[21:] if url is not None else None
+
+
 def parse_paginated_list_data[T](
     data: dict[str, Any], parser: Callable[[dict[str, Any]], T]
 ) -> PaginatedList[T]:
@@ -34,13 +40,8 @@ def parse_paginated_list_data[T](
     """
     count = data.get("count")
 
-    next = data.get("next")
-    if next is not None:
-        next = next[21:]
-
-    previous = data.get("previous")
-    if previous is not None:
-        previous = previous[21:]
+    next = _strip_base_url(data.get("next"))
+    previous = _strip_base_url(data.get("previous"))
 
     results = [parser(result) for result in data.get("results")]
     total_pages = data.get("total_pages")
@@ -0,0 +1,167 @@
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field, fields, is_dataclass
+from datetime import datetime
+from enum import Enum
+from types import NoneType, UnionType
+from typing import Any, Callable, Union, get_args, get_origin, get_type_hints
+
+from .timestamp import parse_timestamp_data
+
+__all__ = ["Projection"]
+
+# Requested sub fields of a field, `None` means every sub field
+type _FieldTree = dict[str, _FieldTree | None] | None
+
+
+@dataclass(slots=True, frozen=True)
+class Projection[T]:
+    """
+    Parser building a schema with only the requested fields, the other fields are
+    set to `None`. Nested schemas, enums and timestamps of fields that are not
+    requested are never built.
+
+    The parser is compiled from the annotations of the schema dataclass, a
+    projection with every field gives the same result as the matching
+    `parse_*_data` function.
+
+    Attributes:
+        schema: schema dataclass to build.
+        fields: requested fields, nested fields are separated by dots like
+            `"totals.coverage"`.
+
+    Raises:
+        ValueError: if a requested field doesn't exist in the schema.
+
+    Examples:
+    >>> from pycodecov.schemas import Repo
+    >>> projection = Projection(Repo, ("name", "totals.coverage"))
+    >>> repo = projection(
+    ...     {
+    ...         "name": "django-silk",
+    ...         "updatestamp": "2024-03-25T16:38:25.747678Z",
+    ...         "author": {"service": "github", "username": "jazzband"},
+    ...         "totals": {"files": 103, "lines": 4425, "coverage": 86.14},
+    ...     }
+    ... )
+    >>> repo.name, repo.updatestamp, repo.author, repo.totals.coverage
+    ('django-silk', None, None, 86.14)
+    """
+
+    schema: type[T]
+    fields: tuple[str, ...]
+    _parse: Callable[[dict[str, Any]], T] = field(init=False, repr=False, compare=False)
+
+    def __init__(self, schema: type[T], fields: Iterable[str]) -> None:
+        object.__setattr__(self, "schema", schema)
+        object.__setattr__(self, "fields", tuple(sorted(set(fields))))
+        object.__setattr__(
+            self, "_parse", _compile_schema(schema, _make_tree(self.fields))
+        )
+
+    def __call__(self, data: dict[str, Any]) -> T:
+        """
+        Parse json data into the schema.
+
+        Args:
+            data: schema json data.
+
+        Returns:
+            The schema with the requested fields.
+        """
+        return self._parse(data)
+
+
+def _make_tree(paths: Iterable[str]) -> _FieldTree:
+    tree: dict[str, Any] = {}
+
+    for path in paths:
+        node = tree
+        *parents, name = path.split(".")
+
+        for parent in parents:
+            if parent in node and node[parent] is None:
+                break
+
+            node = node.setdefault(parent, {})
+        else:
+            node[name] = None
+
+    return tree
+
+
+def _compile_schema(schema: Any, tree: _FieldTree) -> Callable[[dict[str, Any]], Any]:
+    hints = get_type_hints(schema)
+    names = [schema_field.name for schema_field in fields(schema)]
+
+    if tree is not None:
+        unknown = set(tree) - set(names)
+        if unknown:
+            raise ValueError(
+                f"{schema.__name__} has no field {', '.join(sorted(unknown))}"
+            )
+
+    plan = [
+        (
+            (name, _compile_type(hints[name], tree[name] if tree else None))
+            if tree is None or name in tree
+            else (None, None)
+        )
+        for name in names
+    ]
+
+    def parse(data: dict[str, Any]) -> Any:
+        return schema(
+            *[
+                None
+                if name is None
+                else data.get(name)
+                if converter is None
+                else converter(data.get(name))
+                for name, converter in plan
+            ]
+        )
+
+    return parse
+
+
+def _compile_type(tp: Any, tree: _FieldTree) -> Callable[[Any], Any] | None:
+    origin = get_origin(tp)
+    args = get_args(tp)
+
+    if origin is Union or origin is UnionType:
+        types = [arg for arg in args if arg is not NoneType]
+
+        if len(types) == 1:
+            converter = _compile_type(types[0], tree)
+
+            if converter is None:
+                return None
+
+            return lambda value: converter(value) if value is not None else value
+
+        if tree is not None:
+            raise ValueError(f"{getattr(tp, '__name__', tp)} has no fields")
+
+        return None
+
+    if origin is list or origin is Sequence:
+        converter = _compile_type(args[0], tree)
+
+        if converter is None:
+            return None
+
+        return lambda values: [converter(value) for value in values]
+
+    if is_dataclass(tp):
+        return _compile_schema(tp, tree)
+
+    if tree is not None:
+        raise ValueError(f"{getattr(tp, '__name__', tp)} has no fields")
+
+    if isinstance(tp, type) and issubclass(tp, Enum):
+        return tp
+
+    if tp is datetime:
+        return parse_timestamp_data
+
+    return None
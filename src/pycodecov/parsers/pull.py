@@ -1,20 +1,22 @@
-from datetime import datetime
 from typing import Any
 
 from ..enums import PullState
 from ..schemas import Pull
 from .commit_total import parse_commit_total_data
 from .owner import parse_owner_data
+from .string_table import StringTable
+from .timestamp import parse_timestamp_data
 
 __all__ = ["parse_pull_data"]
 
 
-def parse_pull_data(data: dict[str, Any]) -> Pull:
+def parse_pull_data(data: dict[str, Any], strings: StringTable | None = None) -> Pull:
     """
     Parse pull data.
 
     Args:
         data: pull json data.
+        strings: table interning the identifiers, `None` keeps them as decoded.
 
     Returns:
         A `Pull` schema.
@@ -74,8 +76,8 @@ def parse_pull_data(data: dict[str, Any]) -> Pull:
         title,
         parse_commit_total_data(base_total),
         parse_commit_total_data(head_total),
-        datetime.fromisoformat(updatestamp),
+        parse_timestamp_data(updatestamp),
         PullState(state),
         ci_passed,
-        parse_owner_data(author) if author is not None else author,
+        parse_owner_data(author, strings) if author is not None else author,
     )
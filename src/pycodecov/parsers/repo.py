@@ -1,20 +1,22 @@
-from datetime import datetime
 from typing import Any
 
 from ..enums import Language
 from ..schemas import Repo
 from .commit_total import parse_commit_total_data
 from .owner import parse_owner_data
+from .string_table import StringTable
+from .timestamp import parse_timestamp_data
 
 __all__ = ["parse_repo_data"]
 
 
-def parse_repo_data(data: dict[str, Any]) -> Repo:
+def parse_repo_data(data: dict[str, Any], strings: StringTable | None = None) -> Repo:
     """
     Parse repo data.
 
     Args:
         data: repo json data.
+        strings: table interning the identifiers, `None` keeps them as decoded.
 
     Returns:
         A `Repo` schema.
@@ -45,11 +47,15 @@ def parse_repo_data(data: dict[str, Any]) -> Repo:
     activated = data.get("activated")
     totals = data.get("totals")
 
+    if strings is not None:
+        name = strings(name)
+        branch = strings(branch)
+
     return Repo(
         name,
         private,
-        datetime.fromisoformat(updatestamp) if updatestamp is not None else updatestamp,
-        parse_owner_data(author),
+        parse_timestamp_data(updatestamp) if updatestamp is not None else updatestamp,
+        parse_owner_data(author, strings),
         Language(language) if language is not None else language,
         branch,
         active,
@@ -3,16 +3,20 @@ from typing import Any
 from ..schemas import Report
 from .base_report import parse_base_report_file_data
 from .report_total import parse_report_total_data
+from .string_table import StringTable
 
 __all__ = ["parse_report_data"]
 
 
-def parse_report_data(data: dict[str, Any]) -> Report:
+def parse_report_data(
+    data: dict[str, Any], strings: StringTable | None = None
+) -> Report:
     """
     Parse report data.
 
     Args:
         data: report json data.
+        strings: table interning the identifiers, `None` keeps them as decoded.
 
     Returns:
         A `Report` schema.
@@ -46,5 +50,5 @@ def parse_report_data(data: dict[str, Any]) -> Report:
 
     return Report(
         parse_report_total_data(totals),
-        [parse_base_report_file_data(file) for file in files],
+        [parse_base_report_file_data(file, strings) for file in files],
     )
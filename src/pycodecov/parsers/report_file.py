@@ -1,22 +1,41 @@
+from bisect import bisect_left
+from operator import itemgetter
 from typing import Any
 
 from ..schemas import ReportFile
 from .base_report import parse_base_report_file_data
 from .line import parse_line_data
+from .line_coverage_array import parse_line_coverage_array_data
+from .string_table import StringTable
 
 __all__ = ["parse_report_file_data"]
 
+_get_number = itemgetter("number")
 
-def parse_report_file_data(data: dict[str, Any]) -> ReportFile:
+
+def parse_report_file_data(
+    data: dict[str, Any],
+    compact: bool = False,
+    strings: StringTable | None = None,
+    line_range: range | None = None,
+) -> ReportFile:
     """
     Parse report file data.
 
     Args:
         data: report file json data.
+        compact: whether to store the line coverage in a `LineCoverageArray`
+            instead of a list of `Line`.
+        strings: table interning the identifiers, `None` keeps them as decoded.
+        line_range: line numbers to keep, like `range(120, 170)`, the other lines
+            are never parsed. `None` keeps every line.
 
     Returns:
         A `ReportFile` schema.
 
+    Raises:
+        ValueError: if the step of `line_range` isn't 1.
+
     Examples:
     >>> data = {
     ...     "name": "string",
@@ -42,15 +61,26 @@ def parse_report_file_data(data: dict[str, Any]) -> ReportFile:
     >>> report_file
     ReportFile(name='string', totals=ReportTotal(...), line_coverage=[])
     """
-    base_report_file = parse_base_report_file_data(data)
+    if line_range is not None and line_range.step != 1:
+        raise ValueError("line_range step must be 1")
+
+    base_report_file = parse_base_report_file_data(data, strings)
 
     name = base_report_file.name
     totals = base_report_file.totals
 
     line_coverage = data.get("line_coverage")
 
+    if line_range is not None:
+        # Lines are listed by number, the range bounds are found by bisection
+        start = bisect_left(line_coverage, line_range.start, key=_get_number)
+        stop = bisect_left(line_coverage, line_range.stop, key=_get_number)
+        line_coverage = line_coverage[start:stop]
+
     return ReportFile(
         name,
         totals,
-        [parse_line_data(line) for line in line_coverage],
+        parse_line_coverage_array_data(line_coverage)
+        if compact
+        else [parse_line_data(line) for line in line_coverage],
     )
@@ -0,0 +1,118 @@
+import inspect
+from typing import Any, Callable
+
+from ..schemas import PaginatedList
+from .paginated_list import _strip_base_url
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+__all__ = ["SchemaDecoder"]
+
+
+class SchemaDecoder:
+    """
+    Decode json bodies straight into schema dataclasses in one pass with
+    [msgspec](https://jcristharif.com/msgspec/), instead of decoding them into
+    dicts and building every nested schema field by field with the `parse_*_data`
+    functions.
+
+    Decoders are compiled from the annotations of the existing `schemas` dataclasses
+    on first use, and produce objects equal to the ones built by the matching
+    `parse_*_data` function. The body is validated against the annotations, so a
+    missing key or a value of an unexpected type raises `msgspec.ValidationError`.
+
+    Raises:
+        ImportError: if msgspec is not installed.
+
+    Examples:
+    >>> from pycodecov.schemas import Owner
+    >>> schema_decoder = SchemaDecoder()
+    >>> schema_decoder.decode(
+    ...     b'{"service": "github", "username": "jazzband", "name": null}', Owner
+    ... )
+    Owner(service=<Service.GITHUB: 'github'>, username='jazzband', name=None)
+    """
+
+    def __init__(self) -> None:
+        if msgspec is None:
+            raise ImportError("SchemaDecoder requires msgspec to be installed")
+
+        self._decoders: dict[Any, Callable[[bytes | str], Any] | None] = {}
+
+    def get_decoder(self, schema: Any) -> Callable[[bytes | str], Any]:
+        """
+        Get the compiled decoder of a schema.
+
+        Args:
+            schema: schema type, like `Repo` or `list[Repo]`.
+
+        Returns:
+            A function decoding a json body into the schema.
+        """
+        decoder = self._decoders.get(schema)
+
+        if decoder is None:
+            decoder = msgspec.json.Decoder(schema).decode
+            self._decoders[schema] = decoder
+
+        return decoder
+
+    def get_parser_decoder[T](
+        self, parser: Callable[[dict[str, Any]], T]
+    ) -> Callable[[bytes | str], T] | None:
+        """
+        Get the compiled decoder equivalent to a `parse_*_data` function, using its
+        return annotation as schema.
+
+        Args:
+            parser: parse function, like `parse_repo_data`.
+
+        Returns:
+            A function decoding a json body into the schema returned by `parser`, or
+            `None` if `parser` has no return annotation, like a `Projection`.
+        """
+        if parser in self._decoders:
+            return self._decoders[parser]
+
+        schema = inspect.get_annotations(parser).get("return")
+        decoder = self.get_decoder(schema) if schema is not None else None
+        self._decoders[parser] = decoder
+
+        return decoder
+
+    def decode[T](self, body: bytes | str, schema: type[T]) -> T:
+        """
+        Decode a json body into a schema.
+
+        Args:
+            body: json body.
+            schema: schema type.
+
+        Returns:
+            The decoded schema.
+        """
+        return self.get_decoder(schema)(body)
+
+    def decode_paginated_list[T](
+        self, body: bytes | str, schema: type[T]
+    ) -> PaginatedList[T]:
+        """
+        Decode a json body into a paginated list of a schema, like
+        `parse_paginated_list_data`.
+
+        Args:
+            body: json body.
+            schema: schema type of the results.
+
+        Returns:
+            The decoded `PaginatedList`.
+        """
+        paginated_list = self.get_decoder(PaginatedList[schema])(body)  # type: ignore[valid-type]
+
+        paginated_list.next = _strip_base_url(paginated_list.next)
+        paginated_list.previous = _strip_base_url(paginated_list.previous)
+
+        return paginated_list
@@ -0,0 +1,81 @@
+import inspect
+from functools import partial
+from typing import Any, Callable
+
+__all__ = ["StringTable"]
+
+
+class StringTable:
+    """
+    Table of interned strings, so equal identifiers of parsed schemas like
+    usernames, branches and file paths share one string object.
+
+    Unlike `sys.intern`, the strings are released with the table, a table is meant
+    to live as long as a client or a crawl.
+
+    Examples:
+    >>> strings = StringTable()
+    >>> path = strings("".join(["src/", "main.py"]))
+    >>> strings("".join(["src/", "main.py"])) is path
+    True
+    >>> strings(None) is None
+    True
+    >>> len(strings)
+    1
+    """
+
+    __slots__ = ("_strings", "_parsers")
+
+    def __init__(self) -> None:
+        self._strings: dict[str, str] = {}
+        self._parsers: dict[Callable[..., Any], Callable[..., Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __call__(self, value: str | None) -> str | None:
+        """
+        Intern a string.
+
+        Args:
+            value: string to intern.
+
+        Returns:
+            The string of the table equal to `value`, `None` if `value` is `None`.
+        """
+        if value is None:
+            return value
+
+        return self._strings.setdefault(value, value)
+
+    def bind[T](self, parser: Callable[..., T]) -> Callable[[dict[str, Any]], T]:
+        """
+        Bind the table to a `parse_*_data` function taking a `strings` argument. The
+        same function is returned for the same parser, so it can be used in cache
+        keys.
+
+        Args:
+            parser: parse function, like `parse_repo_data`.
+
+        Returns:
+            `parser` interning its strings in this table, or `parser` itself if it
+            doesn't take a `strings` argument, like a `Projection`.
+        """
+        if parser in self._parsers:
+            return self._parsers[parser]
+
+        try:
+            parameters = inspect.signature(parser).parameters
+        except (TypeError, ValueError):
+            parameters = {}  # type: ignore[assignment]
+
+        bound = partial(parser, strings=self) if "strings" in parameters else parser
+        self._parsers[parser] = bound
+
+        return bound
+
+    def clear(self) -> None:
+        """
+        Release every interned string.
+        """
+        self._strings.clear()
@@ -0,0 +1,61 @@
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Literal, overload
+
+__all__ = ["parse_timestamp_data"]
+
+# Bulk responses repeat the same timestamps (day buckets, updatestamps), so parsed
+# values are memoized. Datetimes are immutable and safe to share.
+_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _parse_datetime(data: str) -> datetime:
+    return datetime.fromisoformat(data)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _parse_epoch(data: str) -> int:
+    timestamp = _parse_datetime(data)
+
+    # Naive timestamps would be read in the local timezone of the host
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+
+    return int(timestamp.timestamp())
+
+
+@overload
+def parse_timestamp_data(data: str, epoch: Literal[False] = False) -> datetime: ...
+
+
+@overload
+def parse_timestamp_data(data: str, epoch: Literal[True]) -> int: ...
+
+
+@overload
+def parse_timestamp_data(data: str, epoch: bool) -> datetime | int: ...
+
+
+def parse_timestamp_data(data: str, epoch: bool = False) -> datetime | int:
+    """
+    Parse ISO 8601 timestamp data. The last parsed timestamps are cached.
+
+    Args:
+        data: timestamp json data.
+        epoch: whether to return seconds since the epoch instead of a `datetime`.
+            Timestamps without timezone are read as UTC.
+
+    Returns:
+        A `datetime`, or an `int` if `epoch` is `True`.
+
+    Examples:
+    >>> parse_timestamp_data("2024-03-25T16:38:25.747678Z")
+    datetime.datetime(2024, 3, 25, 16, 38, 25, 747678, tzinfo=datetime.timezone.utc)
+    >>> parse_timestamp_data("2024-03-25T16:38:25.747678Z", epoch=True)
+    1711384705
+    """
+    if epoch:
+        return _parse_epoch(data)
+
+    return _parse_datetime(data)
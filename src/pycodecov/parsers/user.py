@@ -2,16 +2,18 @@ from typing import Any
 
 from ..schemas import User
 from .owner import parse_owner_data
+from .string_table import StringTable
 
 __all__ = ["parse_user_data"]
 
 
-def parse_user_data(data: dict[str, Any]) -> User:
+def parse_user_data(data: dict[str, Any], strings: StringTable | None = None) -> User:
     """
     Parse user data.
 
     Args:
         data: user json data.
+        strings: table interning the identifiers, `None` keeps them as decoded.
 
     Returns:
         A `User` schema.
@@ -29,7 +31,7 @@ def parse_user_data(data: dict[str, Any]) -> User:
     >>> user
     User(service=<Service.GITHUB: 'github'>, username='string', name='string', activated=True, is_admin=True, email='string')
     """
-    owner = parse_owner_data(data)
+    owner = parse_owner_data(data, strings)
 
     service = owner.service
     username = owner.username
@@ -2,44 +2,55 @@
 Module to store common schema classes used by pycodecov.
 """
 
-from .base_commit import BaseCommit
-from .base_report_file import BaseReportFile
-from .base_total import BaseTotal
-from .branch import Branch
-from .branch_detail import BranchDetail
-from .commit import Commit
-from .commit_comparison import CommitComparison
-from .commit_coverage import CommitCoverage
-from .commit_coverage_report import CommitCoverageReport
-from .commit_coverage_total import CommitCoverageTotal
-from .commit_detail import CommitDetail
-from .commit_total import CommitTotal
-from .component import Component
-from .component_comparison import ComponentComparison
-from .coverage_trend import CoverageTrend
-from .diff_comparison import DiffComparison
-from .file_change_summary_comparison import FileChangeSummaryComparison
-from .file_comparison import FileComparison
-from .file_name_comparison import FileNameComparison
-from .file_stat_comparison import FileStatComparison
-from .flag import Flag
-from .flag_comparison import FlagComparison
-from .git_author import GitAuthor
-from .git_commit import GitCommit
-from .line import Line
-from .line_comparison import LineComparison
-from .line_coverage_comparison import LineCoverageComparison
-from .line_number_comparison import LineNumberComparison
-from .owner import Owner
-from .paginated_list import PaginatedList
-from .pull import Pull
-from .repo import Repo
-from .repo_config import RepoConfig
-from .report import Report
-from .report_file import ReportFile
-from .report_total import ReportTotal
-from .total_comparison import TotalComparison
-from .user import User
+from typing import TYPE_CHECKING
+
+from .._lazy import make_lazy_dir, make_lazy_getattr
+
+if TYPE_CHECKING:
+    from .base_commit import BaseCommit
+    from .base_report_file import BaseReportFile
+    from .base_total import BaseTotal
+    from .branch import Branch
+    from .branch_detail import BranchDetail
+    from .commit import Commit
+    from .commit_comparison import CommitComparison
+    from .commit_coverage import CommitCoverage
+    from .commit_coverage_report import CommitCoverageReport
+    from .commit_coverage_total import CommitCoverageTotal
+    from .commit_detail import CommitDetail
+    from .commit_total import CommitTotal
+    from .component import Component
+    from .component_comparison import ComponentComparison
+    from .coverage_bitmap import CoverageBitmap
+    from .coverage_trend import CoverageTrend
+    from .coverage_trend_array import CoverageTrendArray
+    from .diff_comparison import DiffComparison
+    from .epoch_coverage_trend import EpochCoverageTrend
+    from .file_change_summary_comparison import FileChangeSummaryComparison
+    from .file_comparison import FileComparison
+    from .file_name_comparison import FileNameComparison
+    from .file_stat_comparison import FileStatComparison
+    from .flag import Flag
+    from .flag_comparison import FlagComparison
+    from .git_author import GitAuthor
+    from .git_commit import GitCommit
+    from .lazy_report import LazyReport
+    from .line import Line
+    from .line_comparison import LineComparison
+    from .line_coverage_array import LineCoverageArray
+    from .line_coverage_comparison import LineCoverageComparison
+    from .line_number_comparison import LineNumberComparison
+    from .line_set import LineSet
+    from .owner import Owner
+    from .paginated_list import PaginatedList
+    from .pull import Pull
+    from .repo import Repo
+    from .repo_config import RepoConfig
+    from .report import Report
+    from .report_file import ReportFile
+    from .report_total import ReportTotal
+    from .total_comparison import TotalComparison
+    from .user import User
 
 __all__ = [
     "BaseCommit",
@@ -56,8 +67,11 @@ __all__ = [
     "CommitTotal",
     "Component",
     "ComponentComparison",
+    "CoverageBitmap",
     "CoverageTrend",
+    "CoverageTrendArray",
     "DiffComparison",
+    "EpochCoverageTrend",
     "FileChangeSummaryComparison",
     "FileComparison",
     "FileNameComparison",
@@ -66,10 +80,13 @@ __all__ = [
     "FlagComparison",
     "GitAuthor",
     "GitCommit",
+    "LazyReport",
     "Line",
     "LineComparison",
+    "LineCoverageArray",
     "LineCoverageComparison",
     "LineNumberComparison",
+    "LineSet",
     "Owner",
     "PaginatedList",
     "Pull",
@@ -81,3 +98,54 @@ __all__ = [
     "TotalComparison",
     "User",
 ]
+
+_MODULES = {
+    "BaseCommit": ".base_commit",
+    "BaseReportFile": ".base_report_file",
+    "BaseTotal": ".base_total",
+    "Branch": ".branch",
+    "BranchDetail": ".branch_detail",
+    "Commit": ".commit",
+    "CommitComparison": ".commit_comparison",
+    "CommitCoverage": ".commit_coverage",
+    "CommitCoverageReport": ".commit_coverage_report",
+    "CommitCoverageTotal": ".commit_coverage_total",
+    "CommitDetail": ".commit_detail",
+    "CommitTotal": ".commit_total",
+    "Component": ".component",
+    "ComponentComparison": ".component_comparison",
+    "CoverageBitmap": ".coverage_bitmap",
+    "CoverageTrend": ".coverage_trend",
+    "CoverageTrendArray": ".coverage_trend_array",
+    "DiffComparison": ".diff_comparison",
+    "EpochCoverageTrend": ".epoch_coverage_trend",
+    "FileChangeSummaryComparison": ".file_change_summary_comparison",
+    "FileComparison": ".file_comparison",
+    "FileNameComparison": ".file_name_comparison",
+    "FileStatComparison": ".file_stat_comparison",
+    "Flag": ".flag",
+    "FlagComparison": ".flag_comparison",
+    "GitAuthor": ".git_author",
+    "GitCommit": ".git_commit",
+    "LazyReport": ".lazy_report",
+    "Line": ".line",
+    "LineComparison": ".line_comparison",
+    "LineCoverageArray": ".line_coverage_array",
+    "LineCoverageComparison": ".line_coverage_comparison",
+    "LineNumberComparison": ".line_number_comparison",
+    "LineSet": ".line_set",
+    "Owner": ".owner",
+    "PaginatedList": ".paginated_list",
+    "Pull": ".pull",
+    "Repo": ".repo",
+    "RepoConfig": ".repo_config",
+    "Report": ".report",
+    "ReportFile": ".report_file",
+    "ReportTotal": ".report_total",
+    "TotalComparison": ".total_comparison",
+    "User": ".user",
+}
+
+
+__getattr__ = make_lazy_getattr(__name__, _MODULES)
+__dir__ = make_lazy_dir(__name__, __all__)
@@ -0,0 +1,143 @@
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+
+from ..enums import Coverage
+from .line import Line
+from .line_comparison import LineComparison
+from .line_coverage_array import LineCoverageArray
+from .line_set import LineSet
+
+__all__ = ["CoverageBitmap"]
+
+# Translation tables from line codes to base 2 digits of each coverage status bitmap
+_DIGITS = {
+    coverage: bytes(49 if code == coverage + 1 else 48 for code in range(256))
+    for coverage in Coverage
+}
+
+
+@dataclass(slots=True, frozen=True)
+class CoverageBitmap:
+    """
+    A schema used to store the hit, missed and partial lines of a file as bitmaps.
+
+    Attributes:
+        hits: hit lines.
+        misses: missed lines.
+        partials: partially covered lines.
+
+    Examples:
+    >>> base = CoverageBitmap.from_lines(
+    ...     [Line(1, Coverage.HIT), Line(2, Coverage.HIT), Line(3, Coverage.MISS)]
+    ... )
+    >>> head = CoverageBitmap.from_lines(
+    ...     [Line(1, Coverage.HIT), Line(2, Coverage.MISS), Line(3, Coverage.MISS)]
+    ... )
+    >>> list(base.hits & head.misses)
+    [2]
+    >>> len(head), len(head.hits)
+    (3, 1)
+    """
+
+    hits: LineSet = field(default_factory=LineSet)
+    misses: LineSet = field(default_factory=LineSet)
+    partials: LineSet = field(default_factory=LineSet)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[Line]) -> "CoverageBitmap":
+        """
+        Build coverage bitmaps from line coverage values, like
+        `ReportFile.line_coverage`.
+
+        Args:
+            lines: line coverage values.
+
+        Returns:
+            A `CoverageBitmap`.
+        """
+        if isinstance(lines, LineCoverageArray):
+            return cls._from_pairs(zip(lines.numbers, lines.coverages, strict=False))
+
+        return cls._from_pairs((line.number, line.coverage) for line in lines)
+
+    @classmethod
+    def from_line_comparisons(
+        cls, lines: Iterable[LineComparison], head: bool = True
+    ) -> "CoverageBitmap":
+        """
+        Build coverage bitmaps from one side of line comparisons, like
+        `FileComparison.lines`. Lines missing from that side are skipped.
+
+        Args:
+            lines: line comparisons.
+            head: whether to use the head side, otherwise the base side.
+
+        Returns:
+            A `CoverageBitmap`.
+        """
+        if head:
+            pairs = ((line.number.head, line.coverage.head) for line in lines)
+        else:
+            pairs = ((line.number.base, line.coverage.base) for line in lines)
+
+        return cls._from_pairs(
+            (number, coverage)
+            for number, coverage in pairs
+            if number is not None and coverage is not None
+        )
+
+    @classmethod
+    def _from_pairs(cls, pairs: Iterable[tuple[int, int]]) -> "CoverageBitmap":
+        numbers: list[int] = []
+        coverages: list[int] = []
+
+        for number, coverage in pairs:
+            numbers.append(number)
+            coverages.append(coverage)
+
+        return cls._from_columns(numbers, coverages)
+
+    @classmethod
+    def _from_columns(
+        cls, numbers: Sequence[int], coverages: Sequence[int]
+    ) -> "CoverageBitmap":
+        if not numbers:
+            return cls()
+
+        # Coverage status + 1 of every line, 0 for lines without coverage
+        codes = bytearray(max(numbers) + 1)
+        for number, coverage in zip(numbers, coverages, strict=False):
+            codes[number] = coverage + 1
+
+        # Digits of each bitmap in base 2, highest line first
+        codes.reverse()
+
+        return cls(
+            LineSet(int(codes.translate(_DIGITS[Coverage.HIT]), 2)),
+            LineSet(int(codes.translate(_DIGITS[Coverage.MISS]), 2)),
+            LineSet(int(codes.translate(_DIGITS[Coverage.PARTIAL]), 2)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.hits) + len(self.misses) + len(self.partials)
+
+    def __or__(self, other: "CoverageBitmap") -> "CoverageBitmap":
+        return CoverageBitmap(
+            self.hits | other.hits,
+            self.misses | other.misses,
+            self.partials | other.partials,
+        )
+
+    def __and__(self, other: "CoverageBitmap") -> "CoverageBitmap":
+        return CoverageBitmap(
+            self.hits & other.hits,
+            self.misses & other.misses,
+            self.partials & other.partials,
+        )
+
+    def __sub__(self, other: "CoverageBitmap") -> "CoverageBitmap":
+        return CoverageBitmap(
+            self.hits - other.hits,
+            self.misses - other.misses,
+            self.partials - other.partials,
+        )
@@ -0,0 +1,263 @@
+from array import array
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import overload
+
+from .epoch_coverage_trend import EpochCoverageTrend
+
+__all__ = ["CoverageTrendArray"]
+
+
+@dataclass(slots=True)
+class CoverageTrendArray(Sequence[EpochCoverageTrend]):
+    """
+    A schema used to store coverage trend values in compact columns.
+
+    Timestamps are stored as seconds since the epoch in an `array('q')` and values
+    in `array('d')` columns, 32 bytes per point instead of a `CoverageTrend` object
+    per point. Items are built as `EpochCoverageTrend` on access, and downsampling, rolling and merging are computed on the columns.
+
+    Attributes:
+        timestamps: coverage trend timestamps, in seconds since the epoch.
+        mins: minimum values coverage trend.
+        maxs: maximum values coverage trend.
+        avgs: average values coverage trend.
+
+    Examples:
+    >>> coverage_trend = CoverageTrendArray.from_trends(
+    ...     [
+    ...         EpochCoverageTrend(0, 80.0, 82.0, 81.0),
+    ...         EpochCoverageTrend(3600, 79.0, 85.0, 83.0),
+    ...         EpochCoverageTrend(86400, 84.0, 86.0, 85.0),
+    ...     ]
+    ... )
+    >>> len(coverage_trend)
+    3
+    >>> coverage_trend[1]
+    EpochCoverageTrend(timestamp=3600, min=79.0, max=85.0, avg=83.0)
+    >>> list(coverage_trend.downsample(86400))
+    [EpochCoverageTrend(timestamp=0, min=79.0, max=85.0, avg=82.0), EpochCoverageTrend(timestamp=86400, min=84.0, max=86.0, avg=85.0)]
+    """
+
+    timestamps: array[int] = field(default_factory=lambda: array("q"))
+    mins: array[float] = field(default_factory=lambda: array("d"))
+    maxs: array[float] = field(default_factory=lambda: array("d"))
+    avgs: array[float] = field(default_factory=lambda: array("d"))
+
+    @classmethod
+    def from_trends(cls, trends: Iterable[EpochCoverageTrend]) -> "CoverageTrendArray":
+        """
+        Build a compact coverage trend from `EpochCoverageTrend` items.
+
+        Args:
+            trends: coverage trend values.
+
+        Returns:
+            A `CoverageTrendArray`.
+        """
+        coverage_trend = cls()
+
+        for trend in trends:
+            coverage_trend.timestamps.append(trend.timestamp)
+            coverage_trend.mins.append(trend.min)
+            coverage_trend.maxs.append(trend.max)
+            coverage_trend.avgs.append(trend.avg)
+
+        return coverage_trend
+
+    def extend(self, coverage_trend: "CoverageTrendArray") -> None:
+        """
+        Append the points of another coverage trend, like the next page of the same
+        trend, column by column.
+
+        Args:
+            coverage_trend: coverage trend to append.
+        """
+        self.timestamps.extend(coverage_trend.timestamps)
+        self.mins.extend(coverage_trend.mins)
+        self.maxs.extend(coverage_trend.maxs)
+        self.avgs.extend(coverage_trend.avgs)
+
+    @classmethod
+    def merge(
+        cls, coverage_trends: Iterable["CoverageTrendArray"], seconds: int = 1
+    ) -> "CoverageTrendArray":
+        """
+        Merge many coverage trends, like the trends of many repositories, into one
+        point per bucket of `seconds`. Each bucket keeps the minimum of the minimums,
+        the maximum of the maximums and the mean of the averages of its points.
+
+        `coverage_trends` is consumed one trend at a time and only one accumulator
+        per bucket is kept, so it can be a generator dropping every trend once
+        merged.
+
+        Args:
+            coverage_trends: coverage trends to merge.
+            seconds: bucket size, points are grouped by timestamp rounded down to
+                a multiple of it. `1` only merges points with the same timestamp.
+
+        Returns:
+            A `CoverageTrendArray` sorted by timestamp.
+
+        Raises:
+            ValueError: if `seconds` is less than 1.
+
+        Examples:
+        >>> a = CoverageTrendArray.from_trends(
+        ...     [EpochCoverageTrend(0, 70.0, 80.0, 75.0)]
+        ... )
+        >>> b = CoverageTrendArray.from_trends(
+        ...     [EpochCoverageTrend(0, 60.0, 90.0, 85.0)]
+        ... )
+        >>> list(CoverageTrendArray.merge([a, b]))
+        [EpochCoverageTrend(timestamp=0, min=60.0, max=90.0, avg=80.0)]
+        """
+        if seconds < 1:
+            raise ValueError("seconds must be at least 1")
+
+        # bucket -> [min, max, sum of averages, count]
+        buckets: dict[int, list[float]] = {}
+
+        for coverage_trend in coverage_trends:
+            for timestamp, min_, max_, avg in zip(
+                coverage_trend.timestamps,
+                coverage_trend.mins,
+                coverage_trend.maxs,
+                coverage_trend.avgs,
+                strict=True,
+            ):
+                key = timestamp - timestamp % seconds
+                bucket = buckets.get(key)
+
+                if bucket is None:
+                    buckets[key] = [min_, max_, avg, 1]
+                else:
+                    if min_ < bucket[0]:
+                        bucket[0] = min_
+                    if max_ > bucket[1]:
+                        bucket[1] = max_
+                    bucket[2] += avg
+                    bucket[3] += 1
+
+        merged = cls()
+
+        for timestamp in sorted(buckets):
+            min_, max_, total, count = buckets[timestamp]
+            merged.timestamps.append(timestamp)
+            merged.mins.append(min_)
+            merged.maxs.append(max_)
+            merged.avgs.append(total / count)
+
+        return merged
+
+    def downsample(self, seconds: int) -> "CoverageTrendArray":
+        """
+        Downsample the coverage trend into one point per bucket of `seconds`, see
+        `merge`.
+
+        Args:
+            seconds: bucket size, points are grouped by timestamp rounded down to
+                a multiple of it.
+
+        Returns:
+            A `CoverageTrendArray` sorted by timestamp.
+
+        Raises:
+            ValueError: if `seconds` is less than 1.
+        """
+        return CoverageTrendArray.merge((self,), seconds)
+
+    def rolling(self, window: int) -> "CoverageTrendArray":
+        """
+        Aggregate every point with the `window - 1` points before it. Each point
+        keeps its timestamp, with the minimum of the minimums, the maximum of the
+        maximums and the mean of the averages of its window. The first points have
+        shorter windows.
+
+        Args:
+            window: number of points per window.
+
+        Returns:
+            A `CoverageTrendArray` as long as this one.
+
+        Raises:
+            ValueError: if `window` is less than 1.
+
+        Examples:
+        >>> coverage_trend = CoverageTrendArray.from_trends(
+        ...     [EpochCoverageTrend(i, i, i + 10.0, i + 5.0) for i in range(4)]
+        ... )
+        >>> coverage_trend.rolling(2).mins, coverage_trend.rolling(2).avgs
+        (array('d', [0.0, 0.0, 1.0, 2.0]), array('d', [5.0, 5.5, 6.5, 7.5]))
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1")
+
+        rolled = CoverageTrendArray(
+            array("q", self.timestamps), array("d"), array("d"), array("d")
+        )
+        mins, maxs, avgs = self.mins, self.maxs, self.avgs
+        # Indexes of the window with increasing minimums and decreasing maximums,
+        # so the window minimum and maximum are always first
+        min_indexes: deque[int] = deque()
+        max_indexes: deque[int] = deque()
+        total = 0.0
+
+        for index in range(len(self)):
+            start = index - window + 1
+
+            while min_indexes and mins[min_indexes[-1]] >= mins[index]:
+                min_indexes.pop()
+            min_indexes.append(index)
+            if min_indexes[0] < start:
+                min_indexes.popleft()
+
+            while max_indexes and maxs[max_indexes[-1]] <= maxs[index]:
+                max_indexes.pop()
+            max_indexes.append(index)
+            if max_indexes[0] < start:
+                max_indexes.popleft()
+
+            total += avgs[index]
+            if start > 0:
+                total -= avgs[start - 1]
+
+            rolled.mins.append(mins[min_indexes[0]])
+            rolled.maxs.append(maxs[max_indexes[0]])
+            rolled.avgs.append(total / (index - max(start, 0) + 1))
+
+        return rolled
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @overload
+    def __getitem__(self, index: int) -> EpochCoverageTrend: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "CoverageTrendArray": ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> "EpochCoverageTrend | CoverageTrendArray":
+        if isinstance(index, slice):
+            return CoverageTrendArray(
+                self.timestamps[index],
+                self.mins[index],
+                self.maxs[index],
+                self.avgs[index],
+            )
+
+        return EpochCoverageTrend(
+            self.timestamps[index],
+            self.mins[index],
+            self.maxs[index],
+            self.avgs[index],
+        )
+
+    def __iter__(self) -> Iterator[EpochCoverageTrend]:
+        for timestamp, min_, max_, avg in zip(
+            self.timestamps, self.mins, self.maxs, self.avgs, strict=False
+        ):
+            yield EpochCoverageTrend(timestamp, min_, max_, avg)
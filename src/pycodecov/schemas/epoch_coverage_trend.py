@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+__all__ = ["EpochCoverageTrend"]
+
+
+@dataclass(slots=True)
+class EpochCoverageTrend:
+    """
+    A schema used to store info about coverage trend, with the timestamp kept as
+    seconds since the epoch, as stored in a `CoverageTrendArray`.
+
+    Attributes:
+        timestamp: coverage trend timestamp, in seconds since the epoch.
+        min: minimum value coverage trend.
+        max: maximum value coverage trend.
+        avg: average value coverage trend.
+    """
+
+    timestamp: int
+    min: float
+    max: float
+    avg: float
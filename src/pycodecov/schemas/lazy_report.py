@@ -0,0 +1,73 @@
+from typing import Any, Callable
+
+from .base_report_file import BaseReportFile
+from .report import Report
+from .report_total import ReportTotal
+
+__all__ = ["LazyReport"]
+
+
+class LazyReport(Report):
+    """
+    A `Report` that keeps its json data and parses it on first attribute access.
+    The parsed report is cached and the json data is released.
+
+    Args:
+        data: report json data.
+        parser: function used to parse the report json data.
+
+    Examples:
+    >>> from pycodecov.parsers import parse_report_data
+    >>> report = LazyReport({"totals": {}, "files": []}, parse_report_data)
+    >>> report.parsed
+    False
+    >>> report.files
+    []
+    >>> report.parsed
+    True
+    """
+
+    __slots__ = ("_data", "_parser", "_report")
+
+    def __init__(
+        self, data: dict[str, Any], parser: Callable[[dict[str, Any]], Report]
+    ) -> None:
+        self._data: dict[str, Any] | None = data
+        self._parser = parser
+        self._report: Report | None = None
+
+    def _get_report(self) -> Report:
+        if self._report is None:
+            self._report = self._parser(self._data)
+            self._data = None
+
+        return self._report
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyReport):
+            other = other._get_report()
+
+        return self._get_report() == other
+
+    @property
+    def parsed(self) -> bool:
+        """
+        Whether the report json data has been parsed.
+        """
+        return self._report is not None
+
+    @property  # type: ignore[override]
+    def totals(self) -> ReportTotal:
+        return self._get_report().totals
+
+    @totals.setter
+    def totals(self, totals: ReportTotal) -> None:
+        self._get_report().totals = totals
+
+    @property  # type: ignore[override]
+    def files(self) -> list[BaseReportFile]:
+        return self._get_report().files
+
+    @files.setter
+    def files(self, files: list[BaseReportFile]) -> None:
+        self._get_report().files = files
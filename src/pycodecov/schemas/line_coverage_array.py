@@ -0,0 +1,128 @@
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import overload
+
+from ..enums import Coverage
+from .line import Line
+
+__all__ = ["LineCoverageArray"]
+
+_COVERAGES = tuple(Coverage)
+
+
+@dataclass(slots=True)
+class LineCoverageArray(Sequence[Line]):
+    """
+    A schema used to store line-by-line coverage values in compact columns.
+
+    Line numbers are stored in an `array('I')` and coverage statuses in an
+    `array('b')`, 5 bytes per line instead of a `Line` object per line. Items are
+    built as `Line` on access, and coverage counts are computed on the columns.
+
+    Attributes:
+        numbers: line numbers.
+        coverages: line coverage status values.
+
+    Raises:
+        ValueError: if a coverage status value isn't a valid `Coverage`, or the
+            columns have different lengths.
+
+    Examples:
+    >>> line_coverage = LineCoverageArray.from_lines(
+    ...     [Line(1, Coverage.HIT), Line(2, Coverage.MISS), Line(5, Coverage.HIT)]
+    ... )
+    >>> len(line_coverage)
+    3
+    >>> line_coverage[1]
+    Line(number=2, coverage=<Coverage.MISS: 1>)
+    >>> line_coverage.hits, line_coverage.misses, line_coverage.partials
+    (2, 1, 0)
+    """
+
+    numbers: array[int] = field(default_factory=lambda: array("I"))
+    coverages: array[int] = field(default_factory=lambda: array("b"))
+
+    def __post_init__(self) -> None:
+        if len(self.numbers) != len(self.coverages):
+            raise ValueError("numbers and coverages must have the same length")
+
+        # Codes index `_COVERAGES`, a negative one would silently wrap around
+        if self.coverages and (
+            min(self.coverages) < 0 or max(self.coverages) >= len(_COVERAGES)
+        ):
+            raise ValueError(f"coverages must be between 0 and {len(_COVERAGES) - 1}")
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[Line]) -> "LineCoverageArray":
+        """
+        Build a compact line coverage from `Line` items.
+
+        Args:
+            lines: line coverage values.
+
+        Returns:
+            A `LineCoverageArray`.
+        """
+        line_coverage = cls()
+
+        for line in lines:
+            line_coverage.append(line)
+
+        return line_coverage
+
+    def append(self, line: Line) -> None:
+        """
+        Append a line to the columns.
+
+        Args:
+            line: line coverage value.
+
+        Raises:
+            ValueError: if the line coverage isn't a valid `Coverage`.
+        """
+        if not 0 <= line.coverage < len(_COVERAGES):
+            raise ValueError(f"coverage must be between 0 and {len(_COVERAGES) - 1}")
+
+        self.numbers.append(line.number)
+        self.coverages.append(line.coverage)
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    @overload
+    def __getitem__(self, index: int) -> Line: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "LineCoverageArray": ...
+
+    def __getitem__(self, index: int | slice) -> "Line | LineCoverageArray":
+        if isinstance(index, slice):
+            return LineCoverageArray(self.numbers[index], self.coverages[index])
+
+        return Line(self.numbers[index], _COVERAGES[self.coverages[index]])
+
+    def __iter__(self) -> Iterator[Line]:
+        for number, coverage in zip(self.numbers, self.coverages, strict=False):
+            yield Line(number, _COVERAGES[coverage])
+
+    @property
+    def hits(self) -> int:
+        """
+        Number of hit lines.
+        """
+        return self.coverages.count(Coverage.HIT)
+
+    @property
+    def misses(self) -> int:
+        """
+        Number of missed lines.
+        """
+        return self.coverages.count(Coverage.MISS)
+
+    @property
+    def partials(self) -> int:
+        """
+        Number of partially covered lines.
+        """
+        return self.coverages.count(Coverage.PARTIAL)
@@ -0,0 +1,81 @@
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+__all__ = ["LineSet"]
+
+
+@dataclass(slots=True, frozen=True)
+class LineSet:
+    """
+    A schema used to store a set of line numbers as a bitmap.
+
+    Bit `n` of `bits` is set when line `n` is in the set, so set algebra between
+    files or commits runs on whole integers and `len` is a popcount.
+
+    Attributes:
+        bits: bitmap of the line numbers.
+
+    Examples:
+    >>> base_hits = LineSet.from_numbers([1, 2, 3, 5])
+    >>> head_hits = LineSet.from_numbers([1, 3, 4])
+    >>> list(base_hits - head_hits)
+    [2, 5]
+    >>> list(base_hits & head_hits), len(base_hits | head_hits)
+    ([1, 3], 5)
+    >>> 4 in head_hits
+    True
+    """
+
+    bits: int = 0
+
+    @classmethod
+    def from_numbers(cls, numbers: Iterable[int]) -> "LineSet":
+        """
+        Build a line set from line numbers.
+
+        Args:
+            numbers: line numbers.
+
+        Returns:
+            A `LineSet`.
+        """
+        numbers = list(numbers)
+        if not numbers:
+            return cls()
+
+        # Digits of the bitmap in base 2, lowest line first
+        digits = bytearray(b"0") * (max(numbers) + 1)
+        for number in numbers:
+            digits[number] = 49  # "1"
+
+        return cls(int(digits[::-1], 2))
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __contains__(self, number: object) -> bool:
+        return isinstance(number, int) and number >= 0 and bool(self.bits >> number & 1)
+
+    def __iter__(self) -> Iterator[int]:
+        # Digits of the bitmap in base 2, lowest line first
+        digits = bin(self.bits)[:1:-1]
+
+        number = digits.find("1")
+        while number != -1:
+            yield number
+            number = digits.find("1", number + 1)
+
+    def __or__(self, other: "LineSet") -> "LineSet":
+        return LineSet(self.bits | other.bits)
+
+    def __and__(self, other: "LineSet") -> "LineSet":
+        return LineSet(self.bits & other.bits)
+
+    def __sub__(self, other: "LineSet") -> "LineSet":
+        return LineSet(self.bits & ~other.bits)
+
+    def __xor__(self, other: "LineSet") -> "LineSet":
+        return LineSet(self.bits ^ other.bits)
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 from .base_report_file import BaseReportFile
@@ -12,7 +13,8 @@ class ReportFile(BaseReportFile):
     A schema used to store info about report file.
 
     Attributes:
-        line_coverage: line-by-line coverage values.
+        line_coverage: line-by-line coverage values, a list of `Line` or a compact
+            `LineCoverageArray`.
     """
 
-    line_coverage: list[Line]
+    line_coverage: Sequence[Line]
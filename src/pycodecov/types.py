@@ -1,23 +1,25 @@
-from typing import Any, Protocol
+from typing import TYPE_CHECKING, Any, Callable, Protocol
 
-from aiohttp import ClientSession
+if TYPE_CHECKING:
+    from .api.context import ClientContext
 
 __all__ = [
     "ApiParser",
     "CodecovApiToken",
     "CodecovUrl",
+    "JsonLoads",
 ]
 
 
 CodecovApiToken = str
 CodecovUrl = str
+JsonLoads = Callable[[str | bytes], Any]
 
 
 class ApiParser(Protocol):
     def __call__(
         self,
         schema: Any,
-        token: CodecovApiToken | None,
-        session: ClientSession | None,
+        context: "ClientContext | None",
         **kwargs: Any,
     ) -> Any: ...
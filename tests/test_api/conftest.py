@@ -0,0 +1,21 @@
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+
+def mock_response(data, status=200, headers=None):
+    """
+    Fake the context manager returned by `ClientSession.get` for a json response.
+    """
+    body = json.dumps(data).encode() if data is not None else b""
+
+    response = MagicMock()
+    response.ok = status < 400
+    response.status = status
+    response.headers = headers if headers is not None else {}
+    response.json = AsyncMock(return_value=data)
+    response.read = AsyncMock(return_value=body)
+
+    context = MagicMock()
+    context.__aenter__.return_value = response
+
+    return context
@@ -1,8 +1,14 @@
 import os
 
+import pytest
 from aiohttp import ClientSession
 
+from pycodecov import Codecov
+from pycodecov.api import ConnectorConfig, PaginatedList
 from pycodecov.api.api import API
+from pycodecov.api.paginated_list import parse_paginated_list_api
+from pycodecov.api.user import parse_user_api
+from pycodecov.parsers import parse_user_data
 
 CODECOV_API_TOKEN = os.environ["CODECOV_API_TOKEN"]
 
@@ -33,3 +39,68 @@ async def test_api_without_token():
         assert isinstance(api._session, ClientSession)
         assert str(api._session._base_url) == "https://api.codecov.io"
         assert api._session.headers == {"Accept": "application/json"}
+
+
+async def test_api_with_connector():
+    connector = ConnectorConfig(
+        limit=200, limit_per_host=50, keepalive_timeout=30, ttl_dns_cache=300
+    )
+    async with API(CODECOV_API_TOKEN, connector=connector) as api:
+        assert api._session.connector.limit == 200
+        assert api._session.connector.limit_per_host == 50
+
+
+async def test_api_with_connector_and_supplied_session():
+    session = ClientSession("https://test.com")
+    with pytest.raises(ValueError):
+        API(CODECOV_API_TOKEN, session, ConnectorConfig())
+    await session.close()
+
+
+async def test_codecov_connector_shared_with_children():
+    async with Codecov(
+        CODECOV_API_TOKEN, connector=ConnectorConfig(limit_per_host=8)
+    ) as codecov:
+        assert codecov._session.connector.limit_per_host == 8
+        assert codecov.repos._session is codecov._session
+        assert codecov.branches._session is codecov._session
+
+
+async def test_api_with_supplied_context():
+    async with API(CODECOV_API_TOKEN) as api:
+        child = API(context=api._context)
+
+        assert child._context is api._context
+        assert child._token == CODECOV_API_TOKEN
+        assert child._session is api._session
+        assert child._scheduler is api._scheduler
+
+
+async def test_api_with_context_and_token():
+    async with API(CODECOV_API_TOKEN) as api:
+        with pytest.raises(ValueError):
+            API(CODECOV_API_TOKEN, context=api._context)
+
+
+async def test_wrapped_results_share_context():
+    async with Codecov(CODECOV_API_TOKEN) as codecov:
+        paginated_list = PaginatedList(
+            2,
+            [
+                parse_user_data(
+                    {"service": "github", "username": f"user-{i}", "name": None}
+                )
+                for i in range(2)
+            ],
+            1,
+            parse_user_data,
+            context=codecov._context,
+        )
+        users = parse_paginated_list_api(
+            paginated_list, parse_user_api, owner_username="jazzband"
+        )
+
+        assert users._context is codecov._context
+        assert all(user._context is codecov._context for user in users)
+        assert [user.username for user in users] == ["user-0", "user-1"]
+        assert all(user.owner_username == "jazzband" for user in users)
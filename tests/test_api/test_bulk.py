@@ -0,0 +1,107 @@
+import asyncio
+import os
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from pycodecov import Codecov
+from pycodecov.api.bulk import _fetch_many
+from pycodecov.enums import Service
+from pycodecov.exceptions import CodecovError
+from pycodecov.parsers import parse_repo_data
+
+from .conftest import mock_response
+
+CODECOV_API_TOKEN = os.environ["CODECOV_API_TOKEN"]
+
+REPO = {
+    "name": "django-silk",
+    "private": False,
+    "updatestamp": "2024-03-25T16:38:25.747678Z",
+    "author": {"service": "github", "username": "jazzband", "name": None},
+    "language": "python",
+    "branch": "master",
+    "active": True,
+    "activated": True,
+    "totals": None,
+}
+
+
+def get_repo(url, **kwargs):
+    name = url.rstrip("/").rsplit("/", 1)[-1]
+
+    if name == "missing":
+        return mock_response({"detail": "Not found."}, 404)
+
+    return mock_response({**REPO, "name": name})
+
+
+async def test_get_repo_details_many():
+    with patch("pycodecov.api.api.ClientSession.get", side_effect=get_repo):
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            results = await codecov.repos.get_repo_details_many(
+                Service.GITHUB, "jazzband", ["django-silk", "missing", "pip-tools"]
+            )
+
+    assert [result.key for result in results] == ["django-silk", "missing", "pip-tools"]
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[0].value == parse_repo_data(REPO)
+    assert results[1].value is None
+    assert isinstance(results[1].error, CodecovError)
+    assert results[2].value.name == "pip-tools"
+
+
+async def test_iter_repo_details_many():
+    with patch("pycodecov.api.api.ClientSession.get", side_effect=get_repo):
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            results = [
+                result
+                async for result in codecov.repos.iter_repo_details_many(
+                    Service.GITHUB, "jazzband", ["django-silk", "missing"]
+                )
+            ]
+
+    assert sorted((result.key, result.ok) for result in results) == [
+        ("django-silk", True),
+        ("missing", False),
+    ]
+
+
+async def test_get_branch_details_many_fields():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(
+            {"name": "master", "updatestamp": "2024-03-25T16:38:25.747678Z"}
+        )
+
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            results = await codecov.branches.get_branch_details_many(
+                Service.GITHUB, "jazzband", "django-silk", ["master"], fields=("name",)
+            )
+
+    assert results[0].value.name == "master"
+    assert results[0].value.head_commit is None
+
+
+async def test_fetch_many_concurrency():
+    running = 0
+    max_running = 0
+
+    async def fetch(key):
+        nonlocal running, max_running
+
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+        return key.upper()
+
+    results = await _fetch_many([str(i) for i in range(10)], fetch, 3)
+
+    assert max_running == 3
+    assert [result.value for result in results] == [str(i) for i in range(10)]
+
+
+async def test_fetch_many_invalid_concurrency():
+    with pytest.raises(ValueError):
+        await _fetch_many(["a"], AsyncMock(), 0)
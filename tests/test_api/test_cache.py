@@ -0,0 +1,182 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from pycodecov import Codecov, schemas
+from pycodecov.api import Owner, RequestScheduler, ResponseCache
+from pycodecov.enums import Service
+
+CODECOV_API_TOKEN = os.environ["CODECOV_API_TOKEN"]
+
+REPO = {
+    "name": "django-silk",
+    "private": False,
+    "updatestamp": "2024-03-25T16:38:25.747678Z",
+    "author": {"service": "github", "username": "jazzband", "name": None},
+    "language": "python",
+    "branch": "master",
+    "active": True,
+    "activated": True,
+    "totals": None,
+}
+
+
+def test_response_cache_lru_eviction():
+    cache = ResponseCache(maxsize=2)
+
+    cache.set("repo_detail", "a", 1)
+    cache.set("repo_detail", "b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("repo_detail", "c", 3)
+
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    with pytest.raises(KeyError):
+        cache.get("b")
+
+
+def test_response_cache_ttl():
+    cache = ResponseCache(ttl=60, ttls={"repo_config": 0.5})
+
+    with patch("pycodecov.api.cache.time.monotonic") as monotonic:
+        monotonic.return_value = 100
+        cache.set("repo_detail", "detail", 1)
+        cache.set("repo_config", "config", 2)
+
+        monotonic.return_value = 101
+        assert cache.get("detail") == 1
+        with pytest.raises(KeyError):
+            cache.get("config")
+
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert len(cache) == 1
+
+
+def test_response_cache_zero_ttl():
+    cache = ResponseCache(ttls={"user_detail": 0})
+
+    cache.set("user_detail", "user", 1)
+
+    assert len(cache) == 0
+
+
+def test_response_cache_make_key():
+    assert ResponseCache.make_key(
+        "GET", "/url", {"b": "2", "a": "1"}
+    ) == ResponseCache.make_key("GET", "/url", {"a": "1", "b": "2"})
+    assert ResponseCache.make_key("GET", "/url") == ResponseCache.make_key(
+        "GET", "/url", {}
+    )
+    assert ResponseCache.make_key("GET", "/url", token="a") != ResponseCache.make_key(
+        "GET", "/url", token="b"
+    )
+
+
+async def test_owner_get_detail_cached():
+    cache = ResponseCache()
+
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        async with Owner(
+            Service.GITHUB,
+            "jazzband",
+            token=CODECOV_API_TOKEN,
+            scheduler=RequestScheduler(cache=cache),
+        ) as owner:
+            mocked.return_value.__aenter__.return_value.json.return_value = {
+                "service": "github",
+                "username": "jazzband",
+                "name": "test",
+            }
+
+            first = await owner.get_detail()
+            second = await owner.get_detail()
+
+            mocked.assert_called_once_with("/api/v2/github/jazzband")
+
+            assert isinstance(first, schemas.Owner)
+            assert first is second
+            assert cache.hits == 1
+            assert cache.misses == 1
+
+
+async def test_repo_detail_cache_shared_by_client():
+    cache = ResponseCache()
+
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        async with Codecov(
+            CODECOV_API_TOKEN, scheduler=RequestScheduler(cache=cache)
+        ) as codecov:
+            mocked.return_value.__aenter__.return_value.json.return_value = REPO
+
+            repo = await codecov.repos.get_repo_detail(
+                Service.GITHUB, "jazzband", "django-silk"
+            )
+            await codecov.repos.get_repo_detail(
+                Service.GITHUB, "jazzband", "django-silk"
+            )
+
+            mocked.assert_called_once_with("/api/v2/github/jazzband/repos/django-silk/")
+
+            assert repo.name == "django-silk"
+            assert cache.hits == 1
+
+
+async def test_response_cache_keyed_by_token():
+    scheduler = RequestScheduler(cache=ResponseCache())
+
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value.__aenter__.return_value.json.return_value = REPO
+
+        async with (
+            Codecov("public", scheduler=scheduler) as public,
+            Codecov("private", scheduler=scheduler) as private,
+        ):
+            await private.repos.get_repo_detail(
+                Service.GITHUB, "jazzband", "django-silk"
+            )
+            await public.repos.get_repo_detail(
+                Service.GITHUB, "jazzband", "django-silk"
+            )
+
+            assert mocked.call_count == 2
+            assert scheduler.cache.hits == 0
+
+
+async def test_no_cache_by_default():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        async with Owner(Service.GITHUB, "jazzband", token=CODECOV_API_TOKEN) as owner:
+            mocked.return_value.__aenter__.return_value.json.return_value = {
+                "service": "github",
+                "username": "jazzband",
+                "name": "test",
+            }
+
+            await owner.get_detail()
+            await owner.get_detail()
+
+            assert mocked.call_count == 2
+
+
+async def test_response_cache_projection():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value.__aenter__.return_value.json.return_value = REPO
+
+        async with Codecov(
+            CODECOV_API_TOKEN, scheduler=RequestScheduler(cache=ResponseCache())
+        ) as codecov:
+            projected = await codecov.repos.get_repo_detail(
+                Service.GITHUB, "jazzband", "django-silk", fields=("name",)
+            )
+            repo = await codecov.repos.get_repo_detail(
+                Service.GITHUB, "jazzband", "django-silk"
+            )
+
+            assert mocked.call_count == 2
+            assert projected.name == repo.name
+            assert projected.updatestamp is None
+            assert repo.updatestamp is not None
@@ -83,3 +83,32 @@ async def test_get_service_owner_fail():
                 await codecov.get_service_owners(Service.GITHUB)
 
             mocked.assert_called_once_with("/api/v2/github", params={})
+
+
+async def test_iter_service_owners():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            mocked.return_value.__aenter__.return_value.json.return_value = {
+                "count": 2,
+                "next": None,
+                "previous": None,
+                "results": [
+                    {"service": "github", "username": "string", "name": "string2"},
+                    {"service": "github", "username": "string3", "name": None},
+                ],
+                "total_pages": 1,
+            }
+
+            service_owners = [
+                service_owner
+                async for service_owner in codecov.iter_service_owners(
+                    Service.GITHUB, page_size=2
+                )
+            ]
+
+            mocked.assert_called_once_with("/api/v2/github", params={"page_size": "2"})
+
+            assert len(service_owners) == 2
+            assert all(isinstance(owner, Owner) for owner in service_owners)
+            assert service_owners[0].username == "string"
+            assert service_owners[1].username == "string3"
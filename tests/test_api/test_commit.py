@@ -0,0 +1,146 @@
+import os
+from datetime import datetime, timezone
+from unittest.mock import call, patch
+
+from pycodecov import Codecov
+from pycodecov.enums import Service
+from pycodecov.parsers import parse_commit_data, parse_commit_detail_data
+
+from .conftest import mock_response
+
+CODECOV_API_TOKEN = os.environ["CODECOV_API_TOKEN"]
+
+URL = "/api/v2/github/jazzband/repos/django-silk/commits/"
+
+
+def make_commit(commitid, day):
+    return {
+        "commitid": commitid,
+        "message": "message",
+        "timestamp": f"2024-03-{day:02}T12:00:00Z",
+        "ci_passed": True,
+        "author": None,
+        "branch": "master",
+        "totals": None,
+        "state": "complete",
+        "parent": None,
+    }
+
+
+COMMIT_DETAIL = {
+    **make_commit("a" * 40, 25),
+    "report": {"totals": {}, "files": []},
+}
+
+
+def paginated(results, page, total_pages):
+    return {
+        "count": 6,
+        "next": f"http://api.codecov.io{URL}?page={page + 1}"
+        if page < total_pages
+        else None,
+        "previous": None,
+        "results": results,
+        "total_pages": total_pages,
+    }
+
+
+async def test_commit_get_commit_list():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(
+            paginated([make_commit("a" * 40, 25)], 1, 1)
+        )
+
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            commits = await codecov.commits.get_commit_list(
+                Service.GITHUB, "jazzband", "django-silk", branch="master", page_size=5
+            )
+
+        mocked.assert_called_once_with(
+            URL, params={"branch": "master", "page_size": "5"}
+        )
+        assert commits.results == [parse_commit_data(make_commit("a" * 40, 25))]
+
+
+async def test_commit_iter_commit_list_since_until():
+    pages = [
+        paginated([make_commit("a", 25), make_commit("b", 24)], 1, 4),
+        paginated([make_commit("c", 23), make_commit("d", 20)], 2, 4),
+        paginated([make_commit("e", 19), make_commit("f", 18)], 3, 4),
+        paginated([make_commit("g", 17), make_commit("h", 16)], 4, 4),
+    ]
+
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.side_effect = [mock_response(page) for page in pages]
+
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            commits = [
+                commit.commitid
+                async for commit in codecov.commits.iter_commit_list(
+                    Service.GITHUB,
+                    "jazzband",
+                    "django-silk",
+                    since=datetime(2024, 3, 21, tzinfo=timezone.utc),
+                    until=datetime(2024, 3, 24, 12, tzinfo=timezone.utc),
+                )
+            ]
+
+        assert commits == ["b", "c"]
+        # The prefetch of the page after the one crossing `since` is cancelled
+        assert mocked.call_args_list == [
+            call(URL, params={}),
+            call(f"{URL}?page=2"),
+        ]
+
+
+async def test_commit_iter_commit_list_fields():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(
+            paginated([make_commit("a", 25), make_commit("b", 10)], 1, 1)
+        )
+
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            commits = [
+                commit
+                async for commit in codecov.commits.iter_commit_list(
+                    Service.GITHUB,
+                    "jazzband",
+                    "django-silk",
+                    since=datetime(2024, 3, 21, tzinfo=timezone.utc),
+                    fields=("commitid",),
+                )
+            ]
+
+        assert [commit.commitid for commit in commits] == ["a"]
+        assert commits[0].message is None
+
+
+async def test_commit_get_commit_detail():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(COMMIT_DETAIL)
+
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            commit = await codecov.commits.get_commit_detail(
+                Service.GITHUB, "jazzband", "django-silk", "a" * 40, lazy=True
+            )
+
+        mocked.assert_called_once_with(f"{URL}{'a' * 40}/")
+        assert not commit.report.parsed
+        assert commit == parse_commit_detail_data(COMMIT_DETAIL)
+
+
+async def test_commit_get_commit_details_many():
+    def get_commit(url, **kwargs):
+        if "missing" in url:
+            return mock_response({"detail": "Not found."}, 404)
+
+        return mock_response(COMMIT_DETAIL)
+
+    with patch("pycodecov.api.api.ClientSession.get", side_effect=get_commit):
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            results = await codecov.commits.get_commit_details_many(
+                Service.GITHUB, "jazzband", "django-silk", ["a" * 40, "missing"]
+            )
+
+    assert [result.ok for result in results] == [True, False]
+    assert results[0].value == parse_commit_detail_data(COMMIT_DETAIL)
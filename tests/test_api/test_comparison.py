@@ -0,0 +1,171 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from pycodecov import Codecov
+from pycodecov.enums import Service
+from pycodecov.parsers import parse_commit_comparison_data, parse_file_comparison_data
+
+from .conftest import mock_response
+
+CODECOV_API_TOKEN = os.environ["CODECOV_API_TOKEN"]
+
+URL = "/api/v2/github/jazzband/repos/django-silk/compare/"
+
+TOTAL = {
+    "files": 123,
+    "lines": 123,
+    "hits": 123,
+    "misses": 123,
+    "partials": 123,
+    "coverage": 12.3,
+    "branches": 123,
+    "methods": 123,
+    "messages": 123,
+    "sessions": 123,
+    "complexity": 12.3,
+    "complexity_total": 12.3,
+    "complexity_ratio": 12.3,
+    "diff": 123,
+}
+
+TOTALS = {"base": TOTAL, "head": TOTAL, "patch": None}
+
+LINE = {
+    "value": "print('silk')",
+    "number": {"base": 1, "head": 1},
+    "coverage": {"base": 1, "head": 0},
+    "is_diff": True,
+    "added": False,
+    "removed": False,
+    "sessions": 1,
+}
+
+
+def make_file(name):
+    return {
+        "name": {"base": name, "head": name},
+        "totals": TOTALS,
+        "has_diff": True,
+        "stats": None,
+        "change_summary": None,
+        "lines": [LINE, LINE],
+    }
+
+
+def make_comparison():
+    return {
+        "base_commit": "a" * 40,
+        "head_commit": "b" * 40,
+        "totals": TOTALS,
+        "commit_uploads": [],
+        "diff": {"git_commits": []},
+        "files": [make_file("silk/a.py"), make_file("silk/b.py")],
+        "untracked": [],
+        "has_unmerged_base_commits": False,
+    }
+
+
+async def test_comparison_get_comparison():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(make_comparison())
+
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            comparison = await codecov.comparisons.get_comparison(
+                Service.GITHUB, "jazzband", "django-silk", pullid=1
+            )
+
+        mocked.assert_called_once_with(URL, params={"pullid": "1"})
+        assert comparison == parse_commit_comparison_data(make_comparison())
+
+
+async def test_comparison_get_comparison_skip_lines():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(make_comparison())
+
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            comparison = await codecov.comparisons.get_comparison(
+                Service.GITHUB,
+                "jazzband",
+                "django-silk",
+                base="master",
+                head="develop",
+                skip_lines=True,
+            )
+
+        expected = parse_commit_comparison_data(make_comparison())
+
+        mocked.assert_called_once_with(
+            URL, params={"base": "master", "head": "develop"}
+        )
+        assert comparison.totals == expected.totals
+        assert [file.name for file in comparison.files] == [
+            file.name for file in expected.files
+        ]
+        assert all(file.lines is None for file in comparison.files)
+
+
+async def test_comparison_iter_comparison_files():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(make_comparison())
+
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            files = [
+                file
+                async for file in codecov.comparisons.iter_comparison_files(
+                    Service.GITHUB, "jazzband", "django-silk", base="a", head="b"
+                )
+            ]
+
+        assert files == [
+            parse_file_comparison_data(make_file("silk/a.py")),
+            parse_file_comparison_data(make_file("silk/b.py")),
+        ]
+
+
+async def test_comparison_iter_comparison_files_skip_lines():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(make_comparison())
+
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            files = [
+                file
+                async for file in codecov.comparisons.iter_comparison_files(
+                    Service.GITHUB,
+                    "jazzband",
+                    "django-silk",
+                    pullid=1,
+                    skip_lines=True,
+                )
+            ]
+
+        assert [file.name.head for file in files] == ["silk/a.py", "silk/b.py"]
+        assert all(file.lines is None for file in files)
+        assert files[0].totals == parse_file_comparison_data(make_file("a")).totals
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"base": "master", "head": "develop", "pullid": 1},
+        {"head": "develop", "pullid": 1},
+        {},
+        {"base": "master"},
+    ],
+)
+async def test_comparison_invalid_params(kwargs):
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            with pytest.raises(ValueError):
+                await codecov.comparisons.get_comparison(
+                    Service.GITHUB, "jazzband", "django-silk", **kwargs
+                )
+
+            with pytest.raises(ValueError):
+                async for _ in codecov.comparisons.iter_comparison_files(
+                    Service.GITHUB, "jazzband", "django-silk", **kwargs
+                ):
+                    pass
+
+        mocked.assert_not_called()
@@ -0,0 +1,131 @@
+import os
+from datetime import datetime, timezone
+from unittest.mock import call, patch
+
+import pytest
+
+from pycodecov import Codecov
+from pycodecov.enums import Interval, Service
+from pycodecov.parsers import parse_coverage_trend_data
+from pycodecov.schemas import CoverageTrendArray, EpochCoverageTrend
+
+from .conftest import mock_response
+
+CODECOV_API_TOKEN = os.environ["CODECOV_API_TOKEN"]
+
+URL = "/api/v2/github/jazzband/repos/django-silk"
+
+
+def make_point(day, coverage):
+    return {
+        "timestamp": f"2024-03-{day:02}T00:00:00Z",
+        "min": coverage - 1,
+        "max": coverage + 1,
+        "avg": coverage,
+    }
+
+
+def paginated(url, results, page, total_pages):
+    return {
+        "count": 4,
+        "next": f"http://api.codecov.io{url}?interval=1d&page={page + 1}"
+        if page < total_pages
+        else None,
+        "previous": None,
+        "results": results,
+        "total_pages": total_pages,
+    }
+
+
+async def test_coverage_trend_get_coverage_trend():
+    url = f"{URL}/flags/unit/coverage/"
+
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(paginated(url, [make_point(1, 80.0)], 1, 1))
+
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            trend = await codecov.coverage_trends.get_coverage_trend(
+                Service.GITHUB,
+                "jazzband",
+                "django-silk",
+                Interval.ONE_DAY,
+                start_date=datetime(2024, 3, 1, tzinfo=timezone.utc),
+                flag_name="unit",
+            )
+
+        mocked.assert_called_once_with(
+            url,
+            params={"interval": "1d", "start_date": "2024-03-01T00:00:00+00:00"},
+        )
+        assert trend.results == [parse_coverage_trend_data(make_point(1, 80.0))]
+
+
+async def test_coverage_trend_flag_and_component():
+    async with Codecov(CODECOV_API_TOKEN) as codecov:
+        with pytest.raises(ValueError):
+            await codecov.coverage_trends.get_coverage_trend(
+                Service.GITHUB,
+                "jazzband",
+                "django-silk",
+                Interval.ONE_DAY,
+                flag_name="unit",
+                component_id="api",
+            )
+
+
+async def test_coverage_trend_get_coverage_trend_array():
+    url = f"{URL}/components/api/coverage/"
+    pages = [
+        paginated(url, [make_point(1, 80.0), make_point(2, 81.0)], 1, 2),
+        paginated(url, [make_point(3, 82.0), make_point(4, 83.0)], 2, 2),
+    ]
+
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.side_effect = [mock_response(page) for page in pages]
+
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            trend = await codecov.coverage_trends.get_coverage_trend_array(
+                Service.GITHUB,
+                "jazzband",
+                "django-silk",
+                Interval.ONE_DAY,
+                component_id="api",
+            )
+
+    assert mocked.call_args_list == [
+        call(url, params={"interval": "1d"}),
+        call(f"{url}?interval=1d&page=2"),
+    ]
+    assert isinstance(trend, CoverageTrendArray)
+    assert list(trend.avgs) == [80.0, 81.0, 82.0, 83.0]
+    assert trend[0] == EpochCoverageTrend(1709251200, 79.0, 81.0, 80.0)
+
+
+async def test_coverage_trend_get_coverage_trend_arrays_many():
+    def get_trend(url, **kwargs):
+        if "missing" in url:
+            return mock_response({"detail": "Not found."}, 404)
+
+        coverage = 80.0 if "django-silk" in url else 90.0
+
+        return mock_response(
+            paginated(url, [make_point(1, coverage), make_point(2, coverage)], 1, 1)
+        )
+
+    with patch("pycodecov.api.api.ClientSession.get", side_effect=get_trend):
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            results = await codecov.coverage_trends.get_coverage_trend_arrays_many(
+                Service.GITHUB,
+                "jazzband",
+                ["django-silk", "missing", "pip-tools"],
+                Interval.ONE_DAY,
+            )
+
+    assert [result.ok for result in results] == [True, False, True]
+
+    merged = CoverageTrendArray.merge(result.value for result in results if result.ok)
+
+    assert len(merged) == 2
+    assert list(merged.mins) == [79.0, 79.0]
+    assert list(merged.maxs) == [91.0, 91.0]
+    assert list(merged.avgs) == [85.0, 85.0]
@@ -0,0 +1,167 @@
+import json
+import os
+from unittest.mock import patch
+
+from pycodecov import Codecov
+from pycodecov.api import HttpCache, HttpCacheEntry, RequestScheduler
+from pycodecov.enums import Service
+
+from .conftest import mock_response
+
+CODECOV_API_TOKEN = os.environ["CODECOV_API_TOKEN"]
+
+BRANCHES = {
+    "count": 1,
+    "next": None,
+    "previous": None,
+    "results": [
+        {"name": "main", "updatestamp": "2024-03-25T16:38:25.747678Z"},
+    ],
+    "total_pages": 1,
+}
+
+
+async def test_http_cache_revalidation(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(BRANCHES, headers={"ETag": '"v1"'})
+
+        http_cache = HttpCache(path)
+        async with Codecov(
+            CODECOV_API_TOKEN, scheduler=RequestScheduler(http_cache=http_cache)
+        ) as codecov:
+            await codecov.branches.get_branch_list(
+                Service.GITHUB, "jazzband", "django-silk"
+            )
+
+            mocked.assert_called_once_with(
+                "/api/v2/github/jazzband/repos/django-silk/branches/", params={}
+            )
+        http_cache.close()
+
+        # A new cache on the same database simulates a process restart
+        mocked.reset_mock()
+        mocked.return_value = mock_response(None, 304)
+
+        http_cache = HttpCache(path)
+        async with Codecov(
+            CODECOV_API_TOKEN, scheduler=RequestScheduler(http_cache=http_cache)
+        ) as codecov:
+            branches = await codecov.branches.get_branch_list(
+                Service.GITHUB, "jazzband", "django-silk"
+            )
+
+            mocked.assert_called_once_with(
+                "/api/v2/github/jazzband/repos/django-silk/branches/",
+                params={},
+                headers={"If-None-Match": '"v1"'},
+            )
+
+            assert len(branches) == 1
+            assert branches[0].name == "main"
+        http_cache.close()
+
+
+async def test_http_cache_updated_resource(tmp_path):
+    http_cache = HttpCache(tmp_path / "cache.sqlite3")
+    updated = {**BRANCHES, "results": [{**BRANCHES["results"][0], "name": "dev"}]}
+
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.side_effect = [
+            mock_response(BRANCHES, headers={"Last-Modified": "yesterday"}),
+            mock_response(updated, headers={"Last-Modified": "today"}),
+        ]
+
+        async with Codecov(
+            CODECOV_API_TOKEN, scheduler=RequestScheduler(http_cache=http_cache)
+        ) as codecov:
+            await codecov.branches.get_branch_list(
+                Service.GITHUB, "jazzband", "django-silk"
+            )
+            branches = await codecov.branches.get_branch_list(
+                Service.GITHUB, "jazzband", "django-silk"
+            )
+
+            assert mocked.call_args.kwargs["headers"] == {
+                "If-Modified-Since": "yesterday"
+            }
+            assert branches[0].name == "dev"
+
+        key = HttpCache.make_key(
+            codecov._session, "/api/v2/github/jazzband/repos/django-silk/branches/"
+        )
+        entry = await http_cache.get(key)
+
+        assert entry == HttpCacheEntry(None, "today", json.dumps(updated).encode())
+
+    http_cache.close()
+
+
+async def test_http_cache_without_validator(tmp_path):
+    http_cache = HttpCache(tmp_path / "cache.sqlite3")
+
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(BRANCHES)
+
+        async with Codecov(
+            CODECOV_API_TOKEN, scheduler=RequestScheduler(http_cache=http_cache)
+        ) as codecov:
+            await codecov.branches.get_branch_list(
+                Service.GITHUB, "jazzband", "django-silk"
+            )
+            await codecov.branches.get_branch_list(
+                Service.GITHUB, "jazzband", "django-silk"
+            )
+
+            assert "headers" not in mocked.call_args.kwargs
+
+    http_cache.close()
+
+
+async def test_http_cache_key_depends_on_token():
+    async with Codecov("token1") as codecov1, Codecov("token2") as codecov2:
+        assert HttpCache.make_key(codecov1._session, "/url") != HttpCache.make_key(
+            codecov2._session, "/url"
+        )
+        assert HttpCache.make_key(
+            codecov1._session, "/url", {"page": "1", "page_size": "2"}
+        ) == HttpCache.make_key(
+            codecov1._session, "/url", {"page_size": "2", "page": "1"}
+        )
+
+
+async def test_http_cache_max_entries():
+    http_cache = HttpCache(":memory:", max_entries=2)
+
+    with patch("pycodecov.api.http_cache.time.time") as now:
+        for stored_at, key in enumerate(("a", "b", "c")):
+            now.return_value = stored_at
+            await http_cache.set(key, HttpCacheEntry('"etag"', None, key.encode()))
+
+    assert await http_cache.get("a") is None
+    assert (await http_cache.get("b")).body == b"b"
+    assert (await http_cache.get("c")).body == b"c"
+
+    http_cache.close()
+
+
+async def test_http_cache_max_age():
+    http_cache = HttpCache(":memory:", max_age=60)
+
+    with patch("pycodecov.api.http_cache.time.time") as now:
+        now.return_value = 0
+        await http_cache.set("a", HttpCacheEntry('"etag"', None, b"a"))
+        now.return_value = 50
+        await http_cache.set("b", HttpCacheEntry('"etag"', None, b"b"))
+
+        now.return_value = 100
+        assert await http_cache.get("a") is None
+        assert (await http_cache.get("b")).body == b"b"
+
+        now.return_value = 200
+        http_cache.prune()
+
+    assert http_cache._connection.execute("SELECT * FROM responses").fetchall() == []
+
+    http_cache.close()
@@ -2,6 +2,7 @@ import os
 from unittest.mock import patch
 
 import pytest
+from aiohttp import ClientSession
 
 from pycodecov import Codecov, schemas
 from pycodecov.api import Owner, User
@@ -387,3 +388,22 @@ async def test_parse_owner_api():
     assert owner_api.service == Service.GITHUB
     assert owner_api.username == "kiraware"
     assert owner_api.name is None
+
+
+async def test_parse_owner_api_token_session():
+    owner = schemas.Owner(Service.GITHUB, "kiraware", None)
+
+    async with ClientSession() as session:
+        owner_api = parse_owner_api(owner, token=CODECOV_API_TOKEN, session=session)
+
+        assert owner_api._token == CODECOV_API_TOKEN
+        assert owner_api._session is session
+        assert owner_api.username == "kiraware"
+
+
+async def test_parse_owner_api_context_token():
+    owner = schemas.Owner(Service.GITHUB, "kiraware", None)
+
+    async with Codecov(CODECOV_API_TOKEN) as codecov:
+        with pytest.raises(ValueError):
+            parse_owner_api(owner, codecov._context, token=CODECOV_API_TOKEN)
@@ -0,0 +1,258 @@
+import asyncio
+import os
+from contextlib import aclosing
+from unittest.mock import patch
+
+import pytest
+
+from pycodecov import Codecov
+from pycodecov.api import Owner, PaginatedList
+from pycodecov.enums import Service
+from pycodecov.exceptions import CodecovError
+from pycodecov.parsers import parse_owner_data
+
+from .conftest import mock_response
+
+CODECOV_API_TOKEN = os.environ["CODECOV_API_TOKEN"]
+
+
+def owner_page(page, total_pages):
+    return {
+        "count": total_pages,
+        "next": (
+            f"http://api.codecov.io/api/v2/github?page={page + 1}"
+            if page < total_pages
+            else None
+        ),
+        "previous": (
+            f"http://api.codecov.io/api/v2/github?page={page - 1}" if page > 1 else None
+        ),
+        "results": [
+            {"service": "github", "username": f"owner{page}", "name": None},
+        ],
+        "total_pages": total_pages,
+    }
+
+
+def mock_pages(url, **kwargs):
+    if url == "/api/v2/github":
+        return mock_response(owner_page(1, 4))
+
+    return mock_response(owner_page(int(url.rsplit("=", 1)[1]), 4))
+
+
+class InFlight:
+    """
+    Count the responses being read at the same time.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.peak = 0
+
+    def wrap(self, context):
+        response = context.__aenter__.return_value
+
+        async def enter(*args):
+            self.count += 1
+            self.peak = max(self.peak, self.count)
+            # Hold the response so the other requests can start meanwhile
+            await asyncio.sleep(0.01)
+
+            return response
+
+        async def exit(*args):
+            self.count -= 1
+
+        context.__aenter__.side_effect = enter
+        context.__aexit__.side_effect = exit
+
+        return context
+
+
+async def test_paginated_list_fetch_all_concurrency():
+    in_flight = InFlight()
+
+    def get_page(url, **kwargs):
+        return in_flight.wrap(mock_response(owner_page(int(url.rsplit("=", 1)[1]), 8)))
+
+    with patch("pycodecov.api.api.ClientSession.get", side_effect=get_page) as mocked:
+        async with PaginatedList(
+            8,
+            [parse_owner_data(owner_page(1, 8)["results"][0])],
+            8,
+            parse_owner_data,
+            "/api/v2/github?page=2",
+            token=CODECOV_API_TOKEN,
+        ) as paginated_list:
+            all_paginated_list = await paginated_list.fetch_all(concurrency=3)
+
+    assert mocked.call_count == 7
+    assert in_flight.peak == 3
+    assert len(all_paginated_list) == 8
+
+
+async def test_paginated_list_api_fetch_all():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.side_effect = mock_pages
+
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            service_owners = await codecov.get_service_owners(Service.GITHUB)
+            all_service_owners = await service_owners.fetch_all(concurrency=2)
+
+            assert mocked.call_count == 4
+            mocked.assert_any_call("/api/v2/github?page=2")
+            mocked.assert_any_call("/api/v2/github?page=3")
+            mocked.assert_any_call("/api/v2/github?page=4")
+
+            assert len(all_service_owners) == 4
+            assert all_service_owners.next is None
+            assert all_service_owners.previous is None
+            assert all_service_owners.total_pages == 4
+            assert all(isinstance(owner, Owner) for owner in all_service_owners)
+            assert [owner.username for owner in all_service_owners] == [
+                "owner1",
+                "owner2",
+                "owner3",
+                "owner4",
+            ]
+
+
+async def test_paginated_list_fetch_all():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.side_effect = mock_pages
+
+        async with PaginatedList(
+            4,
+            [parse_owner_data(owner_page(2, 4)["results"][0])],
+            4,
+            parse_owner_data,
+            "/api/v2/github?page=3",
+            "/api/v2/github?page=1",
+            CODECOV_API_TOKEN,
+        ) as paginated_list:
+            all_paginated_list = await paginated_list.fetch_all()
+
+            assert mocked.call_count == 2
+            assert all_paginated_list.previous == "/api/v2/github?page=1"
+            assert [owner.username for owner in all_paginated_list] == [
+                "owner2",
+                "owner3",
+                "owner4",
+            ]
+
+
+async def test_paginated_list_fetch_all_last_page():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        async with PaginatedList(
+            1, [], 1, parse_owner_data, token=CODECOV_API_TOKEN
+        ) as paginated_list:
+            all_paginated_list = await paginated_list.fetch_all()
+
+            mocked.assert_not_called()
+            assert len(all_paginated_list) == 0
+
+
+async def test_paginated_list_fetch_all_fail():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response({"error": "msg"}, 400)
+
+        async with PaginatedList(
+            4,
+            [],
+            4,
+            parse_owner_data,
+            "/api/v2/github?page=2",
+            token=CODECOV_API_TOKEN,
+        ) as paginated_list:
+            with pytest.raises(CodecovError, match="{'error': 'msg'}"):
+                await paginated_list.fetch_all()
+
+
+async def test_paginated_list_api_async_iteration():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.side_effect = mock_pages
+
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            service_owners = await codecov.get_service_owners(Service.GITHUB)
+            usernames = [owner.username async for owner in service_owners]
+
+            assert mocked.call_count == 4
+            assert usernames == ["owner1", "owner2", "owner3", "owner4"]
+
+
+async def test_paginated_list_async_iteration_break():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.side_effect = mock_pages
+
+        async with PaginatedList(
+            4,
+            [parse_owner_data(owner_page(1, 4)["results"][0])],
+            4,
+            parse_owner_data,
+            "/api/v2/github?page=2",
+            token=CODECOV_API_TOKEN,
+        ) as paginated_list:
+            iterator = aiter(paginated_list)
+            owner = await anext(iterator)
+            # Let the prefetch of the next page start
+            await asyncio.sleep(0.01)
+            await iterator.aclose()
+            await asyncio.sleep(0.01)
+
+            assert owner.username == "owner1"
+            mocked.assert_called_once_with("/api/v2/github?page=2")
+
+
+async def test_paginated_list_async_iteration_prefetch():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.side_effect = mock_pages
+
+        async with PaginatedList(
+            4,
+            [parse_owner_data(owner_page(1, 4)["results"][0])],
+            4,
+            parse_owner_data,
+            "/api/v2/github?page=2",
+            token=CODECOV_API_TOKEN,
+        ) as paginated_list:
+            requested = []
+
+            async for owner in paginated_list:
+                # Work on the result, the next page is requested meanwhile
+                await asyncio.sleep(0.01)
+                requested.append((owner.username, mocked.call_count))
+
+    # Page N + 1 is requested while the result of page N is being consumed
+    assert requested == [("owner1", 1), ("owner2", 2), ("owner3", 3), ("owner4", 3)]
+
+
+async def test_paginated_list_async_iteration_cancel_prefetch():
+    cancelled = asyncio.Event()
+
+    async def never_respond(*args):
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value.__aenter__.side_effect = never_respond
+
+        async with PaginatedList(
+            4,
+            [parse_owner_data(owner_page(1, 4)["results"][0])],
+            4,
+            parse_owner_data,
+            "/api/v2/github?page=2",
+            token=CODECOV_API_TOKEN,
+        ) as paginated_list:
+            async with aclosing(aiter(paginated_list)) as iterator:
+                async for _ in iterator:
+                    await asyncio.sleep(0.01)
+                    break
+
+            await asyncio.wait_for(cancelled.wait(), 1)
+
+    mocked.assert_called_once_with("/api/v2/github?page=2")
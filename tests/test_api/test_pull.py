@@ -0,0 +1,137 @@
+import os
+from datetime import datetime, timezone
+from unittest.mock import call, patch
+
+from pycodecov import Codecov
+from pycodecov.enums import PullState, Service
+from pycodecov.parsers import parse_pull_data
+
+from .conftest import mock_response
+
+CODECOV_API_TOKEN = os.environ["CODECOV_API_TOKEN"]
+
+URL = "/api/v2/github/jazzband/repos/django-silk/pulls/"
+
+TOTAL = {
+    "files": 123,
+    "lines": 123,
+    "hits": 123,
+    "misses": 123,
+    "partials": 123,
+    "coverage": 12.3,
+    "branches": 123,
+    "methods": 123,
+    "sessions": 123,
+    "complexity": 12.3,
+    "complexity_total": 12.3,
+    "complexity_ratio": 12.3,
+}
+
+
+def make_pull(pullid, day):
+    return {
+        "pullid": pullid,
+        "title": "title",
+        "base_total": TOTAL,
+        "head_total": TOTAL,
+        "updatestamp": f"2024-03-{day:02}T12:00:00Z",
+        "state": "open",
+        "ci_passed": True,
+        "author": None,
+    }
+
+
+def paginated(results, page, total_pages):
+    return {
+        "count": 8,
+        "next": f"http://api.codecov.io{URL}?page={page + 1}"
+        if page < total_pages
+        else None,
+        "previous": None,
+        "results": results,
+        "total_pages": total_pages,
+    }
+
+
+async def test_pull_get_pull_list():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(paginated([make_pull(1, 25)], 1, 1))
+
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            pulls = await codecov.pulls.get_pull_list(
+                Service.GITHUB,
+                "jazzband",
+                "django-silk",
+                PullState.MERGED,
+                "-pullid",
+            )
+
+        mocked.assert_called_once_with(
+            URL, params={"state": PullState.MERGED, "ordering": "-pullid"}
+        )
+        assert pulls.results == [parse_pull_data(make_pull(1, 25))]
+
+
+async def test_pull_iter_pull_updates():
+    pages = [
+        paginated([make_pull(8, 25), make_pull(7, 24)], 1, 4),
+        paginated([make_pull(6, 21), make_pull(5, 19)], 2, 4),
+        paginated([make_pull(4, 18), make_pull(3, 17)], 3, 4),
+        paginated([make_pull(2, 16), make_pull(1, 15)], 4, 4),
+    ]
+
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.side_effect = [mock_response(page) for page in pages]
+
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            pulls = [
+                pull.pullid
+                async for pull in codecov.pulls.iter_pull_updates(
+                    Service.GITHUB,
+                    "jazzband",
+                    "django-silk",
+                    datetime(2024, 3, 21, 12, tzinfo=timezone.utc),
+                )
+            ]
+
+        assert pulls == [8, 7, 6]
+        # The prefetch of the page after the one crossing the watermark is cancelled
+        assert mocked.call_args_list == [
+            call(URL, params={"ordering": "-updatestamp"}),
+            call(f"{URL}?page=2"),
+        ]
+
+
+async def test_pull_iter_pull_updates_fields():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(
+            paginated([make_pull(2, 25), make_pull(1, 10)], 1, 1)
+        )
+
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            pulls = [
+                pull
+                async for pull in codecov.pulls.iter_pull_updates(
+                    Service.GITHUB,
+                    "jazzband",
+                    "django-silk",
+                    datetime(2024, 3, 21, tzinfo=timezone.utc),
+                    fields=("pullid",),
+                )
+            ]
+
+        assert [pull.pullid for pull in pulls] == [2]
+        assert pulls[0].title is None
+
+
+async def test_pull_get_pull_detail():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(make_pull(1, 25))
+
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            pull = await codecov.pulls.get_pull_detail(
+                Service.GITHUB, "jazzband", "django-silk", 1
+            )
+
+        mocked.assert_called_once_with(f"{URL}1/")
+        assert pull == parse_pull_data(make_pull(1, 25))
@@ -0,0 +1,159 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from pycodecov import Codecov
+from pycodecov.api import RequestScheduler, ResponseCache
+from pycodecov.enums import Service
+from pycodecov.parsers import (
+    SchemaDecoder,
+    parse_commit_coverage_report_data,
+    parse_report_file_data,
+)
+from pycodecov.schemas import LineCoverageArray
+
+from .conftest import mock_response
+
+CODECOV_API_TOKEN = os.environ["CODECOV_API_TOKEN"]
+
+URL = "/api/v2/github/jazzband/repos/django-silk"
+
+TOTALS = {
+    "files": 1,
+    "lines": 100,
+    "hits": 33,
+    "misses": 34,
+    "partials": 33,
+    "coverage": 33.0,
+    "branches": 0,
+    "methods": 0,
+    "messages": 0,
+    "sessions": 1,
+    "complexity": 0.0,
+    "complexity_total": 0.0,
+    "complexity_ratio": 0,
+    "diff": 0,
+}
+
+REPORT_FILE = {
+    "name": "silk/models.py",
+    "totals": TOTALS,
+    "line_coverage": [{"number": n, "coverage": n % 3} for n in range(1, 101)],
+}
+
+REPORT = {
+    "totals": {
+        "files": 1,
+        "lines": 100,
+        "hits": 33,
+        "misses": 34,
+        "partials": 33,
+        "coverage": 33.0,
+        "branches": 0,
+        "methods": 0,
+        "messages": 0,
+        "sessions": 1,
+        "complexity": 0.0,
+        "complexity_total": 0.0,
+        "complexity_ratio": 0,
+        "diff": 0,
+    },
+    "commit_file_url": "string",
+    "files": [REPORT_FILE],
+}
+
+
+async def test_report_get_report():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(REPORT)
+
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            report = await codecov.reports.get_report(
+                Service.GITHUB, "jazzband", "django-silk", path="silk/", compact=True
+            )
+
+        mocked.assert_called_once_with(f"{URL}/report/", params={"path": "silk/"})
+        assert isinstance(report.files[0].line_coverage, LineCoverageArray)
+        assert report.totals == parse_commit_coverage_report_data(REPORT).totals
+
+
+async def test_report_compact_with_schema_decoder():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.side_effect = [mock_response(REPORT), mock_response(REPORT_FILE)]
+
+        async with Codecov(
+            CODECOV_API_TOKEN,
+            scheduler=RequestScheduler(schema_decoder=SchemaDecoder()),
+        ) as codecov:
+            report = await codecov.reports.get_report(
+                Service.GITHUB, "jazzband", "django-silk", compact=True
+            )
+            report_file = await codecov.reports.get_file_report(
+                Service.GITHUB,
+                "jazzband",
+                "django-silk",
+                "silk/models.py",
+                compact=True,
+            )
+
+    assert isinstance(report.files[0].line_coverage, LineCoverageArray)
+    assert isinstance(report_file.line_coverage, LineCoverageArray)
+    assert list(report_file.line_coverage) == (
+        parse_report_file_data(REPORT_FILE).line_coverage
+    )
+
+
+async def test_report_get_file_report():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(REPORT_FILE)
+
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            report_file = await codecov.reports.get_file_report(
+                Service.GITHUB, "jazzband", "django-silk", "silk/models.py", sha="abc"
+            )
+
+        mocked.assert_called_once_with(
+            f"{URL}/file_report/silk/models.py", params={"sha": "abc"}
+        )
+        assert report_file == parse_report_file_data(REPORT_FILE)
+
+
+async def test_report_get_file_report_line_range():
+    cache = ResponseCache()
+
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(REPORT_FILE)
+
+        async with Codecov(
+            CODECOV_API_TOKEN, scheduler=RequestScheduler(cache=cache)
+        ) as codecov:
+            report_file = await codecov.reports.get_file_report(
+                Service.GITHUB,
+                "jazzband",
+                "django-silk",
+                "silk/models.py",
+                line_range=range(10, 20),
+            )
+
+    assert [line.number for line in report_file.line_coverage] == list(range(10, 20))
+    assert (
+        report_file.line_coverage
+        == parse_report_file_data(REPORT_FILE).line_coverage[9:19]
+    )
+    assert len(cache) == 0
+
+
+async def test_report_get_file_report_line_range_step():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            with pytest.raises(ValueError):
+                await codecov.reports.get_file_report(
+                    Service.GITHUB,
+                    "jazzband",
+                    "django-silk",
+                    "silk/models.py",
+                    line_range=range(1, 50, 2),
+                )
+
+    mocked.assert_not_called()
@@ -0,0 +1,141 @@
+import os
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aiohttp import ServerDisconnectedError
+
+from pycodecov import Codecov
+from pycodecov.api import RequestScheduler, RetryPolicy
+from pycodecov.enums import Service
+from pycodecov.exceptions import CodecovError
+
+from .conftest import mock_response
+
+CODECOV_API_TOKEN = os.environ["CODECOV_API_TOKEN"]
+
+
+SERVICE_OWNERS = {
+    "count": 1,
+    "next": None,
+    "previous": None,
+    "results": [
+        {"service": "github", "username": "string", "name": "string2"},
+    ],
+    "total_pages": 1,
+}
+
+
+def retry_scheduler(**kwargs):
+    return RequestScheduler(
+        retry_policy=RetryPolicy(backoff_base=0.001, backoff_cap=0.01, **kwargs)
+    )
+
+
+def test_retry_policy_delay():
+    policy = RetryPolicy(backoff_base=1, backoff_cap=5, jitter=False)
+
+    assert [policy.get_delay(attempt) for attempt in range(1, 6)] == [1, 2, 4, 5, 5]
+
+
+def test_retry_policy_delay_with_jitter():
+    policy = RetryPolicy(backoff_base=1, backoff_cap=5)
+
+    for attempt in range(1, 10):
+        assert 0 <= policy.get_delay(attempt) <= 5
+
+
+def test_retry_policy_invalid_max_attempts():
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+
+async def test_retry_status():
+    events = []
+
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.side_effect = [
+            mock_response({"detail": "bad gateway"}, 502),
+            mock_response(SERVICE_OWNERS),
+        ]
+
+        async with Codecov(
+            CODECOV_API_TOKEN, scheduler=retry_scheduler(hooks=(events.append,))
+        ) as codecov:
+            service_owners = await codecov.get_service_owners(Service.GITHUB)
+
+            assert mocked.call_count == 2
+            assert service_owners[0].username == "string"
+            assert len(events) == 1
+            assert events[0].url == "/api/v2/github"
+            assert events[0].attempt == 1
+            assert events[0].status == 502
+            assert events[0].exception is None
+
+
+async def test_retry_exception():
+    events = []
+    hook = AsyncMock(side_effect=events.append)
+
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.side_effect = [
+            ServerDisconnectedError(),
+            mock_response(SERVICE_OWNERS),
+        ]
+
+        async with Codecov(
+            CODECOV_API_TOKEN, scheduler=retry_scheduler(hooks=(hook,))
+        ) as codecov:
+            service_owners = await codecov.get_service_owners(Service.GITHUB)
+
+            assert mocked.call_count == 2
+            assert service_owners[0].username == "string"
+            hook.assert_awaited_once()
+            assert isinstance(events[0].exception, ServerDisconnectedError)
+
+
+async def test_retry_exhausted_status():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response({"detail": "unavailable"}, 503)
+
+        async with Codecov(
+            CODECOV_API_TOKEN, scheduler=retry_scheduler(max_attempts=3)
+        ) as codecov:
+            with pytest.raises(CodecovError, match="unavailable"):
+                await codecov.get_service_owners(Service.GITHUB)
+
+            assert mocked.call_count == 3
+
+
+async def test_retry_exhausted_exception():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.side_effect = ServerDisconnectedError()
+
+        async with Codecov(
+            CODECOV_API_TOKEN, scheduler=retry_scheduler(max_attempts=2)
+        ) as codecov:
+            with pytest.raises(ServerDisconnectedError):
+                await codecov.get_service_owners(Service.GITHUB)
+
+            assert mocked.call_count == 2
+
+
+async def test_no_retry_on_client_error():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response({"detail": "not found"}, 404)
+
+        async with Codecov(CODECOV_API_TOKEN, scheduler=retry_scheduler()) as codecov:
+            with pytest.raises(CodecovError, match="not found"):
+                await codecov.get_service_owners(Service.GITHUB)
+
+            mocked.assert_called_once()
+
+
+async def test_no_retry_without_policy():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.side_effect = ServerDisconnectedError()
+
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            with pytest.raises(ServerDisconnectedError):
+                await codecov.get_service_owners(Service.GITHUB)
+
+            mocked.assert_called_once()
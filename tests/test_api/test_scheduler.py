@@ -0,0 +1,337 @@
+import asyncio
+import json
+import os
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pycodecov import Codecov
+from pycodecov.api import RequestScheduler
+from pycodecov.enums import Service
+from pycodecov.exceptions import CodecovError
+from pycodecov.parsers import SchemaDecoder, StringTable, parse_repo_data
+
+from .conftest import mock_response
+
+CODECOV_API_TOKEN = os.environ["CODECOV_API_TOKEN"]
+
+
+SERVICE_OWNERS = {
+    "count": 1,
+    "next": None,
+    "previous": None,
+    "results": [
+        {"service": "github", "username": "string", "name": "string2"},
+    ],
+    "total_pages": 1,
+}
+
+REPO = {
+    "name": "django-silk",
+    "private": False,
+    "updatestamp": "2024-03-25T16:38:25.747678Z",
+    "author": {"service": "github", "username": "jazzband", "name": None},
+    "language": "python",
+    "branch": "master",
+    "active": True,
+    "activated": True,
+    "totals": None,
+}
+
+
+def test_scheduler_invalid_arguments():
+    with pytest.raises(ValueError):
+        RequestScheduler(rate=0)
+
+    with pytest.raises(ValueError):
+        RequestScheduler(burst=0)
+
+
+async def test_scheduler_token_bucket():
+    scheduler = RequestScheduler(rate=50, burst=2)
+
+    start = time.monotonic()
+    for _ in range(6):
+        await scheduler.acquire()
+    elapsed = time.monotonic() - start
+
+    # 2 burst tokens are free, the 4 others are refilled at 50 per second
+    assert elapsed >= 4 / 50 * 0.9
+
+
+async def test_scheduler_requeue_rate_limited_request():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.side_effect = [
+            mock_response({"detail": "throttled"}, 429, {"Retry-After": "0.01"}),
+            mock_response(SERVICE_OWNERS),
+        ]
+
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            service_owners = await codecov.get_service_owners(Service.GITHUB)
+
+            assert mocked.call_count == 2
+            assert service_owners[0].username == "string"
+
+
+async def test_scheduler_requeue_limit():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(
+            {"detail": "throttled"}, 429, {"Retry-After": "0"}
+        )
+
+        async with Codecov(
+            CODECOV_API_TOKEN, scheduler=RequestScheduler(max_requeues=2)
+        ) as codecov:
+            with pytest.raises(CodecovError, match="throttled"):
+                await codecov.get_service_owners(Service.GITHUB)
+
+            assert mocked.call_count == 3
+
+
+async def test_scheduler_shared_with_children():
+    scheduler = RequestScheduler(rate=10)
+
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(SERVICE_OWNERS)
+
+        async with Codecov(CODECOV_API_TOKEN, scheduler=scheduler) as codecov:
+            service_owners = await codecov.get_service_owners(Service.GITHUB)
+
+            assert codecov._scheduler is scheduler
+            assert codecov.repos._scheduler is scheduler
+            assert service_owners._scheduler is scheduler
+            assert service_owners[0]._scheduler is scheduler
+
+
+def test_scheduler_update_exhausted_rate_limit():
+    scheduler = RequestScheduler()
+
+    delay = scheduler.update(
+        200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"}
+    )
+
+    assert delay is None
+    assert scheduler._paused_until - time.monotonic() > 29
+
+
+def test_scheduler_update_retry_after_http_date():
+    scheduler = RequestScheduler()
+
+    delay = scheduler.update(429, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+
+    assert delay == 0
+
+
+def test_scheduler_update_exhausted_rate_limit_epoch():
+    scheduler = RequestScheduler()
+
+    with patch("pycodecov.api.scheduler.time.time", return_value=1_700_000_000):
+        scheduler.update(
+            200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1700000030"}
+        )
+
+    assert 29 < scheduler._paused_until - time.monotonic() <= 30
+
+
+def test_scheduler_update_retry_after_naive_http_date(monkeypatch):
+    scheduler = RequestScheduler()
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+
+    try:
+        # 2015-10-21T07:28:00Z
+        with patch("pycodecov.api.scheduler.time.time", return_value=1445412480):
+            delay = scheduler.update(
+                429, {"Retry-After": "Wed, 21 Oct 2015 07:28:30 -0000"}
+            )
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+    assert delay == 30
+
+
+def test_scheduler_update_retry_after_missing():
+    scheduler = RequestScheduler(default_retry_after=3)
+
+    assert scheduler.update(429, {}) == 3
+
+
+async def test_scheduler_coalesce_identical_requests():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(REPO)
+
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            repos = await asyncio.gather(
+                *(
+                    codecov.repos.get_repo_detail(
+                        Service.GITHUB, "jazzband", "django-silk"
+                    )
+                    for _ in range(50)
+                )
+            )
+
+            mocked.assert_called_once_with("/api/v2/github/jazzband/repos/django-silk/")
+
+            assert all(repo is repos[0] for repo in repos)
+            assert codecov._scheduler._in_flight == {}
+
+
+async def test_scheduler_coalesce_shares_exception():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response({"detail": "not found"}, 404)
+
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            results = await asyncio.gather(
+                *(
+                    codecov.get_service_owners(Service.GITHUB, page_size=10)
+                    for _ in range(5)
+                ),
+                return_exceptions=True,
+            )
+
+            mocked.assert_called_once()
+            assert all(isinstance(result, CodecovError) for result in results)
+
+
+async def test_scheduler_coalesce_cancel_every_waiter():
+    scheduler = RequestScheduler()
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def operation():
+        started.set()
+
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    first = asyncio.ensure_future(scheduler.run_once("key", operation))
+    second = asyncio.ensure_future(scheduler.run_once("key", operation))
+    await started.wait()
+
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    assert not cancelled.is_set()
+
+    second.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await second
+
+    await asyncio.wait_for(cancelled.wait(), 1)
+    await asyncio.sleep(0)
+
+    assert scheduler._in_flight == {}
+    assert scheduler._waiters == {}
+
+
+async def test_scheduler_coalesce_different_requests():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(SERVICE_OWNERS)
+
+        async with Codecov(CODECOV_API_TOKEN) as codecov:
+            await asyncio.gather(
+                codecov.get_service_owners(Service.GITHUB, page=1),
+                codecov.get_service_owners(Service.GITHUB, page=2),
+            )
+
+            assert mocked.call_count == 2
+
+
+async def test_scheduler_coalesce_disabled():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(REPO)
+
+        async with Codecov(
+            CODECOV_API_TOKEN, scheduler=RequestScheduler(coalesce=False)
+        ) as codecov:
+            await asyncio.gather(
+                *(
+                    codecov.repos.get_repo_detail(
+                        Service.GITHUB, "jazzband", "django-silk"
+                    )
+                    for _ in range(3)
+                )
+            )
+
+            assert mocked.call_count == 3
+
+
+async def test_scheduler_json_loads():
+    loads = MagicMock(side_effect=json.loads)
+
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(REPO)
+
+        async with Codecov(
+            CODECOV_API_TOKEN, scheduler=RequestScheduler(json_loads=loads)
+        ) as codecov:
+            await codecov.repos.get_repo_detail(
+                Service.GITHUB, "jazzband", "django-silk"
+            )
+
+            response = mocked.return_value.__aenter__.return_value
+            response.json.assert_called_once_with(loads=loads)
+
+
+def test_scheduler_default_json_loads():
+    try:
+        import orjson
+    except ImportError:
+        assert RequestScheduler().json_loads is json.loads
+    else:
+        assert RequestScheduler().json_loads is orjson.loads
+
+
+async def test_scheduler_schema_decoder():
+    pytest.importorskip("msgspec")
+
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        context = mock_response(None)
+        context.__aenter__.return_value.read = AsyncMock(
+            return_value=json.dumps(REPO).encode()
+        )
+        mocked.return_value = context
+
+        async with Codecov(
+            CODECOV_API_TOKEN,
+            scheduler=RequestScheduler(schema_decoder=SchemaDecoder()),
+        ) as codecov:
+            repo = await codecov.repos.get_repo_detail(
+                Service.GITHUB, "jazzband", "django-silk"
+            )
+
+            context.__aenter__.return_value.json.assert_not_called()
+            assert repo == parse_repo_data(REPO)
+
+
+async def test_scheduler_strings():
+    repos = json.loads(
+        json.dumps(
+            {
+                "count": 2,
+                "next": None,
+                "previous": None,
+                "results": [REPO, {**REPO, "name": "django-silk-2"}],
+                "total_pages": 1,
+            }
+        )
+    )
+
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(repos)
+
+        async with Codecov(
+            CODECOV_API_TOKEN, scheduler=RequestScheduler(strings=StringTable())
+        ) as codecov:
+            repo_list = await codecov.repos.get_repo_list(Service.GITHUB, "jazzband")
+            first, second = repo_list.results
+
+            assert first.branch is second.branch
+            assert first.author.username is second.author.username
+            assert first == parse_repo_data(REPO)
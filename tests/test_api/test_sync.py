@@ -0,0 +1,135 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from pycodecov import SyncCodecov
+from pycodecov.api.sync import _SyncApi
+from pycodecov.enums import Service
+from pycodecov.exceptions import CodecovError
+from pycodecov.parsers import parse_branch_data, parse_repo_data
+
+from .conftest import mock_response
+
+CODECOV_API_TOKEN = os.environ["CODECOV_API_TOKEN"]
+
+REPO = {
+    "name": "django-silk",
+    "private": False,
+    "updatestamp": "2024-03-25T16:38:25.747678Z",
+    "author": {"service": "github", "username": "jazzband", "name": None},
+    "language": "python",
+    "branch": "master",
+    "active": True,
+    "activated": True,
+    "totals": None,
+}
+
+BRANCH = {"name": "master", "updatestamp": "2024-03-25T16:38:25.747678Z"}
+
+
+def paginated(results, next=None):
+    return {
+        "count": 2,
+        "next": next,
+        "previous": None,
+        "results": results,
+        "total_pages": 2,
+    }
+
+
+def test_sync_codecov():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(REPO)
+
+        with SyncCodecov(CODECOV_API_TOKEN) as codecov:
+            repo = codecov.repos.get_repo_detail(
+                Service.GITHUB, "jazzband", "django-silk"
+            )
+
+            assert repo == parse_repo_data(REPO)
+
+        assert not codecov._thread.is_alive()
+        assert codecov._loop.is_closed()
+
+
+def test_sync_codecov_error():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response({"detail": "Not found."}, 404)
+
+        with SyncCodecov(CODECOV_API_TOKEN) as codecov:
+            with pytest.raises(CodecovError):
+                codecov.repos.get_repo_detail(Service.GITHUB, "jazzband", "missing")
+
+
+def test_sync_codecov_iterate():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.side_effect = [
+            mock_response(
+                paginated(
+                    [BRANCH],
+                    "https://api.codecov.io/api/v2/github/jazzband/repos/django-silk"
+                    "/branches/?page=2",
+                )
+            ),
+            mock_response(paginated([{**BRANCH, "name": "main"}])),
+        ]
+
+        with SyncCodecov(CODECOV_API_TOKEN) as codecov:
+            branches = list(
+                codecov.branches.iter_branch_list(
+                    Service.GITHUB, "jazzband", "django-silk"
+                )
+            )
+
+    assert branches == [
+        parse_branch_data(BRANCH),
+        parse_branch_data({**BRANCH, "name": "main"}),
+    ]
+
+
+def test_sync_codecov_wraps_api_results():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(
+            paginated([{"service": "github", "username": "jazzband", "name": None}])
+        )
+
+        with SyncCodecov(CODECOV_API_TOKEN) as codecov:
+            owners = codecov.get_service_owners(Service.GITHUB)
+            owner = owners[0]
+
+            mocked.return_value = mock_response(
+                {"service": "github", "username": "jazzband", "name": "Jazzband"}
+            )
+
+            assert len(owners) == 1
+            assert owner.username == "jazzband"
+            assert owner.get_detail().name == "Jazzband"
+
+
+def test_sync_codecov_hash():
+    with SyncCodecov(CODECOV_API_TOKEN) as codecov:
+        view = _SyncApi(codecov._api, codecov._run)
+
+        assert view == codecov
+        assert hash(view) == hash(codecov) == hash(codecov._api)
+        assert len({codecov, view}) == 1
+
+
+def test_sync_codecov_concurrent_calls():
+    with patch("pycodecov.api.api.ClientSession.get") as mocked:
+        mocked.return_value = mock_response(REPO)
+
+        with SyncCodecov(CODECOV_API_TOKEN) as codecov:
+            with ThreadPoolExecutor(8) as executor:
+                repos = list(
+                    executor.map(
+                        lambda name: codecov.repos.get_repo_detail(
+                            Service.GITHUB, "jazzband", name
+                        ),
+                        [f"repo-{i}" for i in range(32)],
+                    )
+                )
+
+    assert repos == [parse_repo_data(REPO)] * 32
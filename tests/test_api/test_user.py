@@ -2,6 +2,7 @@ import os
 from unittest.mock import patch
 
 import pytest
+from aiohttp import ClientSession
 
 from pycodecov import Codecov, schemas
 from pycodecov.api import User
@@ -181,3 +182,26 @@ async def test_parse_user_api():
     assert user_api.activated
     assert not user_api.is_admin
     assert user_api.email == "test@email.com"
+
+
+async def test_parse_user_api_token_session():
+    user = schemas.User(Service.GITHUB, "kiraware", None, True, False, "test@email.com")
+
+    async with ClientSession() as session:
+        user_api = parse_user_api(
+            user, token=CODECOV_API_TOKEN, session=session, owner_username="jazzband"
+        )
+
+        assert user_api._token == CODECOV_API_TOKEN
+        assert user_api._session is session
+        assert user_api.owner_username == "jazzband"
+
+
+async def test_parse_user_api_context_session():
+    user = schemas.User(Service.GITHUB, "kiraware", None, True, False, "test@email.com")
+
+    async with Codecov(CODECOV_API_TOKEN) as codecov:
+        with pytest.raises(ValueError):
+            parse_user_api(
+                user, codecov._context, session=codecov._session, owner_username="o"
+            )
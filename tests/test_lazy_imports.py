@@ -0,0 +1,58 @@
+import os
+import subprocess  # nosec B404
+import sys
+
+import pytest
+
+
+def get_loaded_modules(statement: str) -> set[str]:
+    code = f"import sys\n{statement}\nprint(*sys.modules)"
+
+    # The import path of this interpreter, which finds the package under test
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+
+    output = subprocess.run(  # nosec B603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+        env=env,
+    ).stdout
+
+    return set(output.split())
+
+
+def test_import_pycodecov_is_lazy():
+    modules = get_loaded_modules("import pycodecov")
+
+    assert "aiohttp" not in modules
+    assert "pycodecov.api" not in modules
+    assert "pycodecov.schemas" not in modules
+
+
+@pytest.mark.parametrize(
+    ("statement", "module"),
+    [
+        ("from pycodecov.enums import Service", "pycodecov.enums.language"),
+        ("from pycodecov.schemas import Owner", "pycodecov.schemas.repo"),
+        ("from pycodecov.parsers import parse_owner_data", "pycodecov.parsers.repo"),
+    ],
+)
+def test_import_attribute_is_lazy(statement, module):
+    modules = get_loaded_modules(statement)
+
+    assert "aiohttp" not in modules
+    assert module not in modules
+
+
+def test_import_unknown_attribute():
+    import pycodecov.schemas
+
+    with pytest.raises(AttributeError):
+        pycodecov.schemas.Unknown  # noqa: B018
+
+
+def test_dir_lists_lazy_attributes():
+    import pycodecov.parsers
+
+    assert "parse_repo_data" in dir(pycodecov.parsers)
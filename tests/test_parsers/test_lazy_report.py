@@ -0,0 +1,65 @@
+from pycodecov.parsers import parse_branch_detail_data, parse_commit_detail_data
+from pycodecov.schemas import LazyReport, Report
+
+TOTALS = {
+    "files": 1,
+    "lines": 10,
+    "hits": 8,
+    "misses": 1,
+    "partials": 1,
+    "coverage": 80.0,
+    "branches": 0,
+    "methods": 0,
+    "messages": 0,
+    "sessions": 1,
+    "complexity": 0.0,
+    "complexity_total": 0.0,
+    "complexity_ratio": 0,
+    "diff": 0,
+}
+
+COMMIT_DETAIL = {
+    "commitid": "0c7d2a2a",
+    "message": "fix tests",
+    "timestamp": "2024-03-25T16:38:25.747678Z",
+    "ci_passed": True,
+    "author": None,
+    "branch": "master",
+    "totals": None,
+    "state": None,
+    "parent": None,
+    "report": {
+        "totals": TOTALS,
+        "files": [{"name": f"silk/module_{i}.py", "totals": TOTALS} for i in range(3)],
+    },
+}
+
+
+def test_parse_commit_detail_data_lazy():
+    commit_detail = parse_commit_detail_data(COMMIT_DETAIL, lazy=True)
+    report = commit_detail.report
+
+    assert isinstance(report, LazyReport)
+    assert isinstance(report, Report)
+    assert not report.parsed
+    assert commit_detail.commitid == "0c7d2a2a"
+    assert not report.parsed
+
+    assert report.files[0].name == "silk/module_0.py"
+    assert report.parsed
+    assert report.files is report.files
+    assert commit_detail == parse_commit_detail_data(COMMIT_DETAIL)
+
+
+def test_parse_branch_detail_data_lazy():
+    data = {
+        "name": "master",
+        "updatestamp": "2024-03-25T16:38:25.747678Z",
+        "head_commit": COMMIT_DETAIL,
+    }
+
+    branch_detail = parse_branch_detail_data(data, lazy=True)
+
+    assert isinstance(branch_detail.head_commit.report, LazyReport)
+    assert branch_detail.head_commit.report.totals.coverage == 80.0
+    assert branch_detail == parse_branch_detail_data(data)
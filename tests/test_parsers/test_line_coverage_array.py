@@ -0,0 +1,138 @@
+from array import array
+
+import pytest
+
+from pycodecov.enums import Coverage
+from pycodecov.parsers import (
+    parse_line_coverage_array_data,
+    parse_line_data,
+    parse_report_file_data,
+)
+from pycodecov.schemas import Line, LineCoverageArray
+
+LINE_COVERAGE = [{"number": n, "coverage": n % 3} for n in range(1, 101)]
+
+
+def test_parse_line_coverage_array_data():
+    line_coverage = parse_line_coverage_array_data(LINE_COVERAGE)
+    lines = [parse_line_data(line) for line in LINE_COVERAGE]
+
+    assert isinstance(line_coverage, LineCoverageArray)
+    assert len(line_coverage) == 100
+    assert list(line_coverage) == lines
+    assert line_coverage[0] == Line(1, Coverage.MISS)
+    assert line_coverage[-1] == Line(100, Coverage.MISS)
+    assert line_coverage[10:20] == LineCoverageArray.from_lines(lines[10:20])
+    assert Line(3, Coverage.HIT) in line_coverage
+
+
+def test_line_coverage_array_counts():
+    line_coverage = parse_line_coverage_array_data(LINE_COVERAGE)
+
+    assert line_coverage.hits == 33
+    assert line_coverage.misses == 34
+    assert line_coverage.partials == 33
+
+
+def test_line_coverage_array_invalid_coverage():
+    with pytest.raises(ValueError):
+        parse_line_coverage_array_data([{"number": 1, "coverage": 3}])
+
+    with pytest.raises(ValueError):
+        LineCoverageArray(array("I", [1]), array("b", [-1]))
+
+    with pytest.raises(ValueError):
+        LineCoverageArray(array("I", [1, 2]), array("b", [0]))
+
+    line_coverage = LineCoverageArray()
+
+    with pytest.raises(ValueError):
+        line_coverage.append(Line(1, 3))
+
+    assert len(line_coverage) == 0
+
+
+def test_parse_report_file_data_compact():
+    data = {
+        "name": "string",
+        "totals": {
+            "files": 1,
+            "lines": 100,
+            "hits": 33,
+            "misses": 34,
+            "partials": 33,
+            "coverage": 33.0,
+            "branches": 0,
+            "methods": 0,
+            "messages": 0,
+            "sessions": 1,
+            "complexity": 0.0,
+            "complexity_total": 0.0,
+            "complexity_ratio": 0,
+            "diff": 0,
+        },
+        "line_coverage": LINE_COVERAGE,
+    }
+
+    report_file = parse_report_file_data(data, compact=True)
+
+    assert isinstance(report_file.line_coverage, LineCoverageArray)
+    assert list(report_file.line_coverage) == parse_report_file_data(data).line_coverage
+
+
+def test_parse_report_file_data_line_range():
+    data = {
+        "name": "string",
+        "totals": {
+            "files": 1,
+            "lines": 100,
+            "hits": 33,
+            "misses": 34,
+            "partials": 33,
+            "coverage": 33.0,
+            "branches": 0,
+            "methods": 0,
+            "messages": 0,
+            "sessions": 1,
+            "complexity": 0.0,
+            "complexity_total": 0.0,
+            "complexity_ratio": 0,
+            "diff": 0,
+        },
+        # Line 50 isn't reported, like a blank line
+        "line_coverage": [line for line in LINE_COVERAGE if line["number"] != 50],
+    }
+
+    lines = parse_report_file_data(data).line_coverage
+
+    report_file = parse_report_file_data(data, line_range=range(45, 55))
+    compact_report_file = parse_report_file_data(
+        data, compact=True, line_range=range(45, 55)
+    )
+
+    assert [line.number for line in report_file.line_coverage] == [
+        45,
+        46,
+        47,
+        48,
+        49,
+        51,
+        52,
+        53,
+        54,
+    ]
+    assert report_file.line_coverage == [
+        line for line in lines if 45 <= line.number < 55
+    ]
+    assert list(compact_report_file.line_coverage) == report_file.line_coverage
+    assert parse_report_file_data(data, line_range=range(200, 300)).line_coverage == []
+    assert parse_report_file_data(data, line_range=range(0, 1000)).line_coverage == (
+        lines
+    )
+
+
+def test_parse_report_file_data_line_range_step():
+    data = {"name": "string", "totals": None, "line_coverage": LINE_COVERAGE}
+
+    with pytest.raises(ValueError):
+        parse_report_file_data(data, line_range=range(1, 50, 2))
@@ -0,0 +1,97 @@
+from dataclasses import fields
+
+import pytest
+
+from pycodecov.parsers import Projection, parse_commit_detail_data, parse_repo_data
+from pycodecov.schemas import CommitDetail, Repo
+
+REPO = {
+    "name": "django-silk",
+    "private": False,
+    "updatestamp": "2024-03-25T16:38:25.747678Z",
+    "author": {"service": "github", "username": "jazzband", "name": None},
+    "language": "python",
+    "branch": "master",
+    "active": True,
+    "activated": True,
+    "totals": {
+        "files": 103,
+        "lines": 4425,
+        "hits": 3812,
+        "misses": 613,
+        "partials": 0,
+        "coverage": 86.14,
+        "branches": 0,
+        "methods": 0,
+        "sessions": 1,
+        "complexity": 0.0,
+        "complexity_total": 0.0,
+        "complexity_ratio": 0,
+    },
+}
+
+
+def test_projection():
+    repo = Projection(Repo, ("name", "totals.coverage", "author.username"))(REPO)
+
+    assert repo.name == "django-silk"
+    assert repo.updatestamp is None
+    assert repo.language is None
+    assert repo.author.username == "jazzband"
+    assert repo.author.service is None
+    assert repo.totals.coverage == 86.14
+    assert repo.totals.files is None
+
+
+def test_projection_every_field():
+    projection = Projection(Repo, [field.name for field in fields(Repo)])
+
+    assert projection(REPO) == parse_repo_data(REPO)
+    assert projection({**REPO, "totals": None}) == parse_repo_data(
+        {**REPO, "totals": None}
+    )
+
+
+def test_projection_nested_field_with_parent():
+    projection = Projection(Repo, ("totals", "totals.coverage"))
+
+    assert projection.fields == ("totals", "totals.coverage")
+    assert projection(REPO).totals == parse_repo_data(REPO).totals
+
+
+def test_projection_commit_detail():
+    data = {
+        "commitid": "0c7d2a2a",
+        "message": "fix tests",
+        "timestamp": "2024-03-25T16:38:25.747678Z",
+        "ci_passed": True,
+        "author": None,
+        "branch": "master",
+        "totals": None,
+        "state": "complete",
+        "parent": None,
+        "report": {"totals": {}, "files": [{"name": "silk/models.py", "totals": {}}]},
+    }
+
+    projection = Projection(CommitDetail, ("commitid", "state", "report.files.name"))
+    commit_detail = projection(data)
+
+    assert commit_detail.commitid == "0c7d2a2a"
+    assert commit_detail.state == parse_commit_detail_data(data).state
+    assert commit_detail.timestamp is None
+    assert commit_detail.report.totals is None
+    assert commit_detail.report.files[0].name == "silk/models.py"
+    assert commit_detail.report.files[0].totals is None
+
+
+def test_projection_unknown_field():
+    with pytest.raises(ValueError, match="Repo has no field nam"):
+        Projection(Repo, ("nam",))
+
+    with pytest.raises(ValueError, match="str has no fields"):
+        Projection(Repo, ("name.first",))
+
+
+def test_projection_equality():
+    assert Projection(Repo, ["name", "branch"]) == Projection(Repo, ("branch", "name"))
+    assert hash(Projection(Repo, ["name"])) == hash(Projection(Repo, ("name",)))
@@ -0,0 +1,106 @@
+import json
+
+import pytest
+
+from pycodecov.parsers import (
+    SchemaDecoder,
+    parse_commit_detail_data,
+    parse_paginated_list_data,
+    parse_repo_data,
+    parse_report_file_data,
+)
+from pycodecov.schemas import CommitDetail, Repo, ReportFile
+
+pytest.importorskip("msgspec")
+
+TOTALS = {
+    "files": 1,
+    "lines": 10,
+    "hits": 8,
+    "misses": 1,
+    "partials": 1,
+    "coverage": 80.0,
+    "branches": 0,
+    "methods": 0,
+    "messages": 0,
+    "sessions": 1,
+    "complexity": 0.0,
+    "complexity_total": 0.0,
+    "complexity_ratio": 0,
+    "diff": [1, 2, 1, 0, 0, "50.00000", 0, 0, 0, 0, 0, 0, 0],
+}
+
+REPO = {
+    "name": "django-silk",
+    "private": False,
+    "updatestamp": "2024-03-25T16:38:25.747678Z",
+    "author": {"service": "github", "username": "jazzband", "name": None},
+    "language": "python",
+    "branch": "master",
+    "active": True,
+    "activated": True,
+    "totals": None,
+}
+
+COMMIT_DETAIL = {
+    "commitid": "0c7d2a2a",
+    "message": "fix tests",
+    "timestamp": "2024-03-25T16:38:25.747678Z",
+    "ci_passed": True,
+    "author": {"service": "github", "username": "jazzband", "name": "Jazzband"},
+    "branch": "master",
+    "totals": {k: v for k, v in TOTALS.items() if k not in ("messages", "diff")},
+    "state": "complete",
+    "parent": "9d6f3e1b",
+    "report": {
+        "totals": TOTALS,
+        "files": [
+            {"name": f"silk/module_{i}.py", "totals": {**TOTALS, "diff": 0}}
+            for i in range(3)
+        ],
+    },
+}
+
+
+def test_schema_decoder_commit_detail():
+    schema_decoder = SchemaDecoder()
+
+    commit_detail = schema_decoder.decode(json.dumps(COMMIT_DETAIL), CommitDetail)
+
+    assert commit_detail == parse_commit_detail_data(COMMIT_DETAIL)
+
+
+def test_schema_decoder_report_file():
+    data = {
+        "name": "silk/models.py",
+        "totals": TOTALS,
+        "line_coverage": [{"number": n, "coverage": n % 3} for n in range(1, 20)],
+    }
+
+    report_file = SchemaDecoder().decode(json.dumps(data).encode(), ReportFile)
+
+    assert report_file == parse_report_file_data(data)
+
+
+def test_schema_decoder_parser_decoder():
+    schema_decoder = SchemaDecoder()
+
+    decoder = schema_decoder.get_parser_decoder(parse_repo_data)
+
+    assert decoder is schema_decoder.get_parser_decoder(parse_repo_data)
+    assert decoder(json.dumps(REPO)) == parse_repo_data(REPO)
+
+
+def test_schema_decoder_paginated_list():
+    data = {
+        "count": 2,
+        "next": "http://api.codecov.io/api/v2/github/jazzband/repos/?page=2",
+        "previous": None,
+        "results": [REPO, {**REPO, "name": "django-debug-toolbar"}],
+        "total_pages": 2,
+    }
+
+    paginated_list = SchemaDecoder().decode_paginated_list(json.dumps(data), Repo)
+
+    assert paginated_list == parse_paginated_list_data(data, parse_repo_data)
+    assert paginated_list.next == "/api/v2/github/jazzband/repos/?page=2"
@@ -0,0 +1,96 @@
+import json
+
+from pycodecov.parsers import (
+    Projection,
+    StringTable,
+    parse_commit_coverage_report_data,
+    parse_commit_detail_data,
+    parse_report_data,
+)
+from pycodecov.schemas import Repo
+
+TOTALS = {
+    "files": 1,
+    "lines": 10,
+    "hits": 8,
+    "misses": 1,
+    "partials": 1,
+    "coverage": 80.0,
+    "branches": 0,
+    "methods": 0,
+    "messages": 0,
+    "sessions": 1,
+    "complexity": 0.0,
+    "complexity_total": 0.0,
+    "complexity_ratio": 0,
+    "diff": [1, 2, 1, 0, 0, "50.00000", 0, 0, 0, 0, 0, 0, 0],
+}
+
+COMMIT_COVERAGE_REPORT = {
+    "totals": TOTALS,
+    "commit_file_url": "https://codecov.io/gh/jazzband/django-silk/commit/sha/tree",
+    "files": [
+        {
+            "name": "silk/models.py",
+            "totals": TOTALS,
+            "line_coverage": [{"number": 1, "coverage": 0}],
+        },
+    ],
+}
+
+
+def test_string_table_report_file_names():
+    strings = StringTable()
+    first, second = json.loads(json.dumps([COMMIT_COVERAGE_REPORT] * 2))
+
+    first_report = parse_commit_coverage_report_data(first, strings=strings)
+    second_report = parse_commit_coverage_report_data(
+        second, compact=True, strings=strings
+    )
+
+    assert first_report.files[0].name is second_report.files[0].name
+    assert first_report == parse_commit_coverage_report_data(first)
+    assert len(strings) == 1
+
+
+def test_string_table_lazy_report():
+    strings = StringTable()
+    data = json.loads(
+        json.dumps(
+            {
+                "commitid": "a" * 40,
+                "message": "message",
+                "timestamp": "2024-03-25T16:38:25.747678Z",
+                "ci_passed": True,
+                "author": None,
+                "branch": "master",
+                "totals": None,
+                "state": None,
+                "parent": "b" * 40,
+                "report": COMMIT_COVERAGE_REPORT,
+            }
+        )
+    )
+
+    commit = parse_commit_detail_data(data, strings=strings)
+    lazy_commit = parse_commit_detail_data(data, lazy=True, strings=strings)
+
+    assert lazy_commit.branch is commit.branch
+    assert lazy_commit.report.files[0].name is commit.report.files[0].name
+
+
+def test_string_table_bind():
+    strings = StringTable()
+    projection = Projection(Repo, ("name",))
+
+    assert strings.bind(parse_report_data) is strings.bind(parse_report_data)
+    assert strings.bind(projection) is projection
+
+
+def test_string_table_clear():
+    strings = StringTable()
+    strings("master")
+
+    strings.clear()
+
+    assert len(strings) == 0
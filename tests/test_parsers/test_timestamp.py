@@ -0,0 +1,30 @@
+import time
+from datetime import datetime, timezone
+
+from pycodecov.parsers import (
+    parse_timestamp_data,
+)
+
+TIMESTAMP = "2024-03-25T16:38:25.747678Z"
+
+
+def test_parse_timestamp_data():
+    timestamp = parse_timestamp_data(TIMESTAMP)
+
+    assert timestamp == datetime(2024, 3, 25, 16, 38, 25, 747678, timezone.utc)
+    assert parse_timestamp_data(TIMESTAMP) is timestamp
+
+
+def test_parse_timestamp_data_epoch():
+    assert parse_timestamp_data(TIMESTAMP, epoch=True) == 1711384705
+
+
+def test_parse_timestamp_data_epoch_naive(monkeypatch):
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+
+    try:
+        assert parse_timestamp_data("2024-03-25T16:38:25", epoch=True) == 1711384705
+    finally:
+        monkeypatch.undo()
+        time.tzset()
@@ -0,0 +1,80 @@
+from pycodecov.enums import Coverage
+from pycodecov.parsers import parse_line_coverage_array_data
+from pycodecov.schemas import (
+    CoverageBitmap,
+    Line,
+    LineComparison,
+    LineCoverageComparison,
+    LineNumberComparison,
+    LineSet,
+)
+
+
+def test_line_set():
+    line_set = LineSet.from_numbers([0, 7, 8, 9, 1000])
+
+    assert list(line_set) == [0, 7, 8, 9, 1000]
+    assert len(line_set) == 5
+    assert 1000 in line_set
+    assert 10 not in line_set
+    assert -1 not in line_set
+    assert not LineSet.from_numbers([])
+    assert LineSet.from_numbers([3, 1]) == LineSet.from_numbers([1, 3, 3])
+
+
+def test_line_set_algebra():
+    a = LineSet.from_numbers(range(1, 11))
+    b = LineSet.from_numbers(range(6, 16))
+
+    assert list(a | b) == list(range(1, 16))
+    assert list(a & b) == list(range(6, 11))
+    assert list(a - b) == list(range(1, 6))
+    assert list(a ^ b) == [*range(1, 6), *range(11, 16)]
+
+
+def test_coverage_bitmap_from_lines():
+    lines = [Line(n, Coverage(n % 3)) for n in range(1, 101)]
+
+    coverage_bitmap = CoverageBitmap.from_lines(lines)
+
+    assert len(coverage_bitmap) == 100
+    assert len(coverage_bitmap.hits) == 33
+    assert len(coverage_bitmap.misses) == 34
+    assert len(coverage_bitmap.partials) == 33
+    assert list(coverage_bitmap.partials)[:3] == [2, 5, 8]
+    assert coverage_bitmap == CoverageBitmap.from_lines(
+        parse_line_coverage_array_data(
+            [{"number": n, "coverage": n % 3} for n in range(1, 101)]
+        )
+    )
+
+
+def test_coverage_bitmap_from_line_comparisons():
+    lines = [
+        LineComparison(
+            "a = 1",
+            LineNumberComparison(1, 1),
+            LineCoverageComparison(Coverage.HIT, Coverage.MISS),
+            True,
+            False,
+            False,
+            1,
+        ),
+        LineComparison(
+            "b = 2",
+            LineNumberComparison(None, 2),
+            LineCoverageComparison(None, Coverage.HIT),
+            True,
+            True,
+            False,
+            1,
+        ),
+    ]
+
+    base = CoverageBitmap.from_line_comparisons(lines, head=False)
+    head = CoverageBitmap.from_line_comparisons(lines)
+
+    assert list(base.hits & head.misses) == [1]
+    assert list(head.hits - base.hits) == [2]
+    assert len(base) == 1
+    assert len(head | base) == 3
@@ -0,0 +1,105 @@
+import random
+
+import pytest
+
+from pycodecov.parsers import parse_coverage_trend_array_data, parse_timestamp_data
+from pycodecov.schemas import CoverageTrendArray, EpochCoverageTrend
+
+
+def make_trend(count, seed=0):
+    rng = random.Random(seed)
+    trends = []
+
+    for i in range(count):
+        avg = rng.uniform(50, 90)
+        trends.append(
+            EpochCoverageTrend(i * 3600, avg - rng.random(), avg + rng.random(), avg)
+        )
+
+    return CoverageTrendArray.from_trends(trends)
+
+
+def test_coverage_trend_array_sequence():
+    trend = make_trend(10)
+
+    assert len(trend) == 10
+    assert list(trend)[3] == trend[3]
+    assert list(trend[2:5]) == list(trend)[2:5]
+
+
+def test_coverage_trend_array_downsample():
+    trend = make_trend(100)
+
+    downsampled = trend.downsample(86400)
+    points = list(trend)
+
+    assert list(downsampled.timestamps) == [0, 86400, 172800, 259200, 345600]
+
+    for i, point in enumerate(downsampled):
+        bucket = points[i * 24 : (i + 1) * 24]
+
+        assert point.min == min(p.min for p in bucket)
+        assert point.max == max(p.max for p in bucket)
+        assert point.avg == pytest.approx(sum(p.avg for p in bucket) / len(bucket))
+
+
+def test_coverage_trend_array_rolling():
+    trend = make_trend(50)
+
+    rolled = trend.rolling(7)
+    points = list(trend)
+
+    assert list(rolled.timestamps) == list(trend.timestamps)
+
+    for i, point in enumerate(rolled):
+        window = points[max(i - 6, 0) : i + 1]
+
+        assert point.min == min(p.min for p in window)
+        assert point.max == max(p.max for p in window)
+        assert point.avg == pytest.approx(sum(p.avg for p in window) / len(window))
+
+
+def test_coverage_trend_array_merge():
+    trends = [make_trend(24, seed) for seed in range(3)]
+
+    merged = CoverageTrendArray.merge(iter(trends), seconds=7200)
+
+    assert len(merged) == 12
+    assert merged.mins[0] == min(t.mins[i] for t in trends for i in (0, 1))
+    assert merged.maxs[0] == max(t.maxs[i] for t in trends for i in (0, 1))
+    assert merged.avgs[0] == pytest.approx(
+        sum(t.avgs[i] for t in trends for i in (0, 1)) / 6
+    )
+
+
+def test_coverage_trend_array_invalid():
+    with pytest.raises(ValueError):
+        make_trend(1).downsample(0)
+
+    with pytest.raises(ValueError):
+        make_trend(1).rolling(0)
+
+
+def test_parse_coverage_trend_array_data():
+    data = [
+        {
+            "timestamp": f"2024-03-{day:02}T00:00:00Z",
+            "min": day - 1.0,
+            "max": day + 1.0,
+            "avg": float(day),
+        }
+        for day in range(1, 11)
+    ]
+
+    coverage_trend = parse_coverage_trend_array_data(data[:4])
+    coverage_trend.extend(parse_coverage_trend_array_data(data[4:]))
+
+    assert coverage_trend == CoverageTrendArray.from_trends(
+        EpochCoverageTrend(
+            parse_timestamp_data(point["timestamp"], epoch=True),
+            point["min"],
+            point["max"],
+            point["avg"],
+        )
+        for point in data
+    )